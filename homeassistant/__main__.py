@@ -80,6 +80,11 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--trace-startup",
+        action="store_true",
+        help="Trace the setup of integrations until Home Assistant has started",
+    )
     parser.add_argument(
         "--skip-pip",
         action="store_true",
@@ -309,6 +314,7 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        trace_startup=args.trace_startup,
     )
 
     exit_code = runner.run(runtime_conf)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import time
 from typing import Any, Dict, Mapping, Optional, Tuple, cast
 
 import jwt
@@ -25,6 +26,9 @@ _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
 
+# Maximum number of validated access tokens kept in memory
+ACCESS_TOKEN_CACHE_SIZE = 1024
+
 
 class InvalidAuthError(Exception):
     """Raised when a authentication error occurs."""
@@ -155,6 +159,10 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Validated access token -> (expiration timestamp, refresh token)
+        self._access_token_cache: OrderedDict[
+            str, tuple[float, models.RefreshToken]
+        ] = OrderedDict()
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -287,6 +295,7 @@ class AuthManager:
         if tasks:
             await asyncio.wait(tasks)
 
+        self._async_invalidate_access_tokens(set(user.refresh_tokens))
         await self._store.async_remove_user(user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
@@ -321,6 +330,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_invalidate_access_tokens(set(user.refresh_tokens))
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -447,6 +457,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens({refresh_token.id})
 
     @callback
     def async_create_access_token(
@@ -506,6 +517,19 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+        if cached is not None:
+            expire_at, cached_token = cached
+            user = cached_token.user
+            if (
+                expire_at > time.time()
+                and user.is_active
+                and cached_token.id in user.refresh_tokens
+            ):
+                self._access_token_cache.move_to_end(token)
+                return cached_token
+            del self._access_token_cache[token]
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -523,15 +547,30 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        expire_at = claims.get("exp")
+        if expire_at is not None and expire_at > time.time():
+            self._access_token_cache[token] = (expire_at, refresh_token)
+            if len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+                self._access_token_cache.popitem(last=False)
+
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(self, refresh_token_ids: set[str]) -> None:
+        """Drop cached access tokens issued by the given refresh tokens."""
+        for token, (_, refresh_token) in list(self._access_token_cache.items()):
+            if refresh_token.id in refresh_token_ids:
+                del self._access_token_cache[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -19,7 +19,13 @@ from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers import (
+    area_registry,
+    config_per_platform,
+    device_registry,
+    entity_registry,
+    startup_trace,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
@@ -87,6 +93,9 @@ async def async_setup_hass(
     hass = core.HomeAssistant()
     hass.config.config_dir = runtime_config.config_dir
 
+    if runtime_config.trace_startup:
+        startup_trace.async_enable(hass)
+
     async_enable_logging(
         hass,
         runtime_config.verbose,
@@ -151,6 +160,8 @@ async def async_setup_hass(
         old_config = hass.config
 
         hass = core.HomeAssistant()
+        if runtime_config.trace_startup:
+            startup_trace.async_enable(hass)
         hass.config.skip_pip = old_config.skip_pip
         hass.config.internal_url = old_config.internal_url
         hass.config.external_url = old_config.external_url
@@ -438,6 +449,35 @@ async def async_setup_multi_components(
         )
 
 
+async def _async_prewarm_imports(
+    hass: core.HomeAssistant,
+    config: dict[str, Any],
+    integrations: dict[str, loader.Integration],
+) -> None:
+    """Import the integrations and platforms that will be set up ahead of time."""
+    modules = {integration.pkg_path for integration in integrations.values()}
+
+    # The entity domains of the platforms configured in YAML per integration
+    platforms: dict[str, set[str]] = {}
+    for domain in integrations:
+        for platform, _ in config_per_platform(config, domain):
+            if isinstance(platform, str):
+                platforms.setdefault(platform, set()).add(domain)
+
+    for int_or_exc in await gather_with_concurrency(
+        loader.MAX_LOAD_CONCURRENTLY,
+        *(loader.async_get_integration(hass, platform) for platform in platforms),
+        return_exceptions=True,
+    ):
+        if isinstance(int_or_exc, loader.Integration):
+            modules.update(
+                f"{int_or_exc.pkg_path}.{domain}"
+                for domain in platforms[int_or_exc.domain]
+            )
+
+    await loader.async_prewarm_imports(hass, modules)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -490,6 +530,9 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import modules in the background while logging and debuggers are set up
+    hass.async_create_task(_async_prewarm_imports(hass, config, integration_cache))
+
     logging_domains = domains_to_setup & LOGGING_INTEGRATIONS
 
     # Load logging as soon as possible
@@ -11,14 +11,17 @@ import voluptuous as vol
 
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
-from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http import MAX_CLIENT_SIZE, HomeAssistantView
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST,
     HTTP_CREATED,
+    HTTP_INTERNAL_SERVER_ERROR,
     HTTP_NOT_FOUND,
     HTTP_OK,
+    HTTP_REQUEST_ENTITY_TOO_LARGE,
+    HTTP_UNAUTHORIZED,
     MATCH_ALL,
     URL_API,
     URL_API_COMPONENTS,
@@ -33,7 +36,12 @@ from homeassistant.const import (
     __version__,
 )
 import homeassistant.core as ha
-from homeassistant.exceptions import ServiceNotFound, TemplateError, Unauthorized
+from homeassistant.exceptions import (
+    HomeAssistantError,
+    ServiceNotFound,
+    TemplateError,
+    Unauthorized,
+)
 from homeassistant.helpers import template
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.network import NoURLAvailableError, get_url
@@ -53,7 +61,14 @@ ATTR_VERSION = "version"
 
 DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
+STREAM_PING_MESSAGE = f"data: {STREAM_PING_PAYLOAD}\n\n".encode("UTF-8")
 STREAM_PING_INTERVAL = 50  # seconds
+STREAM_QUEUE_SIZE = 1024  # Events a client can fall behind before it is disconnected
+
+DATA_EVENT_STREAM = "api_event_stream"
+
+CONTENT_TYPE_NDJSON = "application/x-ndjson"
+MAX_BATCH_ITEMS = 1000
 
 
 async def async_setup(hass, config):
@@ -68,6 +83,8 @@ async def async_setup(hass, config):
     hass.http.register_view(APIEventView)
     hass.http.register_view(APIServicesView)
     hass.http.register_view(APIDomainServicesView)
+    hass.http.register_view(APIStatesBatchView)
+    hass.http.register_view(APIServicesBatchView)
     hass.http.register_view(APIComponentsView)
     hass.http.register_view(APITemplateView)
 
@@ -89,6 +106,129 @@ class APIStatusView(HomeAssistantView):
         return self.json_message("API running.")
 
 
+class EventStreamClient:
+    """A client of the event stream."""
+
+    def __init__(self, event_types):
+        """Initialize the client, event_types is None to receive all events."""
+        self.event_types = event_types
+        self.queue = asyncio.Queue(STREAM_QUEUE_SIZE)
+        self.closed = False
+
+    @ha.callback
+    def async_put(self, payload):
+        """Queue a payload, return False if the client is not keeping up."""
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    @ha.callback
+    def async_close(self):
+        """Close the client, pending payloads are dropped."""
+        if self.closed:
+            return
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class EventStreamBroadcaster:
+    """Forward events to the clients of the event stream.
+
+    Each event is serialized once and the payload is shared by all clients.
+    A listener is registered per event type that clients are interested in,
+    only clients without a restriction listen to all events. Clients that
+    fall STREAM_QUEUE_SIZE events behind are disconnected.
+    """
+
+    def __init__(self, hass):
+        """Initialize the broadcaster."""
+        self.hass = hass
+        self._clients = {}
+        self._unsubs = {}
+        self._last_event = None
+        self._last_payload = None
+        # Metrics
+        self.events_serialized = 0
+        self.events_queued = 0
+        self.clients_disconnected = 0
+
+    @ha.callback
+    def async_add_client(self, client):
+        """Start forwarding events to a client."""
+        for event_type in self._event_types(client):
+            clients = self._clients.get(event_type)
+            if clients is None:
+                clients = self._clients[event_type] = set()
+                self._unsubs[event_type] = self._async_listen(event_type, clients)
+            clients.add(client)
+
+    @ha.callback
+    def async_remove_client(self, client):
+        """Stop forwarding events to a client."""
+        for event_type in self._event_types(client):
+            if not (clients := self._clients.get(event_type)):
+                continue
+            clients.discard(client)
+            if not clients:
+                del self._clients[event_type]
+                self._unsubs.pop(event_type)()
+
+    @staticmethod
+    def _event_types(client):
+        """Return the event types a client listens to."""
+        if client.event_types is None:
+            return (MATCH_ALL,)
+        return client.event_types
+
+    @ha.callback
+    def _async_listen(self, event_type, clients):
+        """Listen for events of a type and forward them to clients."""
+
+        @ha.callback
+        def forward_event(event):
+            """Forward an event to the clients."""
+            if event.event_type == EVENT_HOMEASSISTANT_STOP:
+                for client in list(clients):
+                    client.async_close()
+                return
+
+            # Listeners of other event types receive the same event object
+            if event is not self._last_event:
+                self._last_event = event
+                self._last_payload = (
+                    f"data: {json.dumps(event, cls=JSONEncoder)}\n\n".encode("UTF-8")
+                )
+                self.events_serialized += 1
+
+            for client in list(clients):
+                if client.async_put(self._last_payload):
+                    self.events_queued += 1
+                    continue
+                _LOGGER.warning(
+                    "STREAM %s fell %s events behind, disconnecting",
+                    id(client),
+                    STREAM_QUEUE_SIZE,
+                )
+                self.clients_disconnected += 1
+                client.async_close()
+                self.async_remove_client(client)
+
+        return self.hass.bus.async_listen(event_type, forward_event)
+
+
+@ha.callback
+def async_get_event_stream_broadcaster(hass):
+    """Return the event stream broadcaster."""
+    broadcaster = hass.data.get(DATA_EVENT_STREAM)
+    if broadcaster is None:
+        broadcaster = hass.data[DATA_EVENT_STREAM] = EventStreamBroadcaster(hass)
+    return broadcaster
+
+
 class APIEventStream(HomeAssistantView):
     """View to handle EventStream requests."""
 
@@ -100,62 +240,44 @@ class APIEventStream(HomeAssistantView):
         if not request["hass_user"].is_admin:
             raise Unauthorized()
         hass = request.app["hass"]
-        stop_obj = object()
-        to_write = asyncio.Queue()
 
+        event_types = None
         restrict = request.query.get("restrict")
         if restrict:
-            restrict = restrict.split(",") + [EVENT_HOMEASSISTANT_STOP]
-
-        async def forward_events(event):
-            """Forward events to the open request."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
-
-            if restrict and event.event_type not in restrict:
-                return
-
-            _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
-
-            if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
-            else:
-                data = json.dumps(event, cls=JSONEncoder)
-
-            await to_write.put(data)
+            event_types = (set(restrict.split(",")) - {EVENT_TIME_CHANGED}) | {
+                EVENT_HOMEASSISTANT_STOP
+            }
+        client = EventStreamClient(event_types)
+        broadcaster = async_get_event_stream_broadcaster(hass)
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         await response.prepare(request)
 
-        unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        broadcaster.async_add_client(client)
 
         try:
-            _LOGGER.debug("STREAM %s ATTACHED", id(stop_obj))
+            _LOGGER.debug("STREAM %s ATTACHED", id(client))
 
             # Fire off one message so browsers fire open event right away
-            await to_write.put(STREAM_PING_PAYLOAD)
+            payload = STREAM_PING_MESSAGE
+
+            while payload is not None:
+                _LOGGER.debug("STREAM %s WRITING %s", id(client), payload.strip())
+                await response.write(payload)
 
-            while True:
                 try:
                     with async_timeout.timeout(STREAM_PING_INTERVAL):
-                        payload = await to_write.get()
-
-                    if payload is stop_obj:
-                        break
-
-                    msg = f"data: {payload}\n\n"
-                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
-                    await response.write(msg.encode("UTF-8"))
+                        payload = await client.queue.get()
                 except asyncio.TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+                    payload = STREAM_PING_MESSAGE
 
         except asyncio.CancelledError:
-            _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
+            _LOGGER.debug("STREAM %s ABORT", id(client))
 
         finally:
-            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
-            unsub_stream()
+            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(client))
+            broadcaster.async_remove_client(client)
 
         return response
 
@@ -388,6 +510,209 @@ class APIDomainServicesView(HomeAssistantView):
         return self.json(changed_states)
 
 
+class APIStatesBatchView(HomeAssistantView):
+    """View to update the state of many entities at once."""
+
+    url = "/api/batch/states"
+    name = "api:batch-states"
+
+    async def post(self, request):
+        """Update the state of entities.
+
+        Returns a result for each item of the batch.
+        """
+        if not request["hass_user"].is_admin:
+            raise Unauthorized()
+        hass = request.app["hass"]
+        items = await _async_read_batch(request)
+        if items is None:
+            return self.json_message(
+                "Data should be a JSON array or NDJSON.", HTTP_BAD_REQUEST
+            )
+        if len(items) > MAX_BATCH_ITEMS:
+            return self.json_message(
+                f"A batch can have at most {MAX_BATCH_ITEMS} items.",
+                HTTP_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        context = self.context(request)
+        # All states are written without yielding to the event loop
+        return self.json([_async_set_state(hass, item, context) for item in items])
+
+
+class APIServicesBatchView(HomeAssistantView):
+    """View to call many services at once."""
+
+    url = "/api/batch/services"
+    name = "api:batch-services"
+
+    async def post(self, request):
+        """Call services.
+
+        The services are called concurrently. Returns a result with the
+        changed states for each item of the batch.
+        """
+        hass: ha.HomeAssistant = request.app["hass"]
+        items = await _async_read_batch(request)
+        if items is None:
+            return self.json_message(
+                "Data should be a JSON array or NDJSON.", HTTP_BAD_REQUEST
+            )
+        if len(items) > MAX_BATCH_ITEMS:
+            return self.json_message(
+                f"A batch can have at most {MAX_BATCH_ITEMS} items.",
+                HTTP_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        user_id = request["hass_user"].id
+        contexts = [ha.Context(user_id=user_id) for _ in items]
+        results = await asyncio.gather(
+            *(
+                _async_call_service(hass, item, context)
+                for item, context in zip(items, contexts)
+            )
+        )
+
+        changed_states = {}
+        for state in hass.states.async_all():
+            changed_states.setdefault(state.context.id, []).append(state)
+
+        for result, context in zip(results, contexts):
+            if result["status"] == HTTP_OK:
+                result["changed_states"] = changed_states.get(context.id, [])
+
+        return self.json(results)
+
+
+async def _async_read_batch(request):
+    """Read the items of a batch request.
+
+    Items are sent as a JSON array, or as newline delimited JSON that is parsed
+    while it is received. Returns None if the request is invalid, which
+    includes lines too long to be read. Reading newline delimited JSON stops
+    after one item more than a batch can have.
+    """
+    if request.content_type != CONTENT_TYPE_NDJSON:
+        try:
+            items = await request.json()
+        except ValueError:
+            return None
+        return items if isinstance(items, list) else None
+
+    items = []
+    size = 0
+    try:
+        async for line in request.content:
+            # The body is streamed, so the maximum request size is checked here
+            size += len(line)
+            if size > MAX_CLIENT_SIZE:
+                raise web.HTTPRequestEntityTooLarge(
+                    max_size=MAX_CLIENT_SIZE, actual_size=size
+                )
+            if not (line := line.strip()):
+                continue
+            if len(items) > MAX_BATCH_ITEMS:
+                break
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                # Reported as an invalid item
+                items.append(None)
+    except ValueError:
+        # Raised by the stream reader for lines longer than its buffer
+        return None
+    return items
+
+
+@ha.callback
+def _async_set_state(hass, item, context):
+    """Update the state of an entity for a batch request."""
+    if not isinstance(item, dict):
+        return {"status": HTTP_BAD_REQUEST, "message": "Invalid JSON specified."}
+
+    entity_id = item.get("entity_id")
+    result = {"entity_id": entity_id}
+
+    if not isinstance(entity_id, str) or not ha.valid_entity_id(entity_id):
+        result.update(status=HTTP_BAD_REQUEST, message="Invalid entity ID specified.")
+        return result
+
+    if (new_state := item.get("state")) is None:
+        result.update(status=HTTP_BAD_REQUEST, message="No state specified.")
+        return result
+
+    attributes = item.get("attributes")
+    if attributes is not None and not isinstance(attributes, dict):
+        result.update(
+            status=HTTP_BAD_REQUEST, message="Attributes should be a JSON object."
+        )
+        return result
+
+    force_update = item.get("force_update", False)
+    if not isinstance(force_update, bool):
+        result.update(
+            status=HTTP_BAD_REQUEST, message="Force update should be a boolean."
+        )
+        return result
+
+    is_new_state = hass.states.get(entity_id) is None
+
+    try:
+        hass.states.async_set(
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+        )
+    except HomeAssistantError as ex:
+        result.update(status=HTTP_BAD_REQUEST, message=str(ex))
+        return result
+
+    result["status"] = HTTP_CREATED if is_new_state else HTTP_OK
+    return result
+
+
+async def _async_call_service(hass, item, context):
+    """Call a service for a batch request."""
+    if not isinstance(item, dict):
+        return {"status": HTTP_BAD_REQUEST, "message": "Invalid JSON specified."}
+
+    domain = item.get("domain")
+    service = item.get("service")
+    service_data = item.get("service_data")
+    result = {"domain": domain, "service": service}
+
+    if not isinstance(domain, str) or not isinstance(service, str):
+        result.update(status=HTTP_BAD_REQUEST, message="No service specified.")
+        return result
+
+    if service_data is not None and not isinstance(service_data, dict):
+        result.update(
+            status=HTTP_BAD_REQUEST, message="Service data should be a JSON object."
+        )
+        return result
+
+    try:
+        await hass.services.async_call(
+            domain,
+            service,
+            service_data,
+            blocking=True,
+            context=context,
+        )
+    except Unauthorized:
+        result.update(status=HTTP_UNAUTHORIZED, message="Unauthorized.")
+    except (vol.Invalid, ServiceNotFound) as ex:
+        result.update(status=HTTP_BAD_REQUEST, message=str(ex))
+    except HomeAssistantError as ex:
+        result.update(status=HTTP_INTERNAL_SERVER_ERROR, message=str(ex))
+    else:
+        result["status"] = HTTP_OK
+
+    return result
+
+
 class APIComponentsView(HomeAssistantView):
     """View to handle Components requests."""
 
@@ -45,6 +45,13 @@ from homeassistant.helpers import condition, extract_domain_configs, template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import (
+    REFERENCE_AREA,
+    REFERENCE_DEVICE,
+    REFERENCE_ENTITY,
+    ReferenceIndex,
+    ReferencesType,
+)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -89,6 +96,8 @@ from .trace import trace_automation
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
+DATA_REFERENCE_INDEX = "automation_reference_index"
+
 
 CONF_SKIP_CONDITION = "skip_condition"
 CONF_STOP_ACTIONS = "stop_actions"
@@ -122,13 +131,9 @@ def automations_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if entity_id in automation_entity.referenced_entities
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing(
+        REFERENCE_ENTITY, entity_id
+    )
 
 
 @callback
@@ -153,13 +158,9 @@ def automations_with_device(hass: HomeAssistant, device_id: str) -> list[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if device_id in automation_entity.referenced_devices
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing(
+        REFERENCE_DEVICE, device_id
+    )
 
 
 @callback
@@ -184,13 +185,7 @@ def automations_with_area(hass: HomeAssistant, area_id: str) -> list[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if area_id in automation_entity.referenced_areas
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing(REFERENCE_AREA, area_id)
 
 
 @callback
@@ -209,8 +204,21 @@ def areas_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
     return list(automation_entity.referenced_areas)
 
 
+@callback
+def _async_automation_references(
+    automation_entity: AutomationEntity,
+) -> ReferencesType:
+    """Return what an automation references."""
+    return {
+        REFERENCE_ENTITY: automation_entity.referenced_entities,
+        REFERENCE_DEVICE: automation_entity.referenced_devices,
+        REFERENCE_AREA: automation_entity.referenced_areas,
+    }
+
+
 async def async_setup(hass, config):
     """Set up all automations."""
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex(_async_automation_references)
     # Local import to avoid circular import
     hass.data[DOMAIN] = component = EntityComponent(LOGGER, DOMAIN, hass)
 
@@ -370,6 +378,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
     async def async_added_to_hass(self) -> None:
         """Startup with initial state or previous state."""
         await super().async_added_to_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(self.entity_id, self)
 
         self._logger = logging.getLogger(
             f"{__name__}.{split_entity_id(self.entity_id)[1]}"
@@ -515,6 +524,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
     async def async_will_remove_from_hass(self):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self.entity_id)
         await self.async_disable()
 
     async def async_enable(self):
@@ -141,6 +141,22 @@ async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) ->
     return await _async_stream_endpoint_url(hass, camera, fmt)
 
 
+async def _async_get_camera_image(
+    camera: Camera, width: int | None, height: int | None
+) -> bytes | None:
+    """Fetch a snapshot image from the camera itself."""
+    # Calling inspect will be removed in 2022.1 after all
+    # custom components have had a chance to change their signature
+    sig = inspect.signature(camera.async_camera_image)
+    if "height" in sig.parameters and "width" in sig.parameters:
+        return await camera.async_camera_image(width=width, height=height)
+    _LOGGER.warning(
+        "The camera entity %s does not support requesting width and height, please open an issue with the integration author",
+        camera.entity_id,
+    )
+    return await camera.async_camera_image()
+
+
 async def _async_get_image(
     camera: Camera,
     timeout: int = 10,
@@ -157,22 +173,17 @@ async def _async_get_image(
     """
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            # Calling inspect will be removed in 2022.1 after all
-            # custom components have had a chance to change their signature
-            sig = inspect.signature(camera.async_camera_image)
-            if "height" in sig.parameters and "width" in sig.parameters:
-                image_bytes = await camera.async_camera_image(
-                    width=width, height=height
-                )
-            else:
-                _LOGGER.warning(
-                    "The camera entity %s does not support requesting width and height, please open an issue with the integration author",
-                    camera.entity_id,
-                )
-                image_bytes = await camera.async_camera_image()
+            image_bytes = None
+            content_type = "image/jpeg"
+            # Take the still from a running stream instead of the device
+            if camera.use_stream_for_stills and camera.stream:
+                image_bytes = await camera.stream.async_get_image()
+
+            if not image_bytes:
+                image_bytes = await _async_get_camera_image(camera, width, height)
+                content_type = camera.content_type
 
             if image_bytes:
-                content_type = camera.content_type
                 image = Image(content_type, image_bytes)
                 if (
                     width is not None
@@ -423,6 +434,15 @@ class Camera(Entity):
         """Return the interval between frames of the mjpeg stream."""
         return MIN_STREAM_INTERVAL
 
+    @property
+    def use_stream_for_stills(self) -> bool:
+        """Return if stills are taken from the stream while it is running.
+
+        The still is the most recent keyframe of the stream, so the device
+        is not asked for a separate snapshot.
+        """
+        return False
+
     async def create_stream(self) -> Stream | None:
         """Create a Stream for stream_source."""
         # There is at most one stream (a decode worker) per camera
@@ -432,6 +452,8 @@ class Camera(Entity):
             if not source:
                 return None
             self.stream = create_stream(self.hass, source, options=self.stream_options)
+            if self.use_stream_for_stills:
+                self.stream.enable_still_images()
         return self.stream
 
     async def stream_source(self) -> str | None:
@@ -6,6 +6,7 @@ import fnmatch
 from ipaddress import ip_address as make_ip_address
 import logging
 import os
+import re
 import threading
 
 from aiodiscover import DiscoverHosts
@@ -58,6 +59,8 @@ SCAN_INTERVAL = timedelta(minutes=60)
 
 _LOGGER = logging.getLogger(__name__)
 
+_WILDCARD_RE = re.compile(r"[*?[]")
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the dhcp component."""
@@ -82,6 +85,70 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+class IntegrationMatchers:
+    """Index the dhcp matchers of the integrations.
+
+    Matchers are indexed by the literal prefix of their MAC address pattern,
+    or of their hostname pattern if they do not match on MAC address, so a
+    client is only checked against the matchers that can match it.
+    """
+
+    def __init__(self, integration_matchers):
+        """Compile the matchers."""
+        self._mac_index = {}
+        self._hostname_index = {}
+        self._compiled = []
+
+        for order, entry in enumerate(integration_matchers):
+            if MAC_ADDRESS in entry:
+                index = self._mac_index
+                pattern = entry[MAC_ADDRESS]
+            else:
+                index = self._hostname_index
+                pattern = entry.get(HOSTNAME, "")
+
+            prefix = _WILDCARD_RE.split(pattern, 1)[0]
+            index.setdefault(len(prefix), {}).setdefault(prefix, []).append(order)
+            self._compiled.append(
+                (
+                    entry,
+                    _compile_pattern(entry.get(MAC_ADDRESS)),
+                    _compile_pattern(entry.get(HOSTNAME)),
+                )
+            )
+
+    @callback
+    def async_match(self, uppercase_mac, lowercase_hostname):
+        """Return the matchers that match a client in manifest order."""
+        candidates = set()
+        for index, value in (
+            (self._mac_index, uppercase_mac),
+            (self._hostname_index, lowercase_hostname),
+        ):
+            for length, prefixes in index.items():
+                if orders := prefixes.get(value[:length]):
+                    candidates.update(orders)
+
+        matches = []
+        for order in sorted(candidates):
+            entry, mac_pattern, hostname_pattern = self._compiled[order]
+            if mac_pattern is not None and not mac_pattern(uppercase_mac):
+                continue
+            if hostname_pattern is not None and not hostname_pattern(
+                lowercase_hostname
+            ):
+                continue
+            matches.append(entry)
+        return matches
+
+
+def _compile_pattern(pattern):
+    """Compile a fnmatch pattern into a match function."""
+    if pattern is None:
+        return None
+    return re.compile(fnmatch.translate(pattern)).match
+
+
 class WatcherBase:
     """Base class for dhcp and device tracker watching."""
 
@@ -90,7 +157,7 @@ class WatcherBase:
         super().__init__()
 
         self.hass = hass
-        self._integration_matchers = integration_matchers
+        self._integration_matchers = IntegrationMatchers(integration_matchers)
         self._address_data = address_data
 
     def process_client(self, ip_address, hostname, mac_address):
@@ -132,17 +199,9 @@ class WatcherBase:
             lowercase_hostname,
         )
 
-        for entry in self._integration_matchers:
-            if MAC_ADDRESS in entry and not fnmatch.fnmatch(
-                uppercase_mac, entry[MAC_ADDRESS]
-            ):
-                continue
-
-            if HOSTNAME in entry and not fnmatch.fnmatch(
-                lowercase_hostname, entry[HOSTNAME]
-            ):
-                continue
-
+        for entry in self._integration_matchers.async_match(
+            uppercase_mac, lowercase_hostname
+        ):
             _LOGGER.debug("Matched %s against %s", data, entry)
 
             self.create_task(
@@ -37,6 +37,7 @@ CONF_STILL_IMAGE_URL = "still_image_url"
 CONF_STREAM_SOURCE = "stream_source"
 CONF_FRAMERATE = "framerate"
 CONF_RTSP_TRANSPORT = "rtsp_transport"
+CONF_USE_STREAM_FOR_STILLS = "use_stream_for_stills"
 FFMPEG_OPTION_MAP = {CONF_RTSP_TRANSPORT: "rtsp_transport"}
 ALLOWED_RTSP_TRANSPORT_PROTOCOLS = {"tcp", "udp", "udp_multicast", "http"}
 
@@ -60,6 +61,7 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
         ),
         vol.Optional(CONF_VERIFY_SSL, default=True): cv.boolean,
         vol.Optional(CONF_RTSP_TRANSPORT): vol.In(ALLOWED_RTSP_TRANSPORT_PROTOCOLS),
+        vol.Optional(CONF_USE_STREAM_FOR_STILLS, default=False): cv.boolean,
     }
 )
 
@@ -91,6 +93,7 @@ class GenericCamera(Camera):
         self._supported_features = SUPPORT_STREAM if self._stream_source else 0
         self.content_type = device_info[CONF_CONTENT_TYPE]
         self.verify_ssl = device_info[CONF_VERIFY_SSL]
+        self._use_stream_for_stills = device_info[CONF_USE_STREAM_FOR_STILLS]
         if device_info.get(CONF_RTSP_TRANSPORT):
             self.stream_options[FFMPEG_OPTION_MAP[CONF_RTSP_TRANSPORT]] = device_info[
                 CONF_RTSP_TRANSPORT
@@ -120,6 +123,11 @@ class GenericCamera(Camera):
         """Return the interval between frames of the mjpeg stream."""
         return self._frame_interval
 
+    @property
+    def use_stream_for_stills(self):
+        """Return if stills are taken from the stream while it is running."""
+        return self._use_stream_for_stills
+
     def camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
@@ -166,6 +166,9 @@ CHALLENGE_FAILED_PIN_NEEDED = "challengeFailedPinNeeded"
 
 STORE_AGENT_USER_IDS = "agent_user_ids"
 
+# Sent when the configuration of which entities are exposed has changed
+SIGNAL_EXPOSED_ENTITIES_UPDATED = "google_assistant_exposed_entities_updated"
+
 SOURCE_CLOUD = "cloud"
 SOURCE_LOCAL = "local"
 
@@ -580,13 +580,21 @@ class GoogleEntity:
     @callback
     def async_update(self):
         """Update the entity with latest info from Home Assistant."""
-        self.state = self.hass.states.get(self.entity_id)
+        self.async_set_state(self.hass.states.get(self.entity_id))
+
+    @callback
+    def async_set_state(self, state: State) -> None:
+        """Update the entity to a new state with the same attributes.
+
+        The traits are kept, as they are derived from the attributes.
+        """
+        self.state = state
 
         if self._traits is None:
             return
 
         for trt in self._traits:
-            trt.state = self.state
+            trt.state = state
 
 
 def deep_update(target, source):
@@ -5,11 +5,20 @@ from collections import deque
 import logging
 
 from homeassistant.const import MATCH_ALL
-from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.significant_change import create_checker
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_EXPOSED_ENTITIES_UPDATED
 from .error import SmartHomeError
 from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 
@@ -23,12 +32,83 @@ REPORT_STATE_WINDOW = 1
 _LOGGER = logging.getLogger(__name__)
 
 
+class _GoogleEntityCache:
+    """Cache the Google entities of states until their attributes change.
+
+    The exposure and traits are derived from the attributes, so they are
+    reused until the attributes change.
+    """
+
+    def __init__(self, hass: HomeAssistant, google_config: AbstractConfig) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._google_config = google_config
+        # The state the cached entity was created from, and the Google entity,
+        # which is None if the entity is not exposed or not supported.
+        self._entities: dict[str, tuple[State, GoogleEntity | None]] = {}
+
+    @callback
+    def async_get(self, state: State) -> GoogleEntity | None:
+        """Return the Google entity for a state if it should be reported."""
+        cached = self._entities.get(state.entity_id)
+        if cached is not None and cached[0].attributes == state.attributes:
+            entity = cached[1]
+            if entity is not None:
+                entity.async_set_state(state)
+            return entity
+
+        entity = GoogleEntity(self._hass, self._google_config, state)
+        if not entity.should_expose() or not entity.is_supported():
+            entity = None
+        self._entities[state.entity_id] = (state, entity)
+        return entity
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Forget the cached entity of an entity id."""
+        self._entities.pop(entity_id, None)
+
+    @callback
+    def async_listen(self) -> CALLBACK_TYPE:
+        """Forget cached entities when their exposure may have changed."""
+        unsubs = [
+            self._hass.bus.async_listen(
+                EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+            ),
+            async_dispatcher_connect(
+                self._hass,
+                SIGNAL_EXPOSED_ENTITIES_UPDATED,
+                self._async_exposed_entities_updated,
+            ),
+        ]
+
+        @callback
+        def unsub_all() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return unsub_all
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Forget the cached entity when its registry entry changed."""
+        self.async_remove(event.data["entity_id"])
+        if "old_entity_id" in event.data:
+            self.async_remove(event.data["old_entity_id"])
+
+    @callback
+    def _async_exposed_entities_updated(self) -> None:
+        """Forget all cached entities when the exposed entities changed."""
+        self._entities.clear()
+
+
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
     checker = None
     unsub_pending: CALLBACK_TYPE | None = None
     pending = deque([{}])
+    google_entities = _GoogleEntityCache(hass, google_config)
 
     async def report_states(now=None):
         """Report the states."""
@@ -60,14 +140,18 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             return
 
         if not new_state:
+            google_entities.async_remove(changed_entity)
             return
 
-        if not google_config.should_expose(new_state):
+        # Nothing Google reports on changed
+        if (
+            old_state is not None
+            and old_state.state == new_state.state
+            and old_state.attributes == new_state.attributes
+        ):
             return
 
-        entity = GoogleEntity(hass, google_config, new_state)
-
-        if not entity.is_supported():
+        if (entity := google_entities.async_get(new_state)) is None:
             return
 
         try:
@@ -140,11 +224,14 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             MATCH_ALL, async_entity_state_listener
         )
 
+    unsub_cache = google_entities.async_listen()
+
     unsub = async_call_later(hass, INITIAL_REPORT_DELAY, initial_report)
 
     @callback
     def unsub_all():
         unsub()
+        unsub_cache()
         if unsub_pending:
             unsub_pending()  # pylint: disable=not-callable
 
@@ -442,6 +442,9 @@ class Group(Entity):
         self._on_off = None
         self._assumed = None
         self._on_states = None
+        self._on_count = 0
+        self._assumed_count = 0
+        self._write_pending = False
         self.user_defined = user_defined
         self.mode = any
         if mode:
@@ -651,9 +654,15 @@ class Group(Entity):
         """Handle removal from Home Assistant."""
         self._async_stop()
 
-    async def _async_state_changed_listener(self, event):
+    @callback
+    def _async_state_changed_listener(self, event):
         """Respond to a member state changing.
 
+        The aggregated counts are updated right away, the state write is
+        coalesced so a burst of member changes within the same loop
+        iteration (and the cascade into nested groups) results in a single
+        write.
+
         This method must be run in the event loop.
         """
         # removed
@@ -668,6 +677,16 @@ class Group(Entity):
             self._reset_tracked_state()
 
         self._async_update_group_state(new_state)
+
+        if not self._write_pending:
+            self._write_pending = True
+            self.hass.async_create_task(self._async_write_pending_state())
+
+    async def _async_write_pending_state(self):
+        """Write the state once all member changes of this iteration are seen."""
+        self._write_pending = False
+        if self._async_unsub_state_changed is None:
+            return
         self.async_write_ha_state()
 
     def _reset_tracked_state(self):
@@ -675,6 +694,8 @@ class Group(Entity):
         self._on_off = {}
         self._assumed = {}
         self._on_states = set()
+        self._on_count = 0
+        self._assumed_count = 0
 
         for entity_id in self.trackable:
             state = self.hass.states.get(entity_id)
@@ -688,7 +709,10 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        self._assumed_count += assumed - self._assumed.get(entity_id, False)
+        self._assumed[entity_id] = assumed
+        was_on = self._on_off.get(entity_id, False)
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -696,12 +720,21 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            is_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in self.hass.data[REG_KEY].on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            is_on = state in entity_on_state
+
+        self._on_off[entity_id] = is_on
+        self._on_count += is_on - was_on
+
+    def _mode_matches(self, count, total):
+        """Apply the group mode to the number of matching members."""
+        if self.mode is all:
+            return count == total
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state=None):
@@ -719,15 +752,9 @@ class Group(Entity):
         if not self._on_off:
             return
 
-        if (
-            tr_state is None
-            or self._assumed_state
-            and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
-        ):
-            self._assumed_state = self.mode(self._assumed.values())
-
-        elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
-            self._assumed_state = True
+        self._assumed_state = self._mode_matches(
+            self._assumed_count, len(self._assumed)
+        )
 
         num_on_states = len(self._on_states)
         # If all the entity domains we are tracking
@@ -744,7 +771,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_matches(self._on_count, len(self._on_off))
         if group_is_on:
             self._state = on_state
         else:
@@ -27,6 +27,7 @@ from homeassistant.helpers.service import (
     async_extract_referenced_entity_ids,
 )
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.yaml import clear_parse_cache
 
 ATTR_ENTRY_ID = "entry_id"
 
@@ -223,6 +224,8 @@ async def async_setup(hass: ha.HomeAssistant, config: ConfigType) -> bool:  # no
 
     async def async_handle_reload_config(call):
         """Service handler for reloading core config."""
+        # Parse all configuration files again, even if they look unchanged
+        clear_parse_cache()
         try:
             conf = await conf_util.async_hass_config_yaml(hass)
         except HomeAssistantError as err:
@@ -92,6 +92,8 @@ EVENT_COLUMNS = [
     Events.context_id,
     Events.context_user_id,
     Events.context_parent_id,
+    Events.service_domain,
+    Events.service,
 ]
 
 SCRIPT_AUTOMATION_EVENTS = [EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED]
@@ -720,8 +722,8 @@ class LazyEventPartialState:
     @property
     def data_entity_id(self):
         """Extract the entity id from the decoded data or json."""
-        if self._event_data:
-            return self._event_data.get(ATTR_ENTITY_ID)
+        if self._event_data or self._row.event_data is None:
+            return self.data.get(ATTR_ENTITY_ID)
 
         result = ENTITY_ID_JSON_EXTRACT.search(self._row.event_data)
         return result and result.group(1)
@@ -729,8 +731,8 @@ class LazyEventPartialState:
     @property
     def data_domain(self):
         """Extract the domain from the decoded data or json."""
-        if self._event_data:
-            return self._event_data.get(ATTR_DOMAIN)
+        if self._event_data or self._row.event_data is None:
+            return self.data.get(ATTR_DOMAIN)
 
         result = DOMAIN_JSON_EXTRACT.search(self._row.event_data)
         return result and result.group(1)
@@ -754,6 +756,12 @@ class LazyEventPartialState:
         if not self._event_data:
             if self._row.event_data == EMPTY_JSON_OBJECT:
                 self._event_data = {}
+            elif self._row.event_data is None:
+                # A call_service event recorded without its service data
+                self._event_data = {
+                    ATTR_DOMAIN: self._row.service_domain,
+                    ATTR_SERVICE: self._row.service,
+                }
             else:
                 self._event_data = json.loads(self._row.event_data)
         return self._event_data
@@ -11,11 +11,18 @@ import functools as ft
 import hashlib
 import logging
 import secrets
-from typing import final
+from typing import Any, cast, final
 from urllib.parse import urlparse
 
 from aiohttp import web
-from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
+from aiohttp.hdrs import (
+    CACHE_CONTROL,
+    CONTENT_TYPE,
+    ETAG,
+    IF_MODIFIED_SINCE,
+    IF_NONE_MATCH,
+    LAST_MODIFIED,
+)
 from aiohttp.typedefs import LooseHeaders
 import async_timeout
 import voluptuous as vol
@@ -30,6 +37,7 @@ from homeassistant.components.websocket_api.const import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    HTTP_BAD_REQUEST,
     HTTP_INTERNAL_SERVER_ERROR,
     HTTP_NOT_FOUND,
     HTTP_OK,
@@ -54,7 +62,7 @@ from homeassistant.const import (
     STATE_OFF,
     STATE_PLAYING,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import (  # noqa: F401
@@ -66,6 +74,7 @@ from homeassistant.helpers.entity import Entity, EntityDescription
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.network import get_url
 from homeassistant.loader import bind_hass
+from homeassistant.util.jpeg import scale_jpeg_image
 
 from .const import (
     ATTR_APP_ID,
@@ -136,10 +145,24 @@ ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
 CACHE_IMAGES = "images"
 CACHE_MAXSIZE = "maxsize"
+CACHE_SIZE = "size"
 CACHE_LOCK = "lock"
 CACHE_URL = "url"
 CACHE_CONTENT = "content"
-ENTITY_IMAGE_CACHE = {CACHE_IMAGES: collections.OrderedDict(), CACHE_MAXSIZE: 16}
+CACHE_ETAG = "etag"
+CACHE_LAST_MODIFIED = "last_modified"
+CACHE_VALIDATED = "validated"
+# The cache is bounded by the total size of the cached images in bytes
+ENTITY_IMAGE_CACHE: dict[str, Any] = {
+    CACHE_IMAGES: collections.OrderedDict(),
+    CACHE_MAXSIZE: 16 * 1024 * 1024,
+    CACHE_SIZE: 0,
+}
+
+# Seconds after which a cached image is revalidated with its source
+IMAGE_CACHE_REVALIDATE = 300
+
+HTTP_NOT_MODIFIED = 304
 
 SCAN_INTERVAL = dt.timedelta(seconds=10)
 
@@ -951,46 +974,78 @@ class MediaPlayerEntity(Entity):
     async def _async_fetch_image_from_cache(self, url):
         """Fetch image.
 
-        Images are cached in memory (the images are typically 10-100kB in size).
+        Images are cached in memory (the images are typically 10-100kB in size)
+        up to a total of ENTITY_IMAGE_CACHE[CACHE_MAXSIZE] bytes. Once a cached
+        image is older than IMAGE_CACHE_REVALIDATE it is requested again with
+        the validators of the source, so unchanged images are not transferred.
         """
         cache_images = ENTITY_IMAGE_CACHE[CACHE_IMAGES]
-        cache_maxsize = ENTITY_IMAGE_CACHE[CACHE_MAXSIZE]
 
         if urlparse(url).hostname is None:
             url = f"{get_url(self.hass)}{url}"
 
         if url not in cache_images:
             cache_images[url] = {CACHE_LOCK: asyncio.Lock()}
+        entry = cache_images[url]
+        cache_images.move_to_end(url)
+
+        async with entry[CACHE_LOCK]:
+            now = self.hass.loop.time()
+            cached = entry.get(CACHE_CONTENT)
+            if cached and now - entry[CACHE_VALIDATED] < IMAGE_CACHE_REVALIDATE:
+                return cached
+
+            headers = {}
+            if cached and entry[CACHE_ETAG]:
+                headers[IF_NONE_MATCH] = entry[CACHE_ETAG]
+            if cached and entry[CACHE_LAST_MODIFIED]:
+                headers[IF_MODIFIED_SINCE] = entry[CACHE_LAST_MODIFIED]
+
+            content, content_type, response = await self._async_request_image(
+                url, headers
+            )
+            if cached and response and response.status == HTTP_NOT_MODIFIED:
+                entry[CACHE_VALIDATED] = now
+                return cached
 
-        async with cache_images[url][CACHE_LOCK]:
-            if CACHE_CONTENT in cache_images[url]:
-                return cache_images[url][CACHE_CONTENT]
-
-        (content, content_type) = await self._async_fetch_image(url)
+            if content is None:
+                # Keep serving the image we have until the source is back
+                return cached or (None, None)
 
-        async with cache_images[url][CACHE_LOCK]:
-            cache_images[url][CACHE_CONTENT] = content, content_type
-            while len(cache_images) > cache_maxsize:
-                cache_images.popitem(last=False)
+            entry[CACHE_ETAG] = response.headers.get(ETAG)
+            entry[CACHE_LAST_MODIFIED] = response.headers.get(LAST_MODIFIED)
+            entry[CACHE_VALIDATED] = now
+            _async_cache_image(url, entry, (content, content_type))
 
         return content, content_type
 
-    async def _async_fetch_image(self, url):
+    async def _async_fetch_image(self, url, headers=None):
         """Retrieve an image."""
-        content, content_type = (None, None)
+        content, content_type, _ = await self._async_request_image(url, headers)
+        return content, content_type
+
+    async def _async_request_image(self, url, headers=None):
+        """Request an image with the given request headers.
+
+        Returns the content and content type of the image, and the response so
+        conditional requests can check if the image was not modified.
+        """
+        content, content_type, response = (None, None, None)
         websession = async_get_clientsession(self.hass)
         with suppress(asyncio.TimeoutError), async_timeout.timeout(10):
-            response = await websession.get(url)
+            response = await websession.get(url, headers=headers)
             if response.status == HTTP_OK:
                 content = await response.read()
                 content_type = response.headers.get(CONTENT_TYPE)
                 if content_type:
                     content_type = content_type.split(";")[0]
 
-        if content is None:
+        if content is None and (
+            response is None or response.status != HTTP_NOT_MODIFIED
+        ):
             _LOGGER.warning("Error retrieving proxied image from %s", url)
 
-        return content, content_type
+        return content, content_type, response
 
     def get_browse_image_url(
         self,
@@ -1046,6 +1101,12 @@ class MediaPlayerImageView(HomeAssistantView):
         if not authenticated:
             return web.Response(status=HTTP_UNAUTHORIZED)
 
+        try:
+            width = int(request.query.get("width", 0))
+            height = int(request.query.get("height", 0))
+        except ValueError:
+            return web.Response(status=HTTP_BAD_REQUEST)
+
         if media_content_type and media_content_id:
             media_image_id = request.query.get("media_image_id")
             data, content_type = await player.async_get_browse_image(
@@ -1057,10 +1118,64 @@ class MediaPlayerImageView(HomeAssistantView):
         if data is None:
             return web.Response(status=HTTP_INTERNAL_SERVER_ERROR)
 
-        headers: LooseHeaders = {CACHE_CONTROL: "max-age=3600"}
+        etag = hashlib.sha256(data).hexdigest()[:32]
+        if width and height:
+            etag = f"{etag}-{width}x{height}"
+        headers: LooseHeaders = {CACHE_CONTROL: "max-age=3600", ETAG: f'"{etag}"'}
+
+        if request.headers.get(IF_NONE_MATCH) == headers[ETAG]:
+            return web.Response(status=HTTP_NOT_MODIFIED, headers=headers)
+
+        if width and height and content_type == "image/jpeg":
+            data = await _async_get_scaled_image(
+                request.app["hass"], etag, data, width, height
+            )
+
         return web.Response(body=data, content_type=content_type, headers=headers)
 
 
+@callback
+def _async_cache_image(
+    key: str, entry: dict[str, Any], image: tuple[bytes, str | None]
+) -> None:
+    """Store an image in the cache and evict the least recently used images."""
+    cache_images = ENTITY_IMAGE_CACHE[CACHE_IMAGES]
+    size = len(image[0])
+    ENTITY_IMAGE_CACHE[CACHE_SIZE] += size - entry.get(CACHE_SIZE, 0)
+    entry[CACHE_CONTENT] = image
+    entry[CACHE_SIZE] = size
+    cache_images[key] = entry
+    cache_images.move_to_end(key)
+
+    while (
+        ENTITY_IMAGE_CACHE[CACHE_SIZE] > ENTITY_IMAGE_CACHE[CACHE_MAXSIZE]
+        and len(cache_images) > 1
+    ):
+        _, evicted = cache_images.popitem(last=False)
+        ENTITY_IMAGE_CACHE[CACHE_SIZE] -= evicted.pop(CACHE_SIZE, 0)
+        evicted.pop(CACHE_CONTENT, None)
+
+
+async def _async_get_scaled_image(
+    hass: HomeAssistant, etag: str, data: bytes, width: int, height: int
+) -> bytes:
+    """Return a JPEG image scaled down to the requested size.
+
+    Scaled variants share the image cache, keyed by their ETag.
+    """
+    cache_images = ENTITY_IMAGE_CACHE[CACHE_IMAGES]
+    entry = cache_images.get(etag)
+    if entry is not None and CACHE_CONTENT in entry:
+        cache_images.move_to_end(etag)
+        return cast(bytes, entry[CACHE_CONTENT][0])
+
+    scaled: bytes = await hass.async_add_executor_job(
+        scale_jpeg_image, data, width, height
+    )
+    _async_cache_image(etag, entry or {}, (scaled, "image/jpeg"))
+    return scaled
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "media_player_thumbnail",
@@ -589,6 +589,7 @@ class MqttEntity(
         config = self.config_schema()(discovery_payload)
         self._config = config
         self._setup_from_config(self._config)
+        self.async_invalidate_static_attributes()
         await self.attributes_discovery_update(config)
         await self.availability_discovery_update(config)
         await self.device_info_discovery_update(config)
@@ -100,6 +100,8 @@ class MqttSensor(MqttEntity, SensorEntity):
 
     _attr_last_reset = None
     _attributes_extra_blocked = MQTT_SENSOR_ATTRIBUTES_BLOCKED
+    # Name, icon, unit and device class only change with a discovery update
+    _cache_static_attributes = True
 
     def __init__(self, hass, config, config_entry, discovery_data):
         """Initialize the sensor."""
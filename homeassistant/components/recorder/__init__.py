@@ -20,13 +20,14 @@ import voluptuous as vol
 
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
+    ATTR_DOMAIN,
     ATTR_ENTITY_ID,
     CONF_EXCLUDE,
+    EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
 )
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -125,6 +126,9 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_CALL_SERVICE = "call_service"
+CONF_COMPACT = "compact"
+CONF_SAMPLE = "sample"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -133,6 +137,15 @@ EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
     {vol.Optional(CONF_EVENT_TYPES): vol.All(cv.ensure_list, [cv.string])}
 )
 
+# Record call_service events without their service data and only
+# record one in every n calls of a domain, 0 to not record them at all
+CALL_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_COMPACT, default=False): cv.boolean,
+        vol.Optional(CONF_SAMPLE, default={}): {cv.string: cv.positive_int},
+    }
+)
+
 FILTER_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {vol.Optional(CONF_EXCLUDE, default=EXCLUDE_SCHEMA({})): EXCLUDE_SCHEMA}
 )
@@ -162,6 +175,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_CALL_SERVICE, default=CALL_SERVICE_SCHEMA({})
+                    ): CALL_SERVICE_SCHEMA,
                 }
             ),
         )
@@ -248,6 +264,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
     exclude = conf[CONF_EXCLUDE]
     exclude_t = exclude.get(CONF_EVENT_TYPES, [])
+    call_service = conf[CONF_CALL_SERVICE]
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass,
         auto_purge=auto_purge,
@@ -258,6 +275,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        call_service_compact=call_service[CONF_COMPACT],
+        call_service_sample=call_service[CONF_SAMPLE],
     )
     instance.async_initialize()
     instance.start()
@@ -346,6 +365,10 @@ class StatisticsTask(NamedTuple):
     start: datetime
 
 
+class TickTask:
+    """An object to insert into the recorder queue on every timer tick."""
+
+
 class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
@@ -364,6 +387,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        call_service_compact: bool,
+        call_service_sample: dict[str, int],
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -385,6 +410,9 @@ class Recorder(threading.Thread):
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
+        self.call_service_compact = call_service_compact
+        self.call_service_sample = call_service_sample
+        self._call_service_counts: dict[str, int] = {}
 
         self._timechanges_seen = 0
         self._commits_without_expire = 0
@@ -395,6 +423,7 @@ class Recorder(threading.Thread):
         self.get_session = None
         self._completed_first_database_setup = None
         self._event_listener = None
+        self._tick_listener = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
@@ -411,6 +440,7 @@ class Recorder(threading.Thread):
         self._event_listener = self.hass.bus.async_listen(
             MATCH_ALL, self.event_listener, event_filter=self._async_event_filter
         )
+        self._tick_listener = self.hass.ticks.async_listen(self._async_tick)
         self._queue_watcher = async_track_time_interval(
             self.hass, self._async_check_queue, timedelta(minutes=10)
         )
@@ -440,6 +470,14 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        if self._tick_listener:
+            self._tick_listener()
+            self._tick_listener = None
+
+    @callback
+    def _async_tick(self, now):
+        """Keep the connection alive and commit on the timer ticks."""
+        self.queue.put(TickTask())
 
     @callback
     def _async_event_filter(self, event) -> bool:
@@ -447,6 +485,9 @@ class Recorder(threading.Thread):
         if event.event_type in self.exclude_t:
             return False
 
+        if event.event_type == EVENT_CALL_SERVICE and self.call_service_sample:
+            return self._async_sample_call_service(event)
+
         entity_id = event.data.get(ATTR_ENTITY_ID)
 
         if entity_id is None:
@@ -464,6 +505,22 @@ class Recorder(threading.Thread):
         # Unknown what it is.
         return True
 
+    @callback
+    def _async_sample_call_service(self, event) -> bool:
+        """Return if a call_service event should be recorded."""
+        domain = event.data.get(ATTR_DOMAIN)
+        sample = self.call_service_sample.get(domain)
+
+        if sample is None:
+            return True
+
+        if not sample:
+            return False
+
+        count = self._call_service_counts.get(domain, 0)
+        self._call_service_counts[domain] = count + 1
+        return count % sample == 0
+
     def do_adhoc_purge(self, **kwargs):
         """Trigger an adhoc purge retaining keep_days worth of data."""
         keep_days = kwargs.get(ATTR_KEEP_DAYS, self.keep_days)
@@ -765,7 +822,7 @@ class Recorder(threading.Thread):
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
-        if event.event_type == EVENT_TIME_CHANGED:
+        if isinstance(event, TickTask):
             self._keepalive_count += 1
             if self._keepalive_count >= KEEPALIVE_TIME:
                 self._keepalive_count = 0
@@ -783,6 +840,8 @@ class Recorder(threading.Thread):
         try:
             if event.event_type == EVENT_STATE_CHANGED:
                 dbevent = Events.from_event(event, event_data="{}")
+            elif event.event_type == EVENT_CALL_SERVICE and self.call_service_compact:
+                dbevent = Events.from_call_service_event(event)
             else:
                 dbevent = Events.from_event(event)
             dbevent.created = event.time_fired
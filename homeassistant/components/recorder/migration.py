@@ -351,7 +351,7 @@ def _drop_foreign_key_constraints(connection, engine, table, columns):
             )
 
 
-def _apply_update(engine, session, new_version, old_version):
+def _apply_update(engine, session, new_version, old_version):  # noqa: C901
     """Perform operations to bring schema up to date."""
     connection = session.connection()
     if new_version == 1:
@@ -486,6 +486,13 @@ def _apply_update(engine, session, new_version, old_version):
         start = now.replace(minute=0, second=0, microsecond=0)
         start = start - timedelta(hours=1)
         session.add(StatisticsRuns(start=start))
+    elif new_version == 20:
+        # Columns for call_service events recorded without their service data
+        _add_columns(
+            connection,
+            "events",
+            ["service_domain VARCHAR(64)", "service VARCHAR(255)"],
+        )
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -24,6 +24,9 @@ from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.orm.session import Session
 
 from homeassistant.const import (
+    ATTR_DOMAIN,
+    ATTR_SERVICE,
+    EVENT_CALL_SERVICE,
     MAX_LENGTH_EVENT_CONTEXT_ID,
     MAX_LENGTH_EVENT_EVENT_TYPE,
     MAX_LENGTH_EVENT_ORIGIN,
@@ -39,7 +42,7 @@ import homeassistant.util.dt as dt_util
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 19
+SCHEMA_VERSION = 20
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,6 +90,9 @@ class Events(Base):  # type: ignore
     context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
     context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
     context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
+    # Only set for call_service events recorded without their data
+    service_domain = Column(String(MAX_LENGTH_STATE_DOMAIN))
+    service = Column(String(MAX_LENGTH_STATE_ENTITY_ID))
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -111,6 +117,23 @@ class Events(Base):  # type: ignore
             context_parent_id=event.context.parent_id,
         )
 
+    @staticmethod
+    def from_call_service_event(event):
+        """Create a compact database object from a native call_service event.
+
+        Only the domain and service are stored, the service data is dropped.
+        """
+        return Events(
+            event_type=event.event_type,
+            service_domain=event.data.get(ATTR_DOMAIN),
+            service=event.data.get(ATTR_SERVICE),
+            origin=str(event.origin.value),
+            time_fired=event.time_fired,
+            context_id=event.context.id,
+            context_user_id=event.context.user_id,
+            context_parent_id=event.context.parent_id,
+        )
+
     def to_native(self, validate_entity_id=True):
         """Convert to a native HA Event."""
         context = Context(
@@ -119,9 +142,14 @@ class Events(Base):  # type: ignore
             parent_id=self.context_parent_id,
         )
         try:
+            if self.event_type == EVENT_CALL_SERVICE and self.event_data is None:
+                # A call_service event recorded without its service data
+                data = {ATTR_DOMAIN: self.service_domain, ATTR_SERVICE: self.service}
+            else:
+                data = json.loads(self.event_data)
             return Event(
                 self.event_type,
-                json.loads(self.event_data),
+                data,
                 EventOrigin(self.origin),
                 process_timestamp(self.time_fired),
                 context=context,
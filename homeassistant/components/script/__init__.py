@@ -32,6 +32,13 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import (
+    REFERENCE_AREA,
+    REFERENCE_DEVICE,
+    REFERENCE_ENTITY,
+    ReferenceIndex,
+    ReferencesType,
+)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -66,6 +73,8 @@ SCRIPT_TURN_ONOFF_SCHEMA = make_entity_service_schema(
 )
 RELOAD_SERVICE_SCHEMA = vol.Schema({})
 
+DATA_REFERENCE_INDEX = "script_reference_index"
+
 
 @bind_hass
 def is_on(hass, entity_id):
@@ -79,13 +88,9 @@ def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if entity_id in script_entity.script.referenced_entities
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing(
+        REFERENCE_ENTITY, entity_id
+    )
 
 
 @callback
@@ -110,13 +115,9 @@ def scripts_with_device(hass: HomeAssistant, device_id: str) -> list[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if device_id in script_entity.script.referenced_devices
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing(
+        REFERENCE_DEVICE, device_id
+    )
 
 
 @callback
@@ -141,13 +142,7 @@ def scripts_with_area(hass: HomeAssistant, area_id: str) -> list[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if area_id in script_entity.script.referenced_areas
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing(REFERENCE_AREA, area_id)
 
 
 @callback
@@ -166,8 +161,19 @@ def areas_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
     return list(script_entity.script.referenced_areas)
 
 
+@callback
+def _async_script_references(script_entity: ScriptEntity) -> ReferencesType:
+    """Return what a script references."""
+    return {
+        REFERENCE_ENTITY: script_entity.script.referenced_entities,
+        REFERENCE_DEVICE: script_entity.script.referenced_devices,
+        REFERENCE_AREA: script_entity.script.referenced_areas,
+    }
+
+
 async def async_setup(hass, config):
     """Load the scripts from the configuration."""
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex(_async_script_references)
     hass.data[DOMAIN] = component = EntityComponent(LOGGER, DOMAIN, hass)
 
     # To register scripts as valid domain for Blueprint
@@ -419,12 +425,14 @@ class ScriptEntity(ToggleEntity, RestoreEntity):
 
     async def async_added_to_hass(self) -> None:
         """Restore last triggered on startup."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(self.entity_id, self)
         if state := await self.async_get_last_state():
             if last_triggered := state.attributes.get("last_triggered"):
                 self.script.last_triggered = parse_datetime(last_triggered)
 
     async def async_will_remove_from_hass(self):
         """Stop script and remove service when it will be removed from Home Assistant."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self.entity_id)
         await self.script.async_stop()
 
         # remove service
@@ -32,6 +32,9 @@ SCAN_INTERVAL = timedelta(seconds=60)
 
 IPV4_BROADCAST = IPv4Address("255.255.255.255")
 
+# Keys used to index the integration matchers, most selective first
+MATCHER_INDEX_KEYS = ("st", "deviceType", "manufacturer")
+
 # Attributes for accessing info from SSDP response
 ATTR_SSDP_LOCATION = "ssdp_location"
 ATTR_SSDP_ST = "ssdp_st"
@@ -140,6 +143,27 @@ def _async_headers_match(
     return True
 
 
+def _build_matcher_index(
+    integration_matchers: dict[str, list[dict[str, str]]]
+) -> dict[str, dict[str, list[tuple[str, dict[str, str]]]]]:
+    """Index the integration matchers by the value of one of their keys.
+
+    A response is then only checked against the matchers that share the
+    value of its most selective key.
+    """
+    index: dict[str, dict[str, list[tuple[str, dict[str, str]]]]] = {}
+    for domain, matchers in integration_matchers.items():
+        for matcher in matchers:
+            key = next(
+                (key for key in MATCHER_INDEX_KEYS if key in matcher),
+                next(iter(matcher)),
+            )
+            index.setdefault(key, {}).setdefault(matcher[key], []).append(
+                (domain, matcher)
+            )
+    return index
+
+
 class Scanner:
     """Class to manage SSDP scanning."""
 
@@ -150,7 +174,7 @@ class Scanner:
         self.hass = hass
         self.seen: set[tuple[str, str | None]] = set()
         self.cache: dict[tuple[str, str], Mapping[str, str]] = {}
-        self._integration_matchers = integration_matchers
+        self._matcher_index = _build_matcher_index(integration_matchers)
         self._cancel_scan: Callable[[], None] | None = None
         self._ssdp_listeners: list[SSDPListener] = []
         self._callbacks: list[tuple[Callable[[dict], None], dict[str, str]]] = []
@@ -269,8 +293,11 @@ class Scanner:
     @core_callback
     def _async_matching_domains(self, info_with_req: CaseInsensitiveDict) -> set[str]:
         domains = set()
-        for domain, matchers in self._integration_matchers.items():
-            for matcher in matchers:
+        for key, matchers_by_value in self._matcher_index.items():
+            value = info_with_req.get(key)
+            if not isinstance(value, str):
+                continue
+            for domain, matcher in matchers_by_value.get(value, ()):
                 if all(info_with_req.get(k) == v for (k, v) in matcher.items()):
                     domains.add(domain)
         return domains
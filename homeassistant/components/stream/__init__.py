@@ -41,7 +41,7 @@ from .const import (
     STREAM_RESTART_INCREMENT,
     STREAM_RESTART_RESET_TIME,
 )
-from .core import PROVIDERS, IdleTimer, StreamOutput
+from .core import PROVIDERS, IdleTimer, KeyFrameConverter, StreamOutput
 from .hls import async_setup_hls
 
 _LOGGER = logging.getLogger(__name__)
@@ -128,6 +128,7 @@ class Stream:
         self._thread_quit = threading.Event()
         self._outputs: dict[str, StreamOutput] = {}
         self._fast_restart_once = False
+        self._keyframe_converter: KeyFrameConverter | None = None
 
     def endpoint_url(self, fmt: str) -> str:
         """Start the stream and returns a url for the output format."""
@@ -210,7 +211,13 @@ class Stream:
         wait_timeout = 0
         while not self._thread_quit.wait(timeout=wait_timeout):
             start_time = time.time()
-            stream_worker(self.source, self.options, segment_buffer, self._thread_quit)
+            stream_worker(
+                self.source,
+                self.options,
+                segment_buffer,
+                self._thread_quit,
+                self._keyframe_converter,
+            )
             segment_buffer.discontinuity()
             if not self.keepalive or self._thread_quit.is_set():
                 if self._fast_restart_once:
@@ -231,6 +238,7 @@ class Stream:
                 wait_timeout,
                 self.source,
             )
+        segment_buffer.store.close()
         self._worker_finished()
 
     def _worker_finished(self) -> None:
@@ -259,6 +267,29 @@ class Stream:
             self._thread = None
             _LOGGER.info("Stopped stream: %s", redact_credentials(str(self.source)))
 
+    @property
+    def available(self) -> bool:
+        """Return if the stream worker is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def enable_still_images(self) -> None:
+        """Keep the most recent keyframe to create still images from.
+
+        This takes effect when the worker next opens the stream.
+        """
+        if self._keyframe_converter is None:
+            self._keyframe_converter = KeyFrameConverter(self.hass)
+
+    async def async_get_image(self) -> bytes | None:
+        """Return the most recent keyframe of the stream as a JPEG.
+
+        Returns None if still images are not enabled, the worker is not running
+        or it has not seen a keyframe.
+        """
+        if self._keyframe_converter is None or not self.available:
+            return None
+        return await self._keyframe_converter.async_get_image()
+
     async def async_record(
         self, video_path: str, duration: int = 30, lookback: int = 5
     ) -> None:
@@ -19,6 +19,7 @@ OUTPUT_IDLE_TIMEOUT = 300  # Idle timeout due to inactivity
 
 NUM_PLAYLIST_SEGMENTS = 3  # Number of segments to use in HLS playlist
 MAX_SEGMENTS = 5  # Max number of segments to keep around
+SEGMENT_STORE_SIZE = 64 * 1024 * 1024  # Size of the file holding segment data
 TARGET_SEGMENT_DURATION = 2.0  # Each segment is about this many seconds
 TARGET_PART_DURATION = 1.0
 SEGMENT_DURATION_ADJUSTER = 0.1  # Used to avoid missing keyframe boundaries
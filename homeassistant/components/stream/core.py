@@ -3,8 +3,13 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
+from contextlib import suppress
 import datetime
-from typing import TYPE_CHECKING
+from fractions import Fraction
+import logging
+import mmap
+import tempfile
+from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
 import attr
@@ -14,14 +19,72 @@ from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
-from .const import ATTR_STREAMS, DOMAIN, TARGET_SEGMENT_DURATION
+from .const import ATTR_STREAMS, DOMAIN, SEGMENT_STORE_SIZE, TARGET_SEGMENT_DURATION
 
 if TYPE_CHECKING:
+    import av
+
     from . import Stream
 
+_LOGGER = logging.getLogger(__name__)
+
 PROVIDERS = Registry()
 
 
+class SegmentStore:
+    """Store the data of segment parts in a memory-mapped ring file.
+
+    The worker writes each part once and the outputs get a view of the file
+    instead of a copy, so the kernel can page out the segments that are kept
+    around for HLS and recorder lookback. Once the end of the file is reached,
+    writing continues at the start and the oldest parts are overwritten.
+    """
+
+    def __init__(self, size: int = SEGMENT_STORE_SIZE) -> None:
+        """Initialize the segment store."""
+        self.size = size
+        self._file = tempfile.TemporaryFile(prefix="stream")
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        # Total number of bytes written, parts are addressed by this position
+        self.position = 0
+
+    def write(self, data: bytes) -> tuple[int | None, bytes | memoryview]:
+        """Write the data of a part and return its position and a view of it.
+
+        Data that doesn't fit in the store is returned as is, without a position.
+        """
+        length = len(data)
+        if length > self.size:
+            return None, data
+        offset = self.position % self.size
+        if offset + length > self.size:
+            # Parts are not split, continue at the start of the file
+            self.position += self.size - offset
+            offset = 0
+        self._mmap[offset : offset + length] = data
+        position = self.position
+        self.position += length
+        return position, memoryview(self._mmap)[offset : offset + length].toreadonly()
+
+    def expired(self, position: int) -> bool:
+        """Return whether the data written at a position was overwritten."""
+        return self.position > position + self.size
+
+    def expiring(self, position: int) -> bool:
+        """Return whether the data written at a position is overwritten soon."""
+        return self.position > position + self.size // 2
+
+    def close(self) -> None:
+        """Close the store.
+
+        The memory map stays open until all views of it are released.
+        """
+        self._file.close()
+        with suppress(BufferError):
+            self._mmap.close()
+
+
 @attr.s(slots=True)
 class Part:
     """Represent a segment part."""
@@ -29,7 +92,9 @@ class Part:
     duration: float = attr.ib()
     has_keyframe: bool = attr.ib()
     # video data (moof+mdat)
-    data: bytes = attr.ib()
+    data: bytes | memoryview = attr.ib()
+    # position of the data in the segment store, None if kept in memory
+    position: int | None = attr.ib(default=None)
 
 
 @attr.s(slots=True)
@@ -44,12 +109,43 @@ class Segment:
     stream_id: int = attr.ib(default=0)
     parts: list[Part] = attr.ib(factory=list)
     start_time: datetime.datetime = attr.ib(factory=datetime.datetime.utcnow)
+    # the store holding the data of the parts
+    store: SegmentStore | None = attr.ib(default=None)
 
     @property
     def complete(self) -> bool:
         """Return whether the Segment is complete."""
         return self.duration > 0
 
+    @property
+    def first_position(self) -> int | None:
+        """Return the oldest position of the part data in the segment store."""
+        for part in self.parts:
+            if part.position is not None:
+                return part.position
+        return None
+
+    @property
+    def expired(self) -> bool:
+        """Return whether part data was overwritten in the segment store."""
+        if self.store is None or (position := self.first_position) is None:
+            return False
+        return self.store.expired(position)
+
+    @property
+    def expiring(self) -> bool:
+        """Return whether part data is overwritten soon in the segment store."""
+        if self.store is None or (position := self.first_position) is None:
+            return False
+        return self.store.expiring(position)
+
+    def load(self) -> None:
+        """Copy the data of the parts out of the segment store into memory."""
+        for part in self.parts:
+            if part.position is not None:
+                part.data = bytes(part.data)
+                part.position = None
+
     def get_bytes_without_init(self) -> bytes:
         """Return reconstructed data for all parts as bytes, without init."""
         return b"".join([part.data for part in self.parts])
@@ -185,6 +281,100 @@ class StreamOutput:
         self._segments = deque(maxlen=self._segments.maxlen)
 
 
+class KeyFrameConverter:
+    """Convert the most recent keyframe of a stream into a JPEG image.
+
+    The worker thread hands over each video keyframe. A keyframe is only
+    decoded when an image is requested, and the image is cached until the
+    next keyframe arrives.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the keyframe converter."""
+        self._hass = hass
+        self._lock = asyncio.Lock()
+        self._decoder: Any = None
+        self._encoder: Any = None
+        self._codec_name: str | None = None
+        self._extradata: bytes | None = None
+        self._image: bytes | None = None
+        # Set by the worker thread, reset when the image is generated
+        self.packet: av.Packet | None = None
+
+    def create_decoder(self, video_stream: av.video.VideoStream) -> None:
+        """Create the decoder for the keyframes of a video stream.
+
+        This is run by the worker thread each time it opens the stream.
+        """
+        self.packet = None
+        self._image = None
+        self._encoder = None
+        self._codec_name = video_stream.codec_context.name
+        self._extradata = video_stream.codec_context.extradata
+        self._decoder = self._open_decoder()
+
+    def _open_decoder(self) -> Any:
+        """Open a decoder that only decodes keyframes."""
+        # Keep import here so that we can import stream integration without installing reqs
+        # pylint: disable=import-outside-toplevel
+        import av
+
+        decoder = av.CodecContext.create(self._codec_name, "r")
+        decoder.extradata = self._extradata
+        decoder.skip_frame = "NONKEY"
+        decoder.thread_type = "NONE"
+        return decoder
+
+    def _generate_image(self) -> None:
+        """Decode the pending keyframe and encode it as a JPEG.
+
+        This is run in the executor, one call at a time.
+        """
+        # Keep import here so that we can import stream integration without installing reqs
+        # pylint: disable=import-outside-toplevel
+        import av
+
+        if (packet := self.packet) is None or (decoder := self._decoder) is None:
+            return
+        self.packet = None
+
+        frames = decoder.decode(packet)
+        # Some decoders only return the frame once they are flushed, a flushed
+        # decoder can't be used again
+        if not frames:
+            frames = decoder.decode(None)
+            try:
+                self._decoder = self._open_decoder()
+            except (av.AVError, ValueError) as err:
+                _LOGGER.warning("Unable to reopen the keyframe decoder: %s", err)
+                self._decoder = None
+        if not frames:
+            return
+        frame = frames[0].reformat(format="yuvj420p")
+
+        encoder = self._encoder
+        if (
+            encoder is None
+            or encoder.width != frame.width
+            or encoder.height != frame.height
+        ):
+            encoder = self._encoder = av.CodecContext.create("mjpeg", "w")
+            encoder.width = frame.width
+            encoder.height = frame.height
+            encoder.pix_fmt = "yuvj420p"
+            encoder.time_base = Fraction(1, 90000)
+
+        frame.pts = None
+        self._image = b"".join(bytes(out) for out in encoder.encode(frame))
+
+    async def async_get_image(self) -> bytes | None:
+        """Return the most recent keyframe as a JPEG."""
+        async with self._lock:
+            if self.packet is not None:
+                await self._hass.async_add_executor_job(self._generate_image)
+        return self._image
+
+
 class StreamView(HomeAssistantView):
     """
     Base StreamView.
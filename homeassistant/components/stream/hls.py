@@ -191,13 +191,14 @@ class HlsSegmentView(StreamView):
         """Return fmp4 segment."""
         track = stream.add_provider(HLS_PROVIDER)
         track.idle_timer.awake()
-        if not (segment := track.get_segment(int(sequence))):
+        if not (segment := track.get_segment(int(sequence))) or segment.expired:
             return web.HTTPNotFound()
-        headers = {"Content-Type": "video/iso.segment"}
-        return web.Response(
-            body=segment.get_bytes_without_init(),
-            headers=headers,
-        )
+        # Copy the part data out of the segment store before yielding to the
+        # loop, the worker overwrites the oldest data while the response is sent
+        body = segment.get_bytes_without_init()
+        if segment.expired:
+            return web.HTTPNotFound()
+        return web.Response(body=body, headers={"Content-Type": "video/iso.segment"})
 
 
 @PROVIDERS.register(HLS_PROVIDER)
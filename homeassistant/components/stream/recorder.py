@@ -55,9 +55,17 @@ def recorder_save_worker(file_out: str, segments: deque[Segment]) -> None:
             continue
         last_sequence = segment.sequence
 
+        data = segment.get_bytes_without_init()
+        # The segment store may have been overwritten while reading
+        if segment.expired:
+            _LOGGER.warning(
+                "Skipping segment %s, it is no longer available", segment.sequence
+            )
+            continue
+
         # Open segment
         source = av.open(
-            BytesIO(segment.init + segment.get_bytes_without_init()),
+            BytesIO(segment.init + data),
             "r",
             format=SEGMENT_CONTAINER_FORMAT,
         )
@@ -131,6 +139,23 @@ class RecorderOutput(StreamOutput):
     def prepend(self, segments: list[Segment]) -> None:
         """Prepend segments to existing list."""
         self._segments.extendleft(reversed(segments))
+        self._load_expiring()
+
+    @callback
+    def _async_put(self, segment: Segment) -> None:
+        """Store output from event loop."""
+        super()._async_put(segment)
+        self._load_expiring()
+
+    def _load_expiring(self) -> None:
+        """Load the segments that are about to be overwritten into memory.
+
+        The recording is read from the segment store, only segments that are
+        kept around longer than the store can hold are copied.
+        """
+        for segment in self._segments:
+            if segment.expiring:
+                segment.load()
 
     def cleanup(self) -> None:
         """Write recording and clean up."""
@@ -21,7 +21,7 @@ from .const import (
     SOURCE_TIMEOUT,
     TARGET_PART_DURATION,
 )
-from .core import Part, Segment, StreamOutput
+from .core import KeyFrameConverter, Part, Segment, SegmentStore, StreamOutput
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +40,8 @@ class SegmentBuffer:
         # sequence gets incremented before the first segment so the first segment
         # has a sequence number of 0.
         self._sequence = -1
+        # the parts of all segments are written to the store
+        self.store = SegmentStore()
         self._segment_start_dts: int = cast(int, None)
         self._memory_file: BytesIO = cast(BytesIO, None)
         self._av_output: av.container.OutputContainer = None
@@ -148,6 +150,7 @@ class SegmentBuffer:
                 sequence=self._sequence,
                 stream_id=self._stream_id,
                 init=self._memory_file.getvalue(),
+                store=self.store,
             )
             self._memory_file_pos = self._memory_file.tell()
             self._part_start_dts = self._segment_start_dts
@@ -170,11 +173,13 @@ class SegmentBuffer:
             self._av_output.close()
         assert self._segment
         self._memory_file.seek(self._memory_file_pos)
+        position, data = self.store.write(self._memory_file.read())
         self._segment.parts.append(
             Part(
                 duration=float((packet.dts - self._part_start_dts) * packet.time_base),
                 has_keyframe=self._part_has_keyframe,
-                data=self._memory_file.read(),
+                data=data,
+                position=position,
             )
         )
         if last_part:
@@ -314,8 +319,13 @@ def stream_worker(
     options: dict[str, str],
     segment_buffer: SegmentBuffer,
     quit_event: Event,
+    keyframe_converter: KeyFrameConverter | None = None,
 ) -> None:
-    """Handle consuming streams."""
+    """Handle consuming streams.
+
+    If a keyframe_converter is passed, it is handed a copy of each video
+    keyframe so it can produce still images of the stream.
+    """
 
     try:
         container = av.open(source, options=options, timeout=SOURCE_TIMEOUT)
@@ -386,7 +396,21 @@ def stream_worker(
     segment_buffer.set_streams(video_stream, audio_stream)
     segment_buffer.reset(start_dts)
 
+    if keyframe_converter is not None:
+        try:
+            keyframe_converter.create_decoder(video_stream)
+        except (av.AVError, ValueError) as ex:
+            _LOGGER.warning("Unable to create still images of the stream: %s", ex)
+            keyframe_converter = None
+
+    def retain_keyframe(packet: av.Packet) -> None:
+        """Hand a copy of a video keyframe to the keyframe converter."""
+        if keyframe_converter is not None and is_keyframe(packet) and is_video(packet):
+            # Muxing may take over the packet data, so keep a copy
+            keyframe_converter.packet = av.Packet(bytes(packet))
+
     # Mux the first keyframe, then proceed through the rest of the packets
+    retain_keyframe(first_keyframe)
     segment_buffer.mux_packet(first_keyframe)
 
     while not quit_event.is_set():
@@ -395,6 +419,7 @@ def stream_worker(
         except (av.AVError, StopIteration) as ex:
             _LOGGER.error("Error demuxing stream: %s", str(ex))
             break
+        retain_keyframe(packet)
         segment_buffer.mux_packet(packet)
 
     # Close stream
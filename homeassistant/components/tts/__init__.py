@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+from contextlib import suppress
 import functools as ft
 import hashlib
 import io
@@ -39,6 +41,7 @@ from homeassistant.helpers import config_per_platform, discovery
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.service import async_set_service_schema
+from homeassistant.helpers.start import async_at_start
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_prepare_setup_platform
 from homeassistant.util.yaml import load_yaml
@@ -60,7 +63,10 @@ BASE_URL_KEY = "tts_base_url"
 CONF_BASE_URL = "base_url"
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_SIZE = "cache_size"
 CONF_LANG = "language"
+CONF_MEMORY_SIZE = "memory_size"
+CONF_PRELOAD = "preload"
 CONF_SERVICE_NAME = "service_name"
 CONF_TIME_MEMORY = "time_memory"
 
@@ -68,6 +74,8 @@ CONF_FIELDS = "fields"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
+DEFAULT_CACHE_SIZE = 512  # MB
+DEFAULT_MEMORY_SIZE = 32  # MB
 DEFAULT_TIME_MEMORY = 300
 DOMAIN = "tts"
 
@@ -99,8 +107,15 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_TIME_MEMORY, default=DEFAULT_TIME_MEMORY): vol.All(
             vol.Coerce(int), vol.Range(min=60, max=57600)
         ),
+        vol.Optional(CONF_CACHE_SIZE, default=DEFAULT_CACHE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_MEMORY_SIZE, default=DEFAULT_MEMORY_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
         vol.Optional(CONF_BASE_URL): cv.string,
         vol.Optional(CONF_SERVICE_NAME): cv.string,
+        vol.Optional(CONF_PRELOAD): vol.All(cv.ensure_list, [cv.string]),
     }
 )
 PLATFORM_SCHEMA_BASE = cv.PLATFORM_SCHEMA_BASE.extend(PLATFORM_SCHEMA.schema)
@@ -127,10 +142,19 @@ async def async_setup(hass, config):
         use_cache = conf.get(CONF_CACHE, DEFAULT_CACHE)
         cache_dir = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
         time_memory = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
+        cache_size = conf.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE)
+        memory_size = conf.get(CONF_MEMORY_SIZE, DEFAULT_MEMORY_SIZE)
         base_url = conf.get(CONF_BASE_URL)
         hass.data[BASE_URL_KEY] = base_url
 
-        await tts.async_init_cache(use_cache, cache_dir, time_memory, base_url)
+        await tts.async_init_cache(
+            use_cache,
+            cache_dir,
+            time_memory,
+            base_url,
+            cache_size * 1024 * 1024,
+            memory_size * 1024 * 1024,
+        )
     except (HomeAssistantError, KeyError):
         _LOGGER.exception("Error on cache init")
         return False
@@ -219,6 +243,14 @@ async def async_setup(hass, config):
         }
         async_set_service_schema(hass, DOMAIN, service_name, service_desc)
 
+        if preload := p_config.get(CONF_PRELOAD):
+
+            async def async_preload(hass):
+                """Generate the configured messages once started."""
+                await tts.async_preload(p_type, preload)
+
+            async_at_start(hass, async_preload)
+
     setup_tasks = [
         asyncio.create_task(async_setup_platform(p_type, p_config))
         for p_type, p_config in config_per_platform(config, DOMAIN)
@@ -269,14 +301,32 @@ class SpeechManager:
         self.cache_dir = DEFAULT_CACHE_DIR
         self.time_memory = DEFAULT_TIME_MEMORY
         self.base_url = None
-        self.file_cache = {}
-        self.mem_cache = {}
-
-    async def async_init_cache(self, use_cache, cache_dir, time_memory, base_url):
+        # Both caches are ordered from least to most recently used
+        self.file_cache = OrderedDict()
+        self.mem_cache = OrderedDict()
+        self.cache_size = DEFAULT_CACHE_SIZE * 1024 * 1024
+        self.memory_size = DEFAULT_MEMORY_SIZE * 1024 * 1024
+        self._file_sizes = {}
+        self._file_cache_bytes = 0
+        self._mem_cache_bytes = 0
+        # Speech that is being generated by a provider
+        self._pending = {}
+
+    async def async_init_cache(
+        self,
+        use_cache,
+        cache_dir,
+        time_memory,
+        base_url,
+        cache_size=DEFAULT_CACHE_SIZE * 1024 * 1024,
+        memory_size=DEFAULT_MEMORY_SIZE * 1024 * 1024,
+    ):
         """Init config folder and load file cache."""
         self.use_cache = use_cache
         self.time_memory = time_memory
         self.base_url = base_url
+        self.cache_size = cache_size
+        self.memory_size = memory_size
 
         try:
             self.cache_dir = await self.hass.async_add_executor_job(
@@ -292,12 +342,24 @@ class SpeechManager:
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
-        if cache_files:
-            self.file_cache.update(cache_files)
+        if not cache_files:
+            return
+
+        file_stats = await self.hass.async_add_executor_job(
+            _get_cache_file_stats, self.cache_dir, cache_files
+        )
+        # Files that were used last have the most recent modification time
+        for key, (_, size) in sorted(file_stats.items(), key=lambda item: item[1][0]):
+            self.file_cache[key] = cache_files[key]
+            self._file_sizes[key] = size
+            self._file_cache_bytes += size
+
+        await self._async_evict_files()
 
     async def async_clear_cache(self):
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        self.mem_cache = OrderedDict()
+        self._mem_cache_bytes = 0
 
         def remove_files():
             """Remove files from filesystem."""
@@ -308,7 +370,9 @@ class SpeechManager:
                     _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
 
         await self.hass.async_add_executor_job(remove_files)
-        self.file_cache = {}
+        self.file_cache = OrderedDict()
+        self._file_sizes = {}
+        self._file_cache_bytes = 0
 
     @callback
     def async_register_engine(self, engine, provider, config):
@@ -364,18 +428,37 @@ class SpeechManager:
         # Is speech already in memory
         if key in self.mem_cache:
             filename = self.mem_cache[key][MEM_CACHE_FILENAME]
+            self.mem_cache.move_to_end(key)
         # Is file store in file cache
         elif use_cache and key in self.file_cache:
             filename = self.file_cache[key]
             self.hass.async_create_task(self.async_file_to_mem(key))
         # Load speech from provider into memory
         else:
-            filename = await self.async_get_tts_audio(
-                engine, key, message, use_cache, language, options
-            )
+            # Identical messages requested at the same time share one request
+            # to the provider
+            if (pending := self._pending.get(key)) is None:
+                pending = self._pending[key] = self.hass.async_create_task(
+                    self.async_get_tts_audio(
+                        engine, key, message, use_cache, language, options
+                    )
+                )
+                pending.add_done_callback(lambda _: self._pending.pop(key, None))
+            filename = await asyncio.shield(pending)
 
         return f"/api/tts_proxy/{filename}"
 
+    async def async_preload(self, engine, messages):
+        """Generate messages ahead of time so they are cached.
+
+        This method is a coroutine.
+        """
+        for message in messages:
+            try:
+                await self.async_get_url_path(engine, message)
+            except HomeAssistantError as err:
+                _LOGGER.warning("Can't preload '%s' with %s: %s", message, engine, err)
+
     async def async_get_tts_audio(self, engine, key, message, cache, language, options):
         """Receive TTS and store for view in cache.
 
@@ -419,9 +502,40 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        self._file_cache_bytes += len(data) - self._file_sizes.get(key, 0)
+        self.file_cache[key] = filename
+        self.file_cache.move_to_end(key)
+        self._file_sizes[key] = len(data)
+        await self._async_evict_files()
+
+    async def _async_evict_files(self):
+        """Remove the least recently used files above the cache size.
+
+        This method is a coroutine.
+        """
+        remove = []
+        while self._file_cache_bytes > self.cache_size and len(self.file_cache) > 1:
+            key, filename = self.file_cache.popitem(last=False)
+            self._file_cache_bytes -= self._file_sizes.pop(key, 0)
+            remove.append(filename)
+
+        if not remove:
+            return
+
+        def remove_files():
+            """Remove files from filesystem."""
+            for filename in remove:
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError as err:
+                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+
+        _LOGGER.debug("Removing %s files from the cache", len(remove))
+        await self.hass.async_add_executor_job(remove_files)
 
     async def async_file_to_mem(self, key):
         """Load voice from file cache into memory.
@@ -437,28 +551,54 @@ class SpeechManager:
         def load_speech():
             """Load a speech from filesystem."""
             with open(voice_file, "rb") as speech:
-                return speech.read()
+                data = speech.read()
+            # Keep track of the last use across restarts
+            with suppress(OSError):
+                os.utime(voice_file)
+            return data
 
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[key]
+            if self.file_cache.pop(key, None) is not None:
+                self._file_cache_bytes -= self._file_sizes.pop(key, 0)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
+        if key in self.file_cache:
+            self.file_cache.move_to_end(key)
         self._async_store_to_memcache(key, filename, data)
 
     @callback
     def _async_store_to_memcache(self, key, filename, data):
-        """Store data to memcache and set timer to remove it."""
-        self.mem_cache[key] = {MEM_CACHE_FILENAME: filename, MEM_CACHE_VOICE: data}
+        """Store data to memcache and set timer to remove it.
+
+        The least recently used voices are removed when the memory size is
+        exceeded.
+        """
+        self._async_remove_from_memcache(key)
+        entry = self.mem_cache[key] = {
+            MEM_CACHE_FILENAME: filename,
+            MEM_CACHE_VOICE: data,
+        }
+        self._mem_cache_bytes += len(data)
+
+        while self._mem_cache_bytes > self.memory_size and len(self.mem_cache) > 1:
+            self._async_remove_from_memcache(next(iter(self.mem_cache)))
 
         @callback
         def async_remove_from_mem():
             """Cleanup memcache."""
-            self.mem_cache.pop(key, None)
+            if self.mem_cache.get(key) is entry:
+                self._async_remove_from_memcache(key)
 
         self.hass.loop.call_later(self.time_memory, async_remove_from_mem)
 
+    @callback
+    def _async_remove_from_memcache(self, key):
+        """Remove a voice from memcache."""
+        if (entry := self.mem_cache.pop(key, None)) is not None:
+            self._mem_cache_bytes -= len(entry[MEM_CACHE_VOICE])
+
     async def async_read_tts(self, filename):
         """Read a voice file and return binary.
 
@@ -476,6 +616,8 @@ class SpeechManager:
             if key not in self.file_cache:
                 raise HomeAssistantError(f"{key} not in cache!")
             await self.async_file_to_mem(key)
+        else:
+            self.mem_cache.move_to_end(key)
 
         content, _ = mimetypes.guess_type(filename)
         return content, self.mem_cache[key][MEM_CACHE_VOICE]
@@ -582,6 +724,16 @@ def _get_cache_files(cache_dir):
     return cache
 
 
+def _get_cache_file_stats(cache_dir, cache_files):
+    """Return the modification time and size of the cache files."""
+    stats = {}
+    for key, filename in cache_files.items():
+        with suppress(OSError):
+            stat = os.stat(os.path.join(cache_dir, filename))
+            stats[key] = (stat.st_mtime, stat.st_size)
+    return stats
+
+
 class TextToSpeechUrlView(HomeAssistantView):
     """TTS view to get a url to a generated speech file."""
 
@@ -19,7 +19,12 @@ from homeassistant.exceptions import (
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity,
+    startup_trace,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
@@ -49,12 +54,14 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_startup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
+    async_reg(hass, handle_supported_features)
     async_reg(hass, handle_test_condition)
     async_reg(hass, handle_unsubscribe_events)
 
@@ -305,6 +312,25 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/startup_trace"})
+@decorators.require_admin
+def handle_integration_startup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle startup trace command."""
+    tracer: startup_trace.StartupTracer | None = hass.data.get(
+        startup_trace.DATA_STARTUP_TRACE
+    )
+    if tracer is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "Startup tracing is not enabled"
+        )
+        return
+
+    connection.send_result(msg["id"], tracer.as_chrome_trace())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -314,6 +340,29 @@ def handle_ping(
     connection.send_message(pong_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "supported_features",
+        vol.Required("features"): vol.Schema(
+            {
+                vol.Optional(const.FEATURE_COALESCE_MESSAGES): vol.Coerce(int),
+                vol.Optional(const.FEATURE_COALESCE_WINDOW): vol.All(
+                    int, vol.Range(min=0, max=const.MAX_COALESCE_WINDOW)
+                ),
+            },
+            extra=vol.ALLOW_EXTRA,
+        ),
+    }
+)
+def handle_supported_features(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle setting the features the client supports."""
+    connection.supported_features = msg["features"]
+    connection.send_result(msg["id"])
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "render_template",
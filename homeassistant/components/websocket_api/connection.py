@@ -36,6 +36,17 @@ class ActiveConnection:
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
+        self.supported_features: dict[str, int] = {}
+
+    @property
+    def can_coalesce(self) -> bool:
+        """Return if the client accepts messages coalesced in a JSON array."""
+        return bool(self.supported_features.get(const.FEATURE_COALESCE_MESSAGES))
+
+    @property
+    def coalesce_window(self) -> float:
+        """Return the seconds to wait for more messages to coalesce."""
+        return self.supported_features.get(const.FEATURE_COALESCE_WINDOW, 0) / 1000
 
     def context(self, msg: dict[str, Any]) -> Context:
         """Return a context."""
@@ -27,6 +27,12 @@ PENDING_MSG_PEAK: Final = 512
 PENDING_MSG_PEAK_TIME: Final = 5
 MAX_PENDING_MSG: Final = 2048
 
+# Features a client can enable with the supported_features command
+FEATURE_COALESCE_MESSAGES: Final = "coalesce_messages"
+# Milliseconds to wait for more messages before sending coalesced messages
+FEATURE_COALESCE_WINDOW: Final = "coalesce_window"
+MAX_COALESCE_WINDOW: Final = 250
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_FOUND: Final = "not_found"
@@ -7,8 +7,9 @@ from contextlib import suppress
 import fnmatch
 from ipaddress import IPv6Address, ip_address
 import logging
+import re
 import socket
-from typing import Any, TypedDict, cast
+from typing import Any, Callable, TypedDict, cast
 
 import voluptuous as vol
 from zeroconf import InterfaceChoice, IPVersion, ServiceStateChange
@@ -53,6 +54,8 @@ DEFAULT_IPV6 = True
 HOMEKIT_PAIRED_STATUS_FLAG = "sf"
 HOMEKIT_MODEL = "md"
 
+_WILDCARD_RE = re.compile(r"[*?[]")
+
 MDNS_TARGET_IP = "224.0.0.251"
 
 # Property key=value has a max length of 255
@@ -300,6 +303,47 @@ class FlowDispatcher:
         )
 
 
+class HomeKitModels:
+    """Match HomeKit models against the models of the integrations.
+
+    Models are looked up by the model itself and by each of its prefixes
+    that is followed by a space or dash, only models with wildcards are
+    matched one by one.
+    """
+
+    def __init__(self, homekit_models: dict[str, str]) -> None:
+        """Compile the models."""
+        self._models: dict[str, tuple[int, str]] = {}
+        self._wildcard_models: list[tuple[int, Callable[[str], Any], str]] = []
+
+        for order, (test_model, domain) in enumerate(homekit_models.items()):
+            self._models[test_model] = (order, domain)
+            if _WILDCARD_RE.search(test_model):
+                self._wildcard_models.append(
+                    (order, re.compile(fnmatch.translate(test_model)).match, domain)
+                )
+
+    @callback
+    def async_match(self, model: str) -> str | None:
+        """Return the domain of the first integration matching the model."""
+        candidates = []
+
+        if match := self._models.get(model):
+            candidates.append(match)
+
+        for idx, char in enumerate(model):
+            if char in " -" and (match := self._models.get(model[:idx])):
+                candidates.append(match)
+
+        for order, matcher, domain in self._wildcard_models:
+            if matcher(model):
+                candidates.append((order, domain))
+
+        if not candidates:
+            return None
+        return min(candidates)[1]
+
+
 class ZeroconfDiscovery:
     """Discovery via zeroconf."""
 
@@ -315,7 +359,7 @@ class ZeroconfDiscovery:
         self.hass = hass
         self.zeroconf = zeroconf
         self.zeroconf_types = zeroconf_types
-        self.homekit_models = homekit_models
+        self.homekit_models = HomeKitModels(homekit_models)
         self.ipv6 = ipv6
 
         self.flow_dispatcher: FlowDispatcher | None = None
@@ -453,7 +497,7 @@ class ZeroconfDiscovery:
 
 
 def handle_homekit(
-    hass: HomeAssistant, homekit_models: dict[str, str], info: HaServiceInfo
+    hass: HomeAssistant, homekit_models: HomeKitModels, info: HaServiceInfo
 ) -> ZeroconfFlow | None:
     """Handle a HomeKit discovery.
 
@@ -470,21 +514,14 @@ def handle_homekit(
     if model is None:
         return None
 
-    for test_model in homekit_models:
-        if (
-            model != test_model
-            and not model.startswith((f"{test_model} ", f"{test_model}-"))
-            and not fnmatch.fnmatch(model, test_model)
-        ):
-            continue
-
-        return {
-            "domain": homekit_models[test_model],
-            "context": {"source": config_entries.SOURCE_HOMEKIT},
-            "data": info,
-        }
+    if (domain := homekit_models.async_match(model)) is None:
+        return None
 
-    return None
+    return {
+        "domain": domain,
+        "context": {"source": config_entries.SOURCE_HOMEKIT},
+        "data": info,
+    }
 
 
 def info_from_service(service: AsyncServiceInfo) -> HaServiceInfo | None:
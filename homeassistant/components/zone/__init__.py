@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import Any, cast
 
 import voluptuous as vol
@@ -18,10 +19,18 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_RADIUS,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_UNAVAILABLE,
 )
-from homeassistant.core import Event, HomeAssistant, ServiceCall, State, callback
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.helpers import (
     collection,
     config_validation as cv,
@@ -89,6 +98,149 @@ RELOAD_SERVICE_SCHEMA = vol.Schema({})
 STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
 
+DATA_ZONE_INDEX = "zone_index"
+
+# Size in degrees of the grid cells zones are indexed in
+ZONE_INDEX_CELL_SIZE = 0.1
+# Zones and lookups covering more cells than this are not indexed by cell
+ZONE_INDEX_MAX_CELLS = 64
+# Lower bound of the length of a degree latitude, and of a degree longitude
+# at the equator, in meters, with a margin for the ellipsoid
+METERS_PER_DEGREE = 110000
+# Zones closer to the poles than this are not indexed by cell
+ZONE_INDEX_MAX_LATITUDE = 85
+
+
+class ZoneIndex:
+    """Spatial index of the active zones.
+
+    Zones are indexed on a grid by the cells their bounding box covers, so a
+    lookup only measures the distance to the zones near the location. The
+    index is rebuilt on the first lookup after a zone state changed. Lookups
+    check that the zone states the index was built from are still current,
+    so states written directly to the state machine are picked up right away;
+    new zones are picked up once their state changed event is handled.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the zone index."""
+        self.hass = hass
+        self._valid = False
+        self._states: dict[str, State] = {}
+        self._zones: list[State] = []
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._unindexed: list[int] = []
+
+    @callback
+    def async_invalidate(self, event: Event | None = None) -> None:
+        """Rebuild the index on the next lookup."""
+        self._valid = False
+
+    @callback
+    def _async_build(self) -> None:
+        """Index the active zones, sorted by entity id for stable ties."""
+        self._states = {}
+        self._zones = []
+        self._cells = {}
+        self._unindexed = []
+
+        for entity_id in sorted(self.hass.states.async_entity_ids(DOMAIN)):
+            zone = self._states[entity_id] = cast(
+                State, self.hass.states.get(entity_id)
+            )
+            if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
+                continue
+
+            order = len(self._zones)
+            self._zones.append(zone)
+            cells = _cells_around(
+                zone.attributes.get(ATTR_LATITUDE),
+                zone.attributes.get(ATTR_LONGITUDE),
+                zone.attributes.get(ATTR_RADIUS),
+            )
+            if cells is None:
+                self._unindexed.append(order)
+                continue
+            for cell in cells:
+                self._cells.setdefault(cell, []).append(order)
+
+        self._valid = True
+
+    @callback
+    def async_candidates(
+        self, latitude: float, longitude: float, radius: float
+    ) -> list[State]:
+        """Return the zones that may contain the location in entity id order."""
+        if not self._valid or any(
+            self.hass.states.get(entity_id) is not state
+            for entity_id, state in self._states.items()
+        ):
+            self._async_build()
+
+        cells = _cells_around(latitude, longitude, radius)
+        if cells is None:
+            return self._zones
+
+        orders = set(self._unindexed)
+        for cell in cells:
+            orders.update(self._cells.get(cell, ()))
+        return [self._zones[order] for order in sorted(orders)]
+
+
+def _cells_around(
+    latitude: float | None, longitude: float | None, radius: float | None
+) -> list[tuple[int, int]] | None:
+    """Return the grid cells covered by a circle.
+
+    Returns None if the circle cannot be indexed by cell.
+    """
+    if latitude is None or longitude is None or radius is None:
+        return None
+
+    lat_span = radius / METERS_PER_DEGREE
+    max_latitude = abs(latitude) + lat_span
+    if max_latitude >= ZONE_INDEX_MAX_LATITUDE:
+        return None
+    lon_span = lat_span / math.cos(math.radians(max_latitude))
+
+    lat_cells = range(
+        math.floor((latitude - lat_span) / ZONE_INDEX_CELL_SIZE),
+        math.floor((latitude + lat_span) / ZONE_INDEX_CELL_SIZE) + 1,
+    )
+    lon_cells = range(
+        math.floor((longitude - lon_span) / ZONE_INDEX_CELL_SIZE),
+        math.floor((longitude + lon_span) / ZONE_INDEX_CELL_SIZE) + 1,
+    )
+    if len(lat_cells) * len(lon_cells) > ZONE_INDEX_MAX_CELLS:
+        return None
+
+    # Wrap around the antimeridian
+    lon_cell_count = round(360 / ZONE_INDEX_CELL_SIZE)
+    return [
+        (lat_cell, lon_cell % lon_cell_count)
+        for lat_cell in lat_cells
+        for lon_cell in lon_cells
+    ]
+
+
+@callback
+def _async_get_zone_index(hass: HomeAssistant) -> ZoneIndex:
+    """Return the zone index, tracking zone state changes."""
+    if DATA_ZONE_INDEX in hass.data:
+        return cast(ZoneIndex, hass.data[DATA_ZONE_INDEX])
+
+    index = hass.data[DATA_ZONE_INDEX] = ZoneIndex(hass)
+
+    @callback
+    def _async_zone_state_filter(event: Event) -> bool:
+        """Filter state changes of zones."""
+        return split_entity_id(event.data["entity_id"])[0] == DOMAIN
+
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED, index.async_invalidate, _async_zone_state_filter
+    )
+    return index
+
 
 @bind_hass
 def async_active_zone(
@@ -98,19 +250,14 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
+    # Candidates are sorted by entity ID so that we are deterministic if equal
+    # distance to 2 zones
+    zones = _async_get_zone_index(hass).async_candidates(latitude, longitude, radius)
 
     min_dist = None
     closest = None
 
     for zone in zones:
-        if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
-            continue
-
         zone_dist = distance(
             latitude,
             longitude,
@@ -333,6 +480,13 @@ class Zone(entity.Entity):
         self._generate_attrs()
         self.async_write_ha_state()
 
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and invalidate the zone index right away."""
+        super().async_write_ha_state()
+        if DATA_ZONE_INDEX in self.hass.data:
+            cast(ZoneIndex, self.hass.data[DATA_ZONE_INDEX]).async_invalidate()
+
     @callback
     def _generate_attrs(self) -> None:
         """Generate new attrs based on config."""
@@ -19,7 +19,7 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
     HomeAssistantError,
 )
-from homeassistant.helpers import device_registry, entity_registry
+from homeassistant.helpers import device_registry, entity_registry, startup_trace
 from homeassistant.helpers.event import Event
 from homeassistant.helpers.typing import (
     UNDEFINED,
@@ -301,7 +301,10 @@ class ConfigEntry:
         error_reason = None
 
         try:
-            result = await component.async_setup_entry(hass, self)  # type: ignore
+            with startup_trace.async_trace(
+                hass, startup_trace.PHASE_SETUP_ENTRY, integration.domain
+            ):
+                result = await component.async_setup_entry(hass, self)  # type: ignore
 
             if not isinstance(result, bool):
                 _LOGGER.error(
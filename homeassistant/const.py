@@ -660,6 +660,7 @@ HTTP_UNAUTHORIZED: Final = 401
 HTTP_FORBIDDEN: Final = 403
 HTTP_NOT_FOUND: Final = 404
 HTTP_METHOD_NOT_ALLOWED: Final = 405
+HTTP_REQUEST_ENTITY_TOO_LARGE: Final = 413
 HTTP_UNPROCESSABLE_ENTITY: Final = 422
 HTTP_TOO_MANY_REQUESTS: Final = 429
 HTTP_INTERNAL_SERVER_ERROR: Final = 500
@@ -220,6 +220,7 @@ class HomeAssistant:
         self._pending_tasks: list = []
         self._track_task = True
         self.bus = EventBus(self)
+        self.ticks = TickScheduler(self)
         self.services = ServiceRegistry(self)
         self.states = StateMachine(self.bus, self.loop)
         self.config = Config(self)
@@ -709,10 +710,16 @@ class EventBus:
 
         listeners = self._listeners.get(event_type, [])
 
+        if event_type == EVENT_TIME_CHANGED:
+            # Time changed events only go to their own listeners, internal
+            # periodic work runs from TickScheduler instead
+            if not listeners:
+                return
         # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        elif event_type != EVENT_HOMEASSISTANT_CLOSE:
+            match_all_listeners = self._listeners.get(MATCH_ALL)
+            if match_all_listeners is not None:
+                listeners = match_all_listeners + listeners
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
@@ -859,6 +866,47 @@ class EventBus:
             )
 
 
+class TickScheduler:
+    """Run callbacks on every tick of the timer, once a second.
+
+    Ticks are passed to the callbacks directly, without creating a time
+    changed event that every listener for all events would have to filter.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tick scheduler."""
+        self._jobs: list[HassJob] = []
+        self._hass = hass
+
+    @callback
+    def async_listen(self, target: Callable[[datetime.datetime], Any]) -> CALLBACK_TYPE:
+        """Run a callback with the time of every tick.
+
+        This method must be run in the event loop.
+        """
+        job = HassJob(target)
+        self._jobs.append(job)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._jobs.remove(job)
+
+        return remove_listener
+
+    @callback
+    def async_tick(self, now: datetime.datetime) -> None:
+        """Run the callbacks for a tick.
+
+        This method must be run in the event loop.
+        """
+        for job in list(self._jobs):
+            try:
+                self._hass.async_run_hass_job(job, now)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running tick callback %s", job)
+
+
 class State:
     """Object to represent a state within the state machine.
 
@@ -1786,6 +1834,7 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
+        hass.ticks.async_tick(now)
         hass.bus.async_fire(
             EVENT_TIME_CHANGED, {ATTR_NOW: now}, time_fired=now, context=timer_context
         )
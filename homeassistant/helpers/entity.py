@@ -30,7 +30,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import EntityPlatform
@@ -238,6 +238,15 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _added = False
 
+    # Set to True if name, icon, unit of measurement, device class and
+    # supported features never change for the lifetime of the entity. They
+    # are then only recalculated when the registry entry, customize config
+    # or unit system changes, and writes without changes return early.
+    _cache_static_attributes = False
+    _static_attributes_key: tuple[Any, ...] | None = None
+    _static_attributes: tuple[dict[str, Any], dict[str, Any]] | None = None
+    _last_write: tuple[str, dict[str, Any], State | None] | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_available: bool = True
@@ -505,20 +514,6 @@ class Entity(ABC):
                 extra_state_attributes = self.device_state_attributes
             attr.update(extra_state_attributes or {})
 
-        unit_of_measurement = self.unit_of_measurement
-        if unit_of_measurement is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        entry = self.registry_entry
-        # pylint: disable=consider-using-ternary
-        name = (entry and entry.name) or self.name
-        if name is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        icon = (entry and entry.icon) or self.icon
-        if icon is not None:
-            attr[ATTR_ICON] = icon
-
         entity_picture = self.entity_picture
         if entity_picture is not None:
             attr[ATTR_ENTITY_PICTURE] = entity_picture
@@ -527,13 +522,38 @@ class Entity(ABC):
         if assumed_state:
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        supported_features = self.supported_features
-        if supported_features is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+        if self._cache_static_attributes:
+            static_key = (
+                self.registry_entry,
+                self.hass.data.get(DATA_CUSTOMIZE),
+                self.hass.config.units,
+            )
+            if self._static_attributes_key != static_key:
+                self._static_attributes_key = static_key
+                self._static_attributes = (
+                    self._async_calculate_static_attributes(),
+                    self._async_customize_attributes(),
+                )
+                self._last_write = None
+            assert self._static_attributes is not None
+            static_attr, customize = self._static_attributes
 
-        device_class = self.device_class
-        if device_class is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
+            last_write = self._last_write
+            if (
+                last_write is not None
+                and not self.force_update
+                and last_write[0] == state
+                and last_write[1] == attr
+                and self.hass.states.get(self.entity_id) is last_write[2]
+            ):
+                return
+            raw_state = state
+            dynamic_attr = dict(attr)
+        else:
+            static_attr = self._async_calculate_static_attributes()
+            customize = self._async_customize_attributes()
+
+        attr.update(static_attr)
 
         end = timer()
 
@@ -549,8 +569,7 @@ class Entity(ABC):
             )
 
         # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+        attr.update(customize)
 
         # Convert temperature if we detect one
         try:
@@ -579,6 +598,59 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+        if self._cache_static_attributes:
+            self._last_write = (
+                raw_state,
+                dynamic_attr,
+                self.hass.states.get(self.entity_id),
+            )
+
+    @callback
+    def _async_calculate_static_attributes(self) -> dict[str, Any]:
+        """Calculate the attributes that rarely change."""
+        attr: dict[str, Any] = {}
+
+        unit_of_measurement = self.unit_of_measurement
+        if unit_of_measurement is not None:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        entry = self.registry_entry
+        # pylint: disable=consider-using-ternary
+        name = (entry and entry.name) or self.name
+        if name is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        icon = (entry and entry.icon) or self.icon
+        if icon is not None:
+            attr[ATTR_ICON] = icon
+
+        supported_features = self.supported_features
+        if supported_features is not None:
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        device_class = self.device_class
+        if device_class is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        return attr
+
+    @callback
+    def _async_customize_attributes(self) -> dict[str, Any]:
+        """Return the attributes set for this entity in the customize config."""
+        if DATA_CUSTOMIZE in self.hass.data:
+            return self.hass.data[DATA_CUSTOMIZE].get(self.entity_id)
+        return {}
+
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Recalculate the cached static attributes on the next write.
+
+        Only needed for entities that set _cache_static_attributes and
+        occasionally change one of the static attributes.
+        """
+        self._static_attributes_key = None
+        self._last_write = None
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Coroutine, Iterable
 from contextvars import ContextVar
-from datetime import datetime, timedelta
+from datetime import timedelta
 import logging
 from logging import Logger
 from types import ModuleType
@@ -39,11 +39,13 @@ from . import (
     config_validation as cv,
     device_registry as dev_reg,
     entity_registry as ent_reg,
+    polling,
     service,
+    startup_trace,
 )
 from .device_registry import DeviceRegistry
 from .entity_registry import DISABLED_INTEGRATION, EntityRegistry
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -102,7 +104,6 @@ class EntityPlatform:
         self._async_unsub_polling: CALLBACK_TYPE | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -241,7 +242,9 @@ class EntityPlatform:
             self.platform_name,
             SLOW_SETUP_WARNING,
         )
-        with async_start_setup(hass, [full_name]):
+        with async_start_setup(hass, [full_name]), startup_trace.async_trace(
+            hass, startup_trace.PHASE_PLATFORM_SETUP, full_name
+        ):
             try:
                 task = async_create_setup_task()
 
@@ -402,10 +405,8 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
+        self._async_unsub_polling = polling.async_get(self.hass).async_track_platform(
+            self
         )
 
     async def _async_add_entity(  # noqa: C901
@@ -585,6 +586,9 @@ class EntityPlatform:
         entity.async_on_remove(remove_entity_cb)
 
         await entity.add_to_platform_finish()
+        startup_trace.async_first_state_written(
+            self.hass, f"{self.domain}.{self.platform_name}"
+        )
 
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
@@ -678,35 +682,6 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
-
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
-
-        This method must be run in the event loop.
-        """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
-            return
-
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
-
-            if tasks:
-                await asyncio.gather(*tasks)
-
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
     "current_platform", default=None
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import fnmatch
+from functools import lru_cache
 import re
-from typing import Callable
+from typing import Any, Callable
 
 import voluptuous as vol
 
@@ -20,8 +21,29 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
 CONF_ENTITY_GLOBS = "entity_globs"
 
+# Number of entity ids a filter remembers its decision for
+FILTER_CACHE_SIZE = 16384
 
-def convert_filter(config: dict[str, list[str]]) -> Callable[[str], bool]:
+
+class EntityFilter:
+    """A compiled filter of entity ids.
+
+    The decision for an entity id is cached for as long as the filter lives,
+    a new filter is generated when the configuration changes.
+    """
+
+    def __init__(self, entity_filter: Callable[[str], bool]) -> None:
+        """Initialize the filter."""
+        self._filter = lru_cache(maxsize=FILTER_CACHE_SIZE)(entity_filter)
+        self.config: dict[str, Any] = {}
+        self.empty_filter = False
+
+    def __call__(self, entity_id: str) -> bool:
+        """Return true if the entity passes the filter."""
+        return self._filter(entity_id)
+
+
+def convert_filter(config: dict[str, list[str]]) -> EntityFilter:
     """Convert the filter schema into a filter."""
     filt = generate_filter(
         config[CONF_INCLUDE_DOMAINS],
@@ -31,8 +53,8 @@ def convert_filter(config: dict[str, list[str]]) -> Callable[[str], bool]:
         config[CONF_INCLUDE_ENTITY_GLOBS],
         config[CONF_EXCLUDE_ENTITY_GLOBS],
     )
-    setattr(filt, "config", config)
-    setattr(filt, "empty_filter", sum(len(val) for val in config.values()) == 0)
+    filt.config = config
+    filt.empty_filter = sum(len(val) for val in config.values()) == 0
     return filt
 
 
@@ -60,7 +82,7 @@ FILTER_SCHEMA = vol.All(BASE_FILTER_SCHEMA, convert_filter)
 
 def convert_include_exclude_filter(
     config: dict[str, dict[str, list[str]]]
-) -> Callable[[str], bool]:
+) -> EntityFilter:
     """Convert the include exclude filter schema into a filter."""
     include = config[CONF_INCLUDE]
     exclude = config[CONF_EXCLUDE]
@@ -74,7 +96,7 @@ def convert_include_exclude_filter(
             CONF_EXCLUDE_ENTITIES: exclude[CONF_ENTITIES],
         }
     )
-    setattr(filt, "config", config)
+    filt.config = config
     return filt
 
 
@@ -104,18 +126,13 @@ INCLUDE_EXCLUDE_FILTER_SCHEMA = vol.All(
 )
 
 
-def _glob_to_re(glob: str) -> re.Pattern[str]:
-    """Translate and compile glob string into pattern."""
-    return re.compile(fnmatch.translate(glob))
-
-
-def _test_against_patterns(patterns: list[re.Pattern[str]], entity_id: str) -> bool:
-    """Test entity against list of patterns, true if any match."""
-    for pattern in patterns:
-        if pattern.match(entity_id):
-            return True
-
-    return False
+def _convert_globs_to_pattern(globs: set[str]) -> re.Pattern[str] | None:
+    """Translate and compile glob strings into a single pattern."""
+    if not globs:
+        return None
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(glob)})" for glob in sorted(globs))
+    )
 
 
 # It's safe since we don't modify it. And None causes typing warnings
@@ -127,17 +144,29 @@ def generate_filter(
     exclude_entities: list[str],
     include_entity_globs: list[str] = [],
     exclude_entity_globs: list[str] = [],
-) -> Callable[[str], bool]:
-    """Return a function that will filter entities based on the args."""
-    include_d = set(include_domains)
-    include_e = set(include_entities)
-    exclude_d = set(exclude_domains)
-    exclude_e = set(exclude_entities)
-    include_eg_set = set(include_entity_globs)
-    exclude_eg_set = set(exclude_entity_globs)
-    include_eg = list(map(_glob_to_re, include_eg_set))
-    exclude_eg = list(map(_glob_to_re, exclude_eg_set))
+) -> EntityFilter:
+    """Return a filter that will filter entities based on the args."""
+    return EntityFilter(
+        _generate_filter_from_sets_and_pattern_lists(
+            set(include_domains),
+            set(include_entities),
+            set(exclude_domains),
+            set(exclude_entities),
+            _convert_globs_to_pattern(set(include_entity_globs)),
+            _convert_globs_to_pattern(set(exclude_entity_globs)),
+        )
+    )
 
+
+def _generate_filter_from_sets_and_pattern_lists(
+    include_d: set[str],
+    include_e: set[str],
+    exclude_d: set[str],
+    exclude_e: set[str],
+    include_eg: re.Pattern[str] | None,
+    exclude_eg: re.Pattern[str] | None,
+) -> Callable[[str], bool]:
+    """Generate a filter from pre-computed sets and patterns."""
     have_exclude = bool(exclude_e or exclude_d or exclude_eg)
     have_include = bool(include_e or include_d or include_eg)
 
@@ -146,7 +175,7 @@ def generate_filter(
         return (
             entity_id in include_e
             or domain in include_d
-            or bool(include_eg and _test_against_patterns(include_eg, entity_id))
+            or bool(include_eg and include_eg.match(entity_id))
         )
 
     def entity_excluded(domain: str, entity_id: str) -> bool:
@@ -154,7 +183,7 @@ def generate_filter(
         return (
             entity_id in exclude_e
             or domain in exclude_d
-            or bool(exclude_eg and _test_against_patterns(exclude_eg, entity_id))
+            or bool(exclude_eg and exclude_eg.match(entity_id))
         )
 
     # Case 1 - no includes or excludes - pass all entities
@@ -196,11 +225,9 @@ def generate_filter(
             if domain in include_d:
                 return not (
                     entity_id in exclude_e
-                    or bool(
-                        exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-                    )
+                    or bool(exclude_eg and exclude_eg.match(entity_id))
                 )
-            if _test_against_patterns(include_eg, entity_id):
+            if include_eg and include_eg.match(entity_id):
                 return not entity_excluded(domain, entity_id)
             return entity_id in include_e
 
@@ -218,9 +245,7 @@ def generate_filter(
         def entity_filter_4b(entity_id: str) -> bool:
             """Return filter function for case 4b."""
             domain = split_entity_id(entity_id)[0]
-            if domain in exclude_d or (
-                exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-            ):
+            if domain in exclude_d or (exclude_eg and exclude_eg.match(entity_id)):
                 return entity_id in include_e
             return entity_id not in exclude_e
 
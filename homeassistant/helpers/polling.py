@@ -0,0 +1,238 @@
+"""Central scheduler for polling entities."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import heapq
+import itertools
+from timeit import default_timer as timer
+from typing import TYPE_CHECKING
+import zlib
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from . import event
+
+if TYPE_CHECKING:
+    from .entity import Entity
+    from .entity_platform import EntityPlatform
+
+DATA_POLLING_SCHEDULER = "polling_scheduler"
+
+# The polls of a platform are spread over this fraction of its scan interval
+POLLING_SPREAD = 0.5
+MAX_POLLING_SPREAD = timedelta(minutes=5)
+
+# Number of slots the entities of a platform are divided into
+POLLING_SLOTS = 10
+
+# Number of polls of a single platform that are allowed to run at the same
+# time. Platforms can override this with POLLING_CONCURRENCY, 0 is unlimited
+# so PARALLEL_UPDATES stays the only limit by default.
+DEFAULT_POLLING_CONCURRENCY = 0
+
+
+@dataclass
+class EntityPollingStats:
+    """Statistics about the polling of a single entity."""
+
+    updates: int = 0
+    overruns: int = 0
+    last_duration: float | None = None
+    max_duration: float = 0.0
+
+
+@callback
+def polling_slot(entity_id: str) -> int:
+    """Return the polling slot of an entity.
+
+    The slot is derived from the entity id so it is stable across restarts.
+    """
+    return zlib.crc32(entity_id.encode()) % POLLING_SLOTS
+
+
+class PlatformPolling:
+    """Poll the entities of a single entity platform."""
+
+    def __init__(self, scheduler: PollingScheduler, platform: EntityPlatform) -> None:
+        """Initialize the platform polling."""
+        self.scheduler = scheduler
+        self.platform = platform
+        self.interval = platform.scan_interval
+        self.active = True
+        concurrency = getattr(
+            platform.platform, "POLLING_CONCURRENCY", DEFAULT_POLLING_CONCURRENCY
+        )
+        self.budget: asyncio.Semaphore | None = (
+            asyncio.Semaphore(concurrency) if concurrency else None
+        )
+        self._slots: dict[str, int] = {}
+        self._running: set[str] = set()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling and forget the statistics of the entities."""
+        self.active = False
+        for entity_id in self._slots:
+            self.scheduler.stats.pop(entity_id, None)
+        self._slots.clear()
+
+    @callback
+    def async_poll_slot(self, slot: int) -> None:
+        """Start polling the entities of the platform in a slot."""
+        platform = self.platform
+
+        for entity_id in [
+            entity_id
+            for entity_id, entity_slot in self._slots.items()
+            if entity_slot == slot and entity_id not in platform.entities
+        ]:
+            del self._slots[entity_id]
+            self.scheduler.stats.pop(entity_id, None)
+
+        for entity_id, entity in list(platform.entities.items()):
+            if not entity.should_poll:
+                continue
+
+            entity_slot = self._slots.get(entity_id)
+            if entity_slot is None:
+                entity_slot = self._slots[entity_id] = polling_slot(entity_id)
+            if entity_slot != slot:
+                continue
+
+            if entity_id in self._running:
+                self.scheduler.async_get_stats(entity_id).overruns += 1
+                platform.logger.warning(
+                    "Updating %s took longer than the scheduled update interval %s",
+                    entity_id,
+                    self.interval,
+                )
+                continue
+
+            self._running.add(entity_id)
+            self.scheduler.hass.async_create_task(self._async_poll(entity))
+
+    async def _async_poll(self, entity: Entity) -> None:
+        """Poll an entity within the concurrency budget of the platform."""
+        entity_id = entity.entity_id
+        try:
+            if self.budget is None:
+                await self._async_update(entity_id, entity)
+            else:
+                async with self.budget:
+                    await self._async_update(entity_id, entity)
+        finally:
+            self._running.discard(entity_id)
+
+    async def _async_update(self, entity_id: str, entity: Entity) -> None:
+        """Update an entity and record how long it took."""
+        stats = self.scheduler.async_get_stats(entity_id)
+        start = timer()
+        try:
+            await entity.async_update_ha_state(True)
+        finally:
+            duration = timer() - start
+            stats.updates += 1
+            stats.last_duration = duration
+            stats.max_duration = max(stats.max_duration, duration)
+
+
+class PollingScheduler:
+    """Schedule the polls of all entity platforms.
+
+    The entities of a platform are divided into slots that are spread over
+    the first part of the scan interval, so platforms with the same interval
+    do not poll all their entities at the same moment. All slots share a
+    single timer.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        self.stats: dict[str, EntityPollingStats] = {}
+        self._queue: list[tuple[datetime, int, PlatformPolling, int]] = []
+        self._sequence = itertools.count()
+        self._unsub_wakeup: CALLBACK_TYPE | None = None
+        self._wakeup_at: datetime | None = None
+
+    @callback
+    def async_get_stats(self, entity_id: str) -> EntityPollingStats:
+        """Return the polling statistics of an entity."""
+        stats = self.stats.get(entity_id)
+        if stats is None:
+            stats = self.stats[entity_id] = EntityPollingStats()
+        return stats
+
+    @callback
+    def async_track_platform(self, platform: EntityPlatform) -> CALLBACK_TYPE:
+        """Start polling the entities of a platform."""
+        polling = PlatformPolling(self, platform)
+        interval = polling.interval
+        spread = min(interval * POLLING_SPREAD, MAX_POLLING_SPREAD)
+        now = dt_util.utcnow()
+
+        for slot in range(POLLING_SLOTS):
+            self._async_push(
+                now + interval - spread * slot / POLLING_SLOTS, polling, slot
+            )
+        self._async_schedule_wakeup()
+
+        @callback
+        def async_untrack_platform() -> None:
+            """Stop polling the entities of the platform."""
+            polling.async_stop()
+
+        return async_untrack_platform
+
+    @callback
+    def _async_push(self, due: datetime, polling: PlatformPolling, slot: int) -> None:
+        """Queue the next poll of a slot."""
+        heapq.heappush(self._queue, (due, next(self._sequence), polling, slot))
+
+    @callback
+    def _async_schedule_wakeup(self) -> None:
+        """Arm the timer for the first slot that is due."""
+        due = self._queue[0][0] if self._queue else None
+
+        if due == self._wakeup_at:
+            return
+
+        if self._unsub_wakeup is not None:
+            self._unsub_wakeup()
+            self._unsub_wakeup = None
+
+        self._wakeup_at = due
+        if due is not None:
+            self._unsub_wakeup = event.async_track_point_in_utc_time(
+                self.hass, self._async_wakeup, due
+            )
+
+    @callback
+    def _async_wakeup(self, _: datetime) -> None:
+        """Poll all slots that are due."""
+        self._unsub_wakeup = None
+        self._wakeup_at = None
+        now = event.time_tracker_utcnow()
+        queue = self._queue
+
+        while queue and queue[0][0] <= now:
+            due, _counter, polling, slot = heapq.heappop(queue)
+            if not polling.active:
+                continue
+            polling.async_poll_slot(slot)
+            # Keep the phase of the slot, skipping polls that were missed
+            missed = (now - due) // polling.interval
+            self._async_push(due + polling.interval * (missed + 1), polling, slot)
+
+        self._async_schedule_wakeup()
+
+
+@callback
+def async_get(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler."""
+    scheduler: PollingScheduler | None = hass.data.get(DATA_POLLING_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_POLLING_SCHEDULER] = PollingScheduler(hass)
+    return scheduler
@@ -0,0 +1,73 @@
+"""Index of the entities, devices and areas that entities reference."""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+from homeassistant.core import callback
+
+REFERENCE_ENTITY = "entity"
+REFERENCE_DEVICE = "device"
+REFERENCE_AREA = "area"
+
+# What an item references, a set of ids for each kind of reference
+ReferencesType = Dict[str, "set[str]"]
+
+
+class ReferenceIndex:
+    """Look up the entities that reference an entity, device or area.
+
+    Items are added when their entity is added to Home Assistant and removed
+    when it is removed, which covers reloads as well. What an item references
+    is only resolved when the index is first used after it was added.
+    """
+
+    def __init__(self, get_references: Callable[[Any], ReferencesType]) -> None:
+        """Initialize the index."""
+        self._get_references = get_references
+        # Items that were added since the index was last used
+        self._pending: dict[str, Any] = {}
+        self._references: dict[str, ReferencesType] = {}
+        # The entities referencing an id, in the order they were added
+        self._index: dict[tuple[str, str], dict[str, None]] = {}
+
+    @callback
+    def async_add(self, entity_id: str, item: Any) -> None:
+        """Add the item of an entity."""
+        self.async_remove(entity_id)
+        self._pending[entity_id] = item
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove the item of an entity."""
+        self._pending.pop(entity_id, None)
+        if (references := self._references.pop(entity_id, None)) is None:
+            return
+
+        for kind, referenced_ids in references.items():
+            for referenced_id in referenced_ids:
+                key = (kind, referenced_id)
+                referencing = self._index[key]
+                del referencing[entity_id]
+                if not referencing:
+                    del self._index[key]
+
+    @callback
+    def _async_index_pending(self) -> None:
+        """Index what the added items reference."""
+        pending = self._pending
+        self._pending = {}
+        for entity_id, item in pending.items():
+            references = self._references[entity_id] = {
+                kind: set(referenced_ids)
+                for kind, referenced_ids in self._get_references(item).items()
+            }
+            for kind, referenced_ids in references.items():
+                for referenced_id in referenced_ids:
+                    self._index.setdefault((kind, referenced_id), {})[entity_id] = None
+
+    @callback
+    def async_referencing(self, kind: str, referenced_id: str) -> list[str]:
+        """Return the entities that reference an entity, device or area."""
+        if self._pending:
+            self._async_index_pending()
+        return list(self._index.get((kind, referenced_id), ()))
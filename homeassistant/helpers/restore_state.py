@@ -28,11 +28,16 @@ DATA_RESTORE_STATE_TASK = "restore_state_task"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_KEY_CHANGES = "core.restore_state.changes"
 STORAGE_VERSION = 1
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between rewriting all states, periodic dumps in between only write
+# the states that changed since the last full dump
+STATE_COMPACT_INTERVAL = timedelta(hours=24)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -89,6 +94,26 @@ class RestoreStateData:
                 }
                 _LOGGER.debug("Created cache with %s", list(data.last_states))
 
+            try:
+                changed_states = await data.changes_store.async_load()
+            except HomeAssistantError as exc:
+                _LOGGER.error("Error loading changed states", exc_info=exc)
+                changed_states = None
+
+            for item in changed_states or ():
+                entity_id = item["state"]["entity_id"]
+                if not valid_entity_id(entity_id):
+                    continue
+                changed = StoredState.from_dict(item)
+                stored = data.last_states.get(entity_id)
+                # Changes written before the last full dump are outdated
+                if stored is None or changed.last_seen > stored.last_seen:
+                    data.last_states[entity_id] = changed
+
+            if changed_states:
+                # Fold the changes into the next full dump
+                data._changes_saved = True  # pylint: disable=protected-access
+
             if hass.state == CoreState.running:
                 data.async_setup_dump()
             else:
@@ -112,8 +137,18 @@ class RestoreStateData:
         self.store: Store = Store(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.changes_store: Store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_CHANGES, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entity_ids: set[str] = set()
+        # The state objects as they were last written to storage
+        self._persisted: dict[str, State] = {}
+        # The states written to the changes store since the last full dump
+        self._changes: dict[str, dict[str, Any]] = {}
+        self._changes_saved = False
+        self._last_full_dump: datetime | None = None
+        self._full_dump_size = 0
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -160,27 +195,78 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
+            if self._changes_saved:
+                self._changes = {}
+                self._changes_saved = False
+                await self.changes_store.async_save([])
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._persisted = {
+            stored_state.state.entity_id: stored_state.state
+            for stored_state in stored_states
+        }
+        self._last_full_dump = dt_util.utcnow()
+        self._full_dump_size = len(stored_states)
+
+    @callback
+    def _async_full_dump_due(self) -> bool:
+        """Return if the changed states should be folded into a full dump."""
+        return (
+            self._last_full_dump is None
+            or dt_util.utcnow() - self._last_full_dump >= STATE_COMPACT_INTERVAL
+            or len(self._changes) > self._full_dump_size // 2
+        )
+
+    async def async_dump_changed_states(self) -> None:
+        """Save the states that changed since they were last saved.
+
+        Unchanged states are left untouched on disk. All states are written
+        again when the changes grow too large or the last full dump is older
+        than STATE_COMPACT_INTERVAL.
+        """
+        if self._async_full_dump_due():
+            await self.async_dump_states()
+            return
+
+        persisted = self._persisted
+        changed = False
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            if persisted.get(state.entity_id) is state:
+                continue
+            self._changes[state.entity_id] = stored_state.as_dict()
+            persisted[state.entity_id] = state
+            changed = True
+
+        if not changed:
+            _LOGGER.debug("No changed states to dump")
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(self._changes))
+        self._changes_saved = True
+        try:
+            await self.changes_store.async_save(list(self._changes.values()))
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
         async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+            await self.async_dump_changed_states()
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
-        self.hass.async_create_task(_async_dump_states())
+        self.hass.async_create_task(self.async_dump_states())
 
         # Dump states periodically
         cancel_interval = async_track_time_interval(
@@ -189,7 +275,7 @@ class RestoreStateData:
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_changed_states()
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
@@ -0,0 +1,205 @@
+"""Trace where the time goes while Home Assistant starts.
+
+Tracing is opt-in. When enabled, the phases of setting up every integration
+and platform are recorded until Home Assistant has started, together with
+the executor jobs they run. The trace uses the Chrome trace event format so
+it can be opened with chrome://tracing or Perfetto.
+"""
+from __future__ import annotations
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+from typing import Any, Callable, TypeVar
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import Event, HomeAssistant, callback
+
+DATA_STARTUP_TRACE = "startup_trace"
+
+PHASE_IMPORT = "import"
+PHASE_CONFIG_VALIDATION = "config_validation"
+PHASE_REQUIREMENTS = "requirements"
+PHASE_SETUP = "setup"
+PHASE_SETUP_ENTRY = "setup_entry"
+PHASE_PLATFORM_SETUP = "platform_setup"
+PHASE_FIRST_STATE_WRITE = "first_state_write"
+PHASE_EXECUTOR_WAIT = "executor_wait"
+PHASE_EXECUTOR_JOB = "executor_job"
+
+# Jobs and phases that do not belong to an integration
+CORE_COMPONENT = "homeassistant"
+
+_PID = 1
+
+T = TypeVar("T")
+
+# The integration or platform whose phase is currently running
+_current_component: ContextVar[str] = ContextVar(
+    "startup_trace_component", default=CORE_COMPONENT
+)
+
+
+class StartupTracer:
+    """Record the phases of setting up integrations."""
+
+    def __init__(self) -> None:
+        """Initialize the tracer."""
+        self.active = True
+        self.events: list[dict[str, Any]] = []
+        self._start = time.perf_counter()
+        # Each integration and platform gets its own row in the trace
+        self._tids: dict[str, int] = {}
+        self._first_state_written: set[str] = set()
+
+    def _timestamp(self, perf_counter: float | None = None) -> float:
+        """Return microseconds since tracing started."""
+        if perf_counter is None:
+            perf_counter = time.perf_counter()
+        return round((perf_counter - self._start) * 1_000_000, 1)
+
+    def _tid(self, component: str) -> int:
+        """Return the row of an integration or platform."""
+        if (tid := self._tids.get(component)) is None:
+            tid = self._tids[component] = len(self._tids) + 1
+        return tid
+
+    def _add_event(
+        self,
+        phase: str,
+        component: str,
+        start: float,
+        end: float | None = None,
+        **args: Any,
+    ) -> None:
+        """Add an event, a duration event when it has an end."""
+        event: dict[str, Any] = {
+            "name": phase,
+            "cat": component,
+            "ph": "i" if end is None else "X",
+            "ts": self._timestamp(start),
+            "pid": _PID,
+            "tid": self._tid(component),
+        }
+        if end is None:
+            event["s"] = "t"
+        else:
+            event["dur"] = self._timestamp(end) - event["ts"]
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    @contextmanager
+    def trace(self, phase: str, component: str) -> Generator[None, None, None]:
+        """Trace a phase of setting up an integration or platform."""
+        token = _current_component.set(component)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            _current_component.reset(token)
+            if self.active:
+                self._add_event(phase, component, start, time.perf_counter())
+
+    @callback
+    def async_first_state_written(self, component: str) -> None:
+        """Mark the first state written by an integration or platform."""
+        if component in self._first_state_written:
+            return
+        self._first_state_written.add(component)
+        self._add_event(PHASE_FIRST_STATE_WRITE, component, time.perf_counter())
+
+    @callback
+    def async_wrap_executor_job(self, target: Callable[..., T]) -> Callable[..., T]:
+        """Wrap an executor job to trace how long it waited and ran."""
+        component = _current_component.get()
+        job = getattr(target, "__qualname__", None) or repr(target)
+        # Reserve the row in the event loop, the job runs in another thread
+        self._tid(component)
+        submitted = time.perf_counter()
+
+        def _traced_job(*args: Any) -> T:
+            started = time.perf_counter()
+            try:
+                return target(*args)
+            finally:
+                if self.active:
+                    self._add_event(
+                        PHASE_EXECUTOR_WAIT, component, submitted, started, job=job
+                    )
+                    self._add_event(
+                        PHASE_EXECUTOR_JOB,
+                        component,
+                        started,
+                        time.perf_counter(),
+                        job=job,
+                    )
+
+        return _traced_job
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the trace in the Chrome trace event format."""
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": _PID,
+                "tid": tid,
+                "args": {"name": component},
+            }
+            for component, tid in list(self._tids.items())
+        ]
+        return {
+            "traceEvents": [*metadata, *self.events],
+            "displayTimeUnit": "ms",
+        }
+
+
+@callback
+def async_enable(hass: HomeAssistant) -> StartupTracer:
+    """Trace the startup of Home Assistant until it has started."""
+    tracer = hass.data[DATA_STARTUP_TRACE] = StartupTracer()
+    loop = hass.loop
+    run_in_executor = loop.run_in_executor
+
+    def _traced_run_in_executor(
+        executor: Any, func: Callable[..., T], *args: Any
+    ) -> Any:
+        """Trace jobs on the default executor."""
+        if executor is None and tracer.active:
+            func = tracer.async_wrap_executor_job(func)
+        return run_in_executor(executor, func, *args)
+
+    loop.run_in_executor = _traced_run_in_executor  # type: ignore[assignment]
+
+    @callback
+    def _async_stop_tracing(event: Event) -> None:
+        """Stop tracing once Home Assistant has started."""
+        tracer.active = False
+        del loop.run_in_executor
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_stop_tracing)
+    return tracer
+
+
+@contextmanager
+def async_trace(
+    hass: HomeAssistant, phase: str, component: str
+) -> Generator[None, None, None]:
+    """Trace a phase of setting up an integration if tracing is enabled."""
+    tracer: StartupTracer | None = hass.data.get(DATA_STARTUP_TRACE)
+    if tracer is None or not tracer.active:
+        yield
+        return
+
+    with tracer.trace(phase, component):
+        yield
+
+
+@callback
+def async_first_state_written(hass: HomeAssistant, component: str) -> None:
+    """Mark the first state written by a platform if tracing is enabled."""
+    tracer: StartupTracer | None = hass.data.get(DATA_STARTUP_TRACE)
+    if tracer is not None and tracer.active:
+        tracer.async_first_state_written(component)
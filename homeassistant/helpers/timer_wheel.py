@@ -0,0 +1,193 @@
+"""Timer wheel that coalesces timers into a single event loop timer."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Callable
+
+from homeassistant.core import callback
+
+# Slot of timers that are due and about to run
+_DUE = -1
+
+
+class WheelTimer:
+    """A timer scheduled on a timer wheel."""
+
+    __slots__ = ("wheel", "when", "sequence", "target", "args", "slot")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        when: float,
+        target: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Initialize the timer."""
+        self.wheel = wheel
+        self.when = when
+        self.sequence = 0
+        self.target = target
+        self.args = args
+        self.slot: int | None = None
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        self.wheel.async_remove(self)
+
+    @callback
+    def reschedule(self, when: float) -> None:
+        """Move the timer to a new point in time."""
+        self.wheel.async_remove(self)
+        self.when = when
+        self.wheel.async_add(self)
+
+
+class TimerWheel:
+    """Schedule timers in one second slots that share a single loop timer.
+
+    Adding, cancelling and rescheduling a timer only touches the set of its
+    slot, so timers that are re-armed on every state change do not leave
+    cancelled handles behind on the event loop. The loop timer is armed for
+    the earliest timer and all timers that are due when it fires are run.
+
+    Times are timestamps as returned by time.time(), the current time is
+    taken from the utcnow function so it can be controlled in tests.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, utcnow: Callable[[], float]
+    ) -> None:
+        """Initialize the timer wheel."""
+        self._loop = loop
+        self._utcnow = utcnow
+        self._slots: dict[int, set[WheelTimer]] = {}
+        # Heap of the slots that have timers, each slot is in it at most once
+        self._queue: list[int] = []
+        self._queued: set[int] = set()
+        self._sequence = itertools.count()
+        self._handle: asyncio.TimerHandle | None = None
+        self._armed_at: float | None = None
+        self.pending = 0
+
+    @callback
+    def async_schedule(
+        self, when: float, target: Callable[..., Any], *args: Any
+    ) -> WheelTimer:
+        """Call target with args once the time is at or past when."""
+        timer = WheelTimer(self, when, target, args)
+        self.async_add(timer)
+        return timer
+
+    @callback
+    def async_add(self, timer: WheelTimer) -> None:
+        """Add a timer to its slot."""
+        slot = int(timer.when)
+        timers = self._slots.get(slot)
+        if timers is None:
+            timers = self._slots[slot] = set()
+            if slot not in self._queued:
+                self._queued.add(slot)
+                heapq.heappush(self._queue, slot)
+
+        timer.slot = slot
+        timer.sequence = next(self._sequence)
+        timers.add(timer)
+        self.pending += 1
+
+        if self._armed_at is None or timer.when < self._armed_at:
+            self._async_arm(timer.when)
+
+    @callback
+    def async_remove(self, timer: WheelTimer) -> None:
+        """Remove a timer from its slot.
+
+        The loop timer is left armed, it finds nothing to do if it was armed
+        for this timer.
+        """
+        if timer.slot is None:
+            return
+        if timer.slot == _DUE:
+            timer.slot = None
+            return
+
+        timers = self._slots[timer.slot]
+        timers.discard(timer)
+        if not timers:
+            del self._slots[timer.slot]
+        timer.slot = None
+        self.pending -= 1
+
+    @callback
+    def _async_arm(self, when: float) -> None:
+        """Arm the loop timer for a point in time."""
+        if self._handle is not None:
+            self._handle.cancel()
+
+        self._armed_at = when
+        self._handle = self._loop.call_at(
+            self._loop.time() + when - time.time(), self._async_fire
+        )
+
+    @callback
+    def _async_arm_next(self) -> None:
+        """Arm the loop timer for the earliest timer."""
+        queue = self._queue
+        while queue and queue[0] not in self._slots:
+            self._queued.discard(heapq.heappop(queue))
+
+        if queue:
+            self._async_arm(min(timer.when for timer in self._slots[queue[0]]))
+        elif self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+            self._armed_at = None
+
+    @callback
+    def _async_fire(self) -> None:
+        """Run the timers that are due."""
+        self._handle = None
+        self._armed_at = None
+        now = self._utcnow()
+        queue = self._queue
+        due: list[WheelTimer] = []
+
+        # Depending on the available clock support (including timer hardware
+        # and the OS kernel) it can happen that we fire a little bit too early
+        # as measured by utcnow(). Timers that are not due yet stay in their
+        # slot and the loop timer is armed again for them.
+        while queue and queue[0] <= now:
+            slot = queue[0]
+            timers = self._slots.get(slot)
+            if timers:
+                for timer in [timer for timer in timers if timer.when <= now]:
+                    timers.remove(timer)
+                    timer.slot = _DUE
+                    due.append(timer)
+                if timers:
+                    break
+                del self._slots[slot]
+            self._queued.discard(heapq.heappop(queue))
+
+        self.pending -= len(due)
+        # Timers added by the targets wait for the next time the loop timer fires
+        self._async_arm_next()
+
+        due.sort(key=lambda timer: (timer.when, timer.sequence))
+        for timer in due:
+            # A timer can be cancelled by a timer that ran before it
+            if timer.slot != _DUE:
+                continue
+            timer.slot = None
+            try:
+                timer.target(*timer.args)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._loop.call_exception_handler(
+                    {
+                        "message": f"Exception in timer {timer.target!r}",
+                        "exception": exc,
+                    }
+                )
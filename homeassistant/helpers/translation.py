@@ -4,9 +4,13 @@ from __future__ import annotations
 import asyncio
 from collections import ChainMap
 import logging
+import os
 from typing import Any
 
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
 from homeassistant.loader import (
     MAX_LOAD_CONCURRENTLY,
     Integration,
@@ -25,6 +29,10 @@ TRANSLATION_LOAD_LOCK = "translation_load_lock"
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
 LOCALE_EN = "en"
 
+STORAGE_KEY = "core.translations"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+
 
 def recursive_flatten(prefix: Any, data: dict[str, Any]) -> dict[str, Any]:
     """Return a flattened representation of dict data."""
@@ -147,6 +155,21 @@ def _build_resources(
     }
 
 
+def _get_translation_mtimes(
+    translation_files: dict[str, str | None]
+) -> dict[str, float | None]:
+    """Return the modification times of translation files."""
+    mtimes: dict[str, float | None] = {}
+    for component, translation_file in translation_files.items():
+        try:
+            mtimes[component] = (
+                os.path.getmtime(translation_file) if translation_file else None
+            )
+        except OSError:
+            mtimes[component] = None
+    return mtimes
+
+
 async def async_get_component_strings(
     hass: HomeAssistant, language: str, components: set[str]
 ) -> dict[str, Any]:
@@ -201,6 +224,67 @@ async def async_get_component_strings(
     return translations
 
 
+class _TranslationBundle:
+    """Flattened translations of a language, persisted across restarts.
+
+    The translations of each component are stored with a stamp of the
+    integration and the modification time of the translation file. A
+    component is only loaded and flattened again when its stamp changes. The
+    whole bundle is discarded when Home Assistant is updated.
+    """
+
+    def __init__(self, hass: HomeAssistant, language: str) -> None:
+        """Initialize the bundle."""
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{language}")
+        self._components: dict[str, dict[str, Any]] | None = None
+
+    async def async_load(self) -> None:
+        """Load the bundle from storage."""
+        if self._components is not None:
+            return
+        try:
+            data = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Error loading translation bundle: %s", err)
+            data = None
+        if (
+            not isinstance(data, dict)
+            or data.get("ha_version") != __version__
+            or not isinstance(data.get("components"), dict)
+        ):
+            data = {"components": {}}
+        self._components = data["components"]
+
+    @callback
+    def async_get(
+        self, component: str, stamp: list[Any]
+    ) -> dict[str, dict[str, dict[str, Any]]] | None:
+        """Return the flattened translations of a component if still valid."""
+        assert self._components is not None
+        cached = self._components.get(component)
+        if cached is None or cached["stamp"] != stamp:
+            return None
+        resources: dict[str, dict[str, dict[str, Any]]] = cached["resources"]
+        return resources
+
+    @callback
+    def async_set(
+        self,
+        component: str,
+        stamp: list[Any],
+        resources: dict[str, dict[str, dict[str, Any]]],
+    ) -> None:
+        """Store the flattened translations of a component."""
+        assert self._components is not None
+        self._components[component] = {"stamp": stamp, "resources": resources}
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"ha_version": __version__, "components": self._components}
+
+
 class _TranslationCache:
     """Cache for flattened translations."""
 
@@ -209,6 +293,7 @@ class _TranslationCache:
         self.hass = hass
         self.loaded: dict[str, set[str]] = {}
         self.cache: dict[str, dict[str, dict[str, Any]]] = {}
+        self.bundles: dict[str, _TranslationBundle] = {}
 
     async def async_fetch(
         self,
@@ -235,49 +320,123 @@ class _TranslationCache:
         )
         # Fetch the English resources, as a fallback for missing keys
         languages = [LOCALE_EN] if language == LOCALE_EN else [LOCALE_EN, language]
-        for translation_strings in await asyncio.gather(
-            *(
-                async_get_component_strings(self.hass, lang, components)
-                for lang in languages
-            )
+        for resources in await asyncio.gather(
+            *(self._async_get_resources(lang, components) for lang in languages)
         ):
-            self._build_category_cache(language, components, translation_strings)
+            self._build_category_cache(language, resources)
 
         self.loaded[language].update(components)
 
+    async def _async_get_resources(
+        self, language: str, components: set[str]
+    ) -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
+        """Return the flattened translations of components in a language.
+
+        Translations are taken from the bundle if they did not change.
+        """
+        bundle = self.bundles.get(language)
+        if bundle is None:
+            bundle = self.bundles[language] = _TranslationBundle(self.hass, language)
+
+        stamps, _ = await asyncio.gather(
+            self._async_get_stamps(language, components), bundle.async_load()
+        )
+
+        resources = {}
+        components_to_load = set()
+        for component in components:
+            cached = bundle.async_get(component, stamps[component])
+            if cached is None:
+                components_to_load.add(component)
+            else:
+                resources[component] = cached
+
+        if not components_to_load:
+            return resources
+
+        translation_strings = await async_get_component_strings(
+            self.hass, language, components_to_load
+        )
+        for component in components_to_load:
+            resources[component] = _flatten_resources(
+                component, translation_strings.get(component, {})
+            )
+            bundle.async_set(component, stamps[component], resources[component])
+
+        return resources
+
+    async def _async_get_stamps(
+        self, language: str, components: set[str]
+    ) -> dict[str, list[Any]]:
+        """Return the stamps that the translations of components depend on."""
+        domains = list({component.split(".")[-1] for component in components})
+        integrations = dict(
+            zip(
+                domains,
+                await gather_with_concurrency(
+                    MAX_LOAD_CONCURRENTLY,
+                    *(async_get_integration(self.hass, domain) for domain in domains),
+                ),
+            )
+        )
+        mtimes = await self.hass.async_add_executor_job(
+            _get_translation_mtimes,
+            {
+                component: component_translation_path(
+                    component, language, integrations[component.split(".")[-1]]
+                )
+                for component in components
+            },
+        )
+        stamps = {}
+        for component in components:
+            integration = integrations[component.split(".")[-1]]
+            stamps[component] = [
+                str(integration.version) if integration.version else None,
+                integration.name,
+                mtimes[component],
+            ]
+        return stamps
+
     @callback
     def _build_category_cache(
         self,
         language: str,
-        components: set[str],
-        translation_strings: dict[str, dict[str, Any]],
+        resources: dict[str, dict[str, dict[str, dict[str, Any]]]],
     ) -> None:
-        """Extract resources into the cache."""
+        """Extract flattened resources into the cache."""
         cached = self.cache.setdefault(language, {})
-        categories: set[str] = set()
-        for resource in translation_strings.values():
-            categories.update(resource)
 
-        for category in categories:
-            resource_func = (
-                _merge_resources if category == "state" else _build_resources
-            )
-            new_resources = resource_func(translation_strings, components, category)
-
-            for component, resource in new_resources.items():
-                category_cache: dict[str, Any] = cached.setdefault(
-                    component, {}
-                ).setdefault(category, {})
-
-                if isinstance(resource, dict):
-                    category_cache.update(
-                        recursive_flatten(
-                            f"component.{component}.{category}.",
-                            resource,
-                        )
-                    )
-                else:
-                    category_cache[f"component.{component}.{category}"] = resource
+        for component_resources in resources.values():
+            for component, categories in component_resources.items():
+                component_cache = cached.setdefault(component, {})
+                for category, flattened in categories.items():
+                    component_cache.setdefault(category, {}).update(flattened)
+
+
+def _flatten_resources(
+    component: str, translation_strings: dict[str, Any]
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Flatten the categories of the translations of a component.
+
+    Returns the flattened categories for each component they apply to, state
+    translations of a platform are merged into its domain.
+    """
+    flattened: dict[str, dict[str, dict[str, Any]]] = {}
+    strings = {component: translation_strings}
+
+    for category in translation_strings:
+        resource_func = _merge_resources if category == "state" else _build_resources
+        for target, resource in resource_func(strings, {component}, category).items():
+            if not resource:
+                continue
+            if isinstance(resource, dict):
+                flat = recursive_flatten(f"component.{target}.{category}.", resource)
+            else:
+                flat = {f"component.{target}.{category}": resource}
+            flattened.setdefault(target, {})[category] = flat
+
+    return flattened
 
 
 @bind_hass
@@ -14,6 +14,7 @@ import json
 import logging
 import pathlib
 import sys
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
 
@@ -28,7 +29,6 @@ from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.usb import USB
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
-from homeassistant.util.async_ import gather_with_concurrency
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -45,6 +45,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_CUSTOM_MANIFESTS = "custom_manifests"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -58,6 +59,23 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+# Index of the manifests of all built-in integrations, generated by hassfest
+BUILTIN_MANIFESTS_PATH = pathlib.Path(__file__).parent / "generated/manifests.json"
+BUILTIN_COMPONENTS_PATH = pathlib.Path(__file__).parent / "components"
+
+# Manifests of custom integrations, validated with the stamp of their file
+CUSTOM_MANIFESTS_STORAGE_KEY = "core.custom_manifests"
+CUSTOM_MANIFESTS_STORAGE_VERSION = 1
+CUSTOM_MANIFESTS_SAVE_DELAY = 10
+
+# Integration modules imported by the previous run with their import time
+IMPORTS_STORAGE_KEY = "core.integration_imports"
+IMPORTS_STORAGE_VERSION = 1
+IMPORTS_SAVE_DELAY = 60
+DATA_IMPORTS = "integration_imports"
+
+_BUILTIN_MANIFESTS: dict[str, Manifest] | None = None
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -112,34 +130,73 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    store = Store(hass, CUSTOM_MANIFESTS_STORAGE_VERSION, CUSTOM_MANIFESTS_STORAGE_KEY)
+    stored = await store.async_load()
+    cached: dict[str, Any] = cast(Dict[str, Any], stored)["manifests"] if stored else {}
+
+    integrations, manifests = await hass.async_add_executor_job(
+        _resolve_custom_components, hass, custom_components, cached
     )
 
-    integrations = await gather_with_concurrency(
-        MAX_LOAD_CONCURRENTLY,
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
+    if manifests != cached:
+        store.async_delay_save(
+            lambda: {"manifests": manifests}, CUSTOM_MANIFESTS_SAVE_DELAY
+        )
+
+    return integrations
+
+
+def _resolve_custom_components(
+    hass: HomeAssistant, root_module: ModuleType, cached: dict[str, Any]
+) -> tuple[dict[str, Integration], dict[str, Any]]:
+    """Resolve the custom integrations.
+
+    Manifests are only read again when the stamp of their file differs from
+    the cached one. Returns the integrations and the manifests to cache.
+    """
+    integrations: dict[str, Integration] = {}
+    manifests: dict[str, Any] = {}
+
+    for path in root_module.__path__:  # type: ignore
+        for entry in pathlib.Path(path).iterdir():
+            # The first integration found for a domain is used
+            if entry.name in integrations or not entry.is_dir():
+                continue
+
+            manifest_path = entry / "manifest.json"
+            try:
+                stat = manifest_path.stat()
+            except OSError:
+                continue
+
+            key = str(manifest_path)
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            if (cached_entry := cached.get(key)) and cached_entry["stamp"] == stamp:
+                manifest = cached_entry["manifest"]
+            else:
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except (OSError, ValueError) as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+            manifests[key] = {"stamp": stamp, "manifest": manifest}
+            integration = Integration.from_manifest(
+                hass,
+                root_module,
+                entry.name,
+                manifest_path,
+                cast(Manifest, dict(manifest)),
             )
-            for comp in dirs
-        ),
-    )
+            if integration is not None:
+                integrations[integration.domain] = integration
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    return integrations, manifests
 
 
 async def async_get_custom_components(
@@ -311,40 +368,52 @@ class Integration:
                 )
                 continue
 
-            integration = cls(
-                hass,
-                f"{root_module.__name__}.{domain}",
-                manifest_path.parent,
-                manifest,
-            )
+            return cls.from_manifest(hass, root_module, domain, manifest_path, manifest)
 
-            if integration.is_built_in:
-                return integration
+        return None
 
-            _LOGGER.warning(CUSTOM_WARNING, integration.domain)
-            try:
-                AwesomeVersion(
-                    integration.version,
-                    [
-                        AwesomeVersionStrategy.CALVER,
-                        AwesomeVersionStrategy.SEMVER,
-                        AwesomeVersionStrategy.SIMPLEVER,
-                        AwesomeVersionStrategy.BUILDVER,
-                        AwesomeVersionStrategy.PEP440,
-                    ],
-                )
-            except AwesomeVersionException:
-                _LOGGER.error(
-                    "The custom integration '%s' does not have a "
-                    "valid version key (%s) in the manifest file and was blocked from loading. "
-                    "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
-                    integration.domain,
-                    integration.version,
-                )
-                return None
+    @classmethod
+    def from_manifest(
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_path: pathlib.Path,
+        manifest: Manifest,
+    ) -> Integration | None:
+        """Create an integration from a manifest of a root module."""
+        integration = cls(
+            hass,
+            f"{root_module.__name__}.{domain}",
+            manifest_path.parent,
+            manifest,
+        )
+
+        if integration.is_built_in:
             return integration
 
-        return None
+        _LOGGER.warning(CUSTOM_WARNING, integration.domain)
+        try:
+            AwesomeVersion(
+                integration.version,
+                [
+                    AwesomeVersionStrategy.CALVER,
+                    AwesomeVersionStrategy.SEMVER,
+                    AwesomeVersionStrategy.SIMPLEVER,
+                    AwesomeVersionStrategy.BUILDVER,
+                    AwesomeVersionStrategy.PEP440,
+                ],
+            )
+        except AwesomeVersionException:
+            _LOGGER.error(
+                "The custom integration '%s' does not have a "
+                "valid version key (%s) in the manifest file and was blocked from loading. "
+                "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
+                integration.domain,
+                integration.version,
+            )
+            return None
+        return integration
 
     def __init__(
         self,
@@ -513,7 +582,7 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = _import_module(self.hass, self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -526,7 +595,7 @@ class Integration:
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return _import_module(self.hass, f"{self.pkg_path}.{platform_name}")
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -579,6 +648,15 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
+    if manifest := (await _async_get_builtin_manifests(hass)).get(domain):
+        # The manifest is copied as the integration adds keys to it
+        return Integration(
+            hass,
+            f"{PACKAGE_BUILTIN}.{domain}",
+            pathlib.Path(components.__file__).parent / domain,
+            cast(Manifest, dict(manifest)),
+        )
+
     if integration := await hass.async_add_executor_job(
         Integration.resolve_from_root, hass, components, domain
     ):
@@ -587,6 +665,153 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
     raise IntegrationNotFound(domain)
 
 
+async def _async_get_builtin_manifests(hass: HomeAssistant) -> dict[str, Manifest]:
+    """Return the index of the manifests of the built-in integrations."""
+    global _BUILTIN_MANIFESTS  # pylint: disable=global-statement
+
+    if _BUILTIN_MANIFESTS is not None:
+        return _BUILTIN_MANIFESTS
+
+    manifests: dict[str, Manifest] = await hass.async_add_executor_job(
+        _load_builtin_manifests
+    )
+    _BUILTIN_MANIFESTS = manifests
+    return manifests
+
+
+def _load_builtin_manifests() -> dict[str, Manifest]:
+    """Load the index of the manifests of the built-in integrations.
+
+    Integrations missing from the index, or with a manifest file that changed
+    after the index was generated, are resolved from their manifest file.
+    """
+    try:
+        index_mtime = BUILTIN_MANIFESTS_PATH.stat().st_mtime
+        manifests = cast(
+            Dict[str, Manifest], json.loads(BUILTIN_MANIFESTS_PATH.read_text())
+        )
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Unable to load the index of built-in integrations: %s", err)
+        return {}
+
+    stale = []
+    for domain in manifests:
+        manifest_path = BUILTIN_COMPONENTS_PATH / domain / "manifest.json"
+        with suppress(OSError):
+            if manifest_path.stat().st_mtime <= index_mtime:
+                continue
+        stale.append(domain)
+
+    if stale:
+        _LOGGER.warning(
+            "The index of built-in integrations is out of date for %s, "
+            "run python3 -m script.hassfest to update it",
+            ", ".join(stale),
+        )
+        for domain in stale:
+            del manifests[domain]
+
+    return manifests
+
+
+class ModuleImports:
+    """Track how long it takes to import the modules of integrations."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        # The modules that have been used, with the seconds their import took
+        self.used: dict[str, float] = {}
+        # The modules imported in the background before they were used
+        self.prewarmed: dict[str, float] = {}
+
+
+def _get_module_imports(hass: HomeAssistant) -> ModuleImports:
+    """Return the module import tracker."""
+    if (imports := hass.data.get(DATA_IMPORTS)) is None:
+        imports = hass.data[DATA_IMPORTS] = ModuleImports()
+    return cast(ModuleImports, imports)
+
+
+def _import_module(hass: HomeAssistant, name: str) -> ModuleType:
+    """Import a module of an integration and track how long it took."""
+    imports = _get_module_imports(hass)
+    if name in sys.modules:
+        module = importlib.import_module(name)
+        imports.used.setdefault(name, imports.prewarmed.get(name, 0))
+        return module
+
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    imports.used[name] = elapsed = time.perf_counter() - start
+    try:
+        in_event_loop = asyncio.get_running_loop() is hass.loop
+    except RuntimeError:
+        in_event_loop = False
+    if in_event_loop:
+        _LOGGER.debug("Imported %s in the event loop in %.3f seconds", name, elapsed)
+    return module
+
+
+def _prewarm_imports(imports: ModuleImports, names: list[str]) -> None:
+    """Import modules that are not imported yet."""
+    for name in names:
+        if name in sys.modules:
+            continue
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception as err:  # pylint: disable=broad-except
+            # Requirements may not be installed yet, it is imported again
+            # when it is used and errors are reported then.
+            _LOGGER.debug("Unable to import %s ahead of setup: %s", name, err)
+            continue
+        imports.prewarmed[name] = time.perf_counter() - start
+
+
+async def async_prewarm_imports(hass: HomeAssistant, names: set[str]) -> None:
+    """Import modules that will be needed in a background thread.
+
+    The modules the previous run used are imported as well, the slowest
+    first, so setting up integrations does not import them in the event loop.
+    Which modules are used and how long their import took is stored when Home
+    Assistant has started and when it stops.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.const import (
+        EVENT_HOMEASSISTANT_STARTED,
+        EVENT_HOMEASSISTANT_STOP,
+    )
+    from homeassistant.core import Event, callback
+    from homeassistant.helpers.storage import Store
+
+    imports = _get_module_imports(hass)
+    store = Store(hass, IMPORTS_STORAGE_VERSION, IMPORTS_STORAGE_KEY)
+    stored = await store.async_load()
+    previous: dict[str, float] = (
+        cast(Dict[str, Any], stored)["modules"] if stored else {}
+    )
+
+    if hass.config.safe_mode:
+        previous = {
+            name: seconds
+            for name, seconds in previous.items()
+            if not name.startswith(f"{PACKAGE_CUSTOM_COMPONENTS}.")
+        }
+
+    to_import = sorted(
+        names | previous.keys(), key=lambda name: previous.get(name, 0), reverse=True
+    )
+    hass.async_add_executor_job(_prewarm_imports, imports, to_import)
+
+    @callback
+    def _async_save_imports(event: Event) -> None:
+        """Store the modules that have been used."""
+        store.async_delay_save(lambda: {"modules": imports.used}, IMPORTS_SAVE_DELAY)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_imports)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_imports)
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -763,6 +988,21 @@ async def _async_component_dependencies(
         if start_domain in dep_integration.after_dependencies:
             raise CircularDependency(start_domain, dependency_domain)
 
+        # Reuse the dependencies of integrations that were resolved before
+        # instead of walking their dependencies again
+        if (
+            dep_integration.all_dependencies_resolved
+            and await dep_integration.resolve_dependencies()
+        ):
+            for sub_domain in dep_integration.all_dependencies - loaded:
+                if sub_domain in loading:
+                    raise CircularDependency(dependency_domain, sub_domain)
+                sub_integration = await async_get_integration(hass, sub_domain)
+                if start_domain in sub_integration.after_dependencies:
+                    raise CircularDependency(start_domain, sub_domain)
+                loaded.add(sub_domain)
+            continue
+
         if dep_integration.dependencies:
             dep_loaded = await _async_component_dependencies(
                 hass, start_domain, dep_integration, loaded, loading
@@ -8,12 +8,18 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import Callable, TypeVar
 
-from homeassistant import core
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+
+from homeassistant import auth, core
+from homeassistant.components.http.auth import setup_auth
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.helpers import device_registry, entity_registry
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
@@ -368,6 +374,42 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def filtering_entity_id_glob_heavy(hass):
+    """Run a million state changes of 10k entities through a glob heavy filter."""
+    domains = ["sensor", "binary_sensor", "switch", "light", "input_boolean"]
+    suffixes = ["temperature", "humidity", "contact", "motion", "battery", "power"]
+    config = {
+        "include": {
+            "domains": ["automation", "script"],
+            "entity_globs": [
+                f"{domain}.*_{suffix}" for domain in domains for suffix in suffixes
+            ],
+            "entities": [],
+        },
+        "exclude": {
+            "domains": ["input_number"],
+            "entity_globs": [f"{domain}.test_*" for domain in domains],
+            "entities": [],
+        },
+    }
+
+    entity_ids = [
+        f"{domains[i % len(domains)]}.room_{i}_{suffixes[i % 7 % len(suffixes)]}"
+        for i in range(10 ** 4)
+    ]
+
+    entities_filter = convert_include_exclude_filter(config)
+    size = len(entity_ids)
+
+    start = timer()
+
+    for i in range(10 ** 6):
+        entities_filter(entity_ids[i % size])
+
+    return timer() - start
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
@@ -390,6 +432,186 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def auth_middleware_bearer_token(hass):
+    """Authenticate 100k requests with the same bearer token."""
+    requests_to_send = 10 ** 5
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await device_registry.async_load(hass)
+        await entity_registry.async_load(hass)
+        hass.auth = await auth.auth_manager_from_config(hass, [], [])
+        user = await hass.auth.async_create_user("Benchmark")
+        refresh_token = await hass.auth.async_create_refresh_token(
+            user, client_id="https://example.com/"
+        )
+        access_token = hass.auth.async_create_access_token(refresh_token)
+
+        app = web.Application()
+        setup_auth(hass, app)
+        middleware = app.middlewares[-1]
+        request = make_mocked_request(
+            "GET", "/api/", headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        async def handler(request):
+            """Return an empty response."""
+            return web.Response()
+
+        start = timer()
+
+        for _ in range(requests_to_send):
+            await middleware(request, handler)
+
+        return timer() - start
+
+
+@benchmark
+async def stream_keyframe_image(hass):
+    """Convert 100 keyframes of a local sample video to JPEG images."""
+    # pylint: disable=import-outside-toplevel
+    import os
+
+    import av
+    import numpy as np
+
+    from homeassistant.components.stream.core import KeyFrameConverter
+
+    keyframes = 100
+
+    with TemporaryDirectory() as tmp_dir:
+        video_path = os.path.join(tmp_dir, "sample.mp4")
+        with av.open(video_path, "w") as container:
+            stream = container.add_stream("libx264", rate=25)
+            stream.width = 1280
+            stream.height = 720
+            stream.pix_fmt = "yuv420p"
+            stream.options = {"g": "25"}
+            for frame_i in range(keyframes * 25):
+                img = np.zeros((720, 1280, 3), dtype=np.uint8)
+                img[:, :, 0] = frame_i % 256
+                frame = av.VideoFrame.from_ndarray(img, format="rgb24")
+                for packet in stream.encode(frame):
+                    container.mux(packet)
+            for packet in stream.encode(None):
+                container.mux(packet)
+
+        with av.open(video_path) as container:
+            video_stream = container.streams.video[0]
+            converter = KeyFrameConverter(hass)
+            converter.create_decoder(video_stream)
+            packets = [
+                av.Packet(bytes(packet))
+                for packet in container.demux(video_stream)
+                if packet.is_keyframe and packet.size
+            ]
+
+        start = timer()
+
+        for packet in packets:
+            converter.packet = packet
+            await converter.async_get_image()
+
+        return timer() - start
+
+
+@benchmark
+async def websocket_messages(hass):
+    """Send bursts of state changes to 50 websocket clients, a frame each."""
+    return await _websocket_messages(hass, False)
+
+
+@benchmark
+async def websocket_messages_coalesced(hass):
+    """Send bursts of state changes to 50 websocket clients, coalesced."""
+    return await _websocket_messages(hass, True)
+
+
+async def _websocket_messages(hass, coalesce):
+    """Send bursts of state changes to 50 websocket clients over localhost."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from types import SimpleNamespace
+
+    import aiohttp
+
+    from homeassistant.components.websocket_api.http import WebSocketHandler
+    from homeassistant.components.websocket_api.messages import cached_event_message
+
+    clients = 50
+    # Like turning on a group of 40 lights
+    bursts = 100
+    burst_size = 40
+    messages_per_client = bursts * burst_size
+    handlers = []
+    all_connected = asyncio.Event()
+
+    async def handle(request):
+        """Write the queued messages to a client."""
+        handler = WebSocketHandler(hass, request)
+        wsock = handler.wsock = web.WebSocketResponse()
+        await wsock.prepare(request)
+        handler._connection = SimpleNamespace(can_coalesce=coalesce, coalesce_window=0)
+        handlers.append(handler)
+        if len(handlers) == clients:
+            all_connected.set()
+        await handler._writer()
+        return wsock
+
+    async def receive(wsock):
+        """Receive the messages of a client."""
+        received = 0
+        while received < messages_per_client:
+            data = json.loads((await wsock.receive()).data)
+            received += len(data) if isinstance(data, list) else 1
+
+    app = web.Application()
+    app.router.add_get("/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    async with aiohttp.ClientSession() as session:
+        wsocks = await asyncio.gather(
+            *(session.ws_connect(f"http://127.0.0.1:{port}/") for _ in range(clients))
+        )
+        await all_connected.wait()
+        receivers = [asyncio.create_task(receive(wsock)) for wsock in wsocks]
+
+        start = timer()
+
+        for burst in range(bursts):
+            for light in range(burst_size):
+                event = core.Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": f"light.group_{light}",
+                        "new_state": core.State(
+                            f"light.group_{light}", "on" if burst % 2 else "off"
+                        ),
+                    },
+                )
+                for handler in handlers:
+                    handler._send_message(cached_event_message(1, event))
+            # Let the writers catch up before the next burst
+            while any(handler._to_write.qsize() for handler in handlers):
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*receivers)
+        runtime = timer() - start
+
+        # Stop the writers first so the server answers the close handshakes
+        for handler in handlers:
+            handler._to_write.put_nowait(None)
+        await asyncio.gather(*(wsock.close() for wsock in wsocks))
+
+    await runner.cleanup()
+
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -0,0 +1,130 @@
+"""Script to fetch the startup trace of a running Home Assistant."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict
+import json
+import os
+from typing import Any
+
+import aiohttp
+import yarl
+
+from homeassistant.helpers.startup_trace import (
+    PHASE_EXECUTOR_JOB,
+    PHASE_EXECUTOR_WAIT,
+    PHASE_FIRST_STATE_WRITE,
+)
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+# Phases that overlap with the phase that runs them
+NESTED_PHASES = {PHASE_EXECUTOR_WAIT, PHASE_EXECUTOR_JOB}
+
+
+class StartupTraceError(Exception):
+    """Error fetching the startup trace."""
+
+
+def run(args):
+    """Handle startup trace commandline script."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Fetch the startup trace of Home Assistant started with --trace-startup"
+            " and write it as a Chrome trace."
+        )
+    )
+    parser.add_argument("--script", choices=["startup_trace"])
+    parser.add_argument(
+        "--url",
+        default="http://localhost:8123",
+        help="URL of Home Assistant (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("HASS_TOKEN"),
+        help="Long-lived access token of an admin user, defaults to $HASS_TOKEN",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="startup_trace.json",
+        help="File to write the trace to (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of the slowest integrations to print (default: %(default)s)",
+    )
+
+    args = parser.parse_args(args)
+
+    if not args.token:
+        print("An access token is required, pass --token or set HASS_TOKEN")
+        return 1
+
+    try:
+        trace = asyncio.run(fetch_trace(args.url, args.token))
+    except (aiohttp.ClientError, StartupTraceError) as err:
+        print("Unable to fetch the startup trace:", err)
+        return 1
+
+    with open(args.output, "w") as fp:
+        json.dump(trace, fp)
+
+    print(f"Wrote startup trace to {args.output}")
+    print()
+    print_report(trace, args.top)
+    return 0
+
+
+async def fetch_trace(url: str, token: str) -> dict[str, Any]:
+    """Fetch the startup trace over the websocket API."""
+    ws_url = yarl.URL(url).with_path("/api/websocket")
+    async with aiohttp.ClientSession() as session, session.ws_connect(
+        ws_url
+    ) as websocket:
+        await websocket.receive_json()
+        await websocket.send_json({"type": "auth", "access_token": token})
+        msg = await websocket.receive_json()
+        if msg["type"] != "auth_ok":
+            raise StartupTraceError(msg.get("message", "Authentication failed"))
+
+        await websocket.send_json({"id": 1, "type": "integration/startup_trace"})
+        msg = await websocket.receive_json()
+        if not msg["success"]:
+            raise StartupTraceError(msg["error"]["message"])
+        return msg["result"]
+
+
+def summarize(trace: dict[str, Any]) -> dict[str, dict[str, float]]:
+    """Return the seconds spent in each phase per integration and platform."""
+    phases: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for event in trace["traceEvents"]:
+        if event["ph"] == "X":
+            phases[event["cat"]][event["name"]] += event["dur"] / 1_000_000
+        elif event["name"] == PHASE_FIRST_STATE_WRITE:
+            phases[event["cat"]][event["name"]] = event["ts"] / 1_000_000
+    return phases
+
+
+def print_report(trace: dict[str, Any], top: int) -> None:
+    """Print the integrations and platforms that took the longest."""
+    phases = summarize(trace)
+
+    def total(component: str) -> float:
+        return sum(
+            seconds
+            for phase, seconds in phases[component].items()
+            if phase not in NESTED_PHASES and phase != PHASE_FIRST_STATE_WRITE
+        )
+
+    for component in sorted(phases, key=total, reverse=True)[:top]:
+        print(f"{component}: {total(component):.2f}s")
+        for phase, seconds in sorted(phases[component].items()):
+            if phase == PHASE_FIRST_STATE_WRITE:
+                print(f"  {phase}: at {seconds:.2f}s")
+            else:
+                print(f"  {phase}: {seconds:.2f}s")
@@ -18,6 +18,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import CALLBACK_TYPE
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import startup_trace
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util, ensure_unique_string
 
@@ -204,7 +205,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with startup_trace.async_trace(hass, startup_trace.PHASE_IMPORT, domain):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -212,9 +214,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with startup_trace.async_trace(hass, startup_trace.PHASE_CONFIG_VALIDATION, domain):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -237,38 +240,40 @@ async def _async_setup_component(
 
         task = None
         result = True
-        try:
-            if hasattr(component, "async_setup"):
-                task = component.async_setup(hass, processed_config)  # type: ignore
-            elif hasattr(component, "setup"):
-                # This should not be replaced with hass.async_add_executor_job because
-                # we don't want to track this task in case it blocks startup.
-                task = hass.loop.run_in_executor(
-                    None, component.setup, hass, processed_config  # type: ignore
+        with startup_trace.async_trace(hass, startup_trace.PHASE_SETUP, domain):
+            try:
+                if hasattr(component, "async_setup"):
+                    task = component.async_setup(hass, processed_config)  # type: ignore
+                elif hasattr(component, "setup"):
+                    # This should not be replaced with hass.async_add_executor_job
+                    # because we don't want to track this task in case it blocks
+                    # startup.
+                    task = hass.loop.run_in_executor(
+                        None, component.setup, hass, processed_config  # type: ignore
+                    )
+                elif not hasattr(component, "async_setup_entry"):
+                    log_error("No setup or config entry setup function defined.")
+                    return False
+
+                if task:
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
+            except asyncio.TimeoutError:
+                _LOGGER.error(
+                    "Setup of %s is taking longer than %s seconds."
+                    " Startup will proceed without waiting any longer",
+                    domain,
+                    SLOW_SETUP_MAX_WAIT,
                 )
-            elif not hasattr(component, "async_setup_entry"):
-                log_error("No setup or config entry setup function defined.")
                 return False
-
-            if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
-        except asyncio.TimeoutError:
-            _LOGGER.error(
-                "Setup of %s is taking longer than %s seconds."
-                " Startup will proceed without waiting any longer",
-                domain,
-                SLOW_SETUP_MAX_WAIT,
-            )
-            return False
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception("Error during setup of component %s", domain)
-            async_notify_setup_error(hass, domain, integration.documentation)
-            return False
-        finally:
-            end = timer()
-            if warn_task:
-                warn_task.cancel()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error during setup of component %s", domain)
+                async_notify_setup_error(hass, domain, integration.documentation)
+                return False
+            finally:
+                end = timer()
+                if warn_task:
+                    warn_task.cancel()
         _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
 
         if result is False:
@@ -332,7 +337,8 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        with startup_trace.async_trace(hass, startup_trace.PHASE_IMPORT, platform_path):
+            platform = integration.get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -377,10 +383,13 @@ async def async_process_deps_reqs(
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+        with startup_trace.async_trace(
+            hass, startup_trace.PHASE_REQUIREMENTS, integration.domain
+        ):
+            async with hass.timeout.async_freeze(integration.domain):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
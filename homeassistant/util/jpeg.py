@@ -0,0 +1,85 @@
+"""JPEG utilities.
+
+Scaling needs PyTurboJPEG, so it can only be used by integrations that have
+it in their requirements.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, cast
+
+SUPPORTED_SCALING_FACTORS = [(7, 8), (3, 4), (5, 8), (1, 2), (3, 8), (1, 4), (1, 8)]
+
+_LOGGER = logging.getLogger(__name__)
+
+JPEG_QUALITY = 75
+
+if TYPE_CHECKING:
+    from turbojpeg import TurboJPEG
+
+
+def scale_jpeg_image(content: bytes, width: int, height: int) -> bytes:
+    """Scale a JPEG image as close as possible to one of the supported scaling factors."""
+    turbo_jpeg = TurboJPEGSingleton.instance()
+    if not turbo_jpeg:
+        return content
+
+    try:
+        (current_width, current_height, _, _) = turbo_jpeg.decode_header(content)
+    except OSError:
+        return content
+
+    if current_width <= width or current_height <= height:
+        return content
+
+    ratio = width / current_width
+
+    scaling_factor = SUPPORTED_SCALING_FACTORS[-1]
+    for supported_sf in SUPPORTED_SCALING_FACTORS:
+        if ratio >= (supported_sf[0] / supported_sf[1]):
+            scaling_factor = supported_sf
+            break
+
+    return cast(
+        bytes,
+        turbo_jpeg.scale_with_quality(
+            content,
+            scaling_factor=scaling_factor,
+            quality=JPEG_QUALITY,
+        ),
+    )
+
+
+class TurboJPEGSingleton:
+    """
+    Load TurboJPEG only once.
+
+    Ensures we do not log load failures each snapshot
+    since camera image fetches happen every few
+    seconds.
+    """
+
+    __instance = None
+
+    @staticmethod
+    def instance() -> TurboJPEG:
+        """Singleton for TurboJPEG."""
+        if TurboJPEGSingleton.__instance is None:
+            TurboJPEGSingleton()
+        return TurboJPEGSingleton.__instance
+
+    def __init__(self) -> None:
+        """Try to create TurboJPEG only once."""
+        try:
+            # TurboJPEG checks for libturbojpeg
+            # when its created, but it imports
+            # numpy which may or may not work so
+            # we have to guard the import here.
+            from turbojpeg import TurboJPEG  # pylint: disable=import-outside-toplevel
+
+            TurboJPEGSingleton.__instance = TurboJPEG()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "Error loading libturbojpeg; Cameras may impact HomeKit performance"
+            )
+            TurboJPEGSingleton.__instance = False
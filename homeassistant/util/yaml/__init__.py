@@ -2,7 +2,7 @@
 from .const import SECRET_YAML
 from .dumper import dump, save_yaml
 from .input import UndefinedSubstitution, extract_inputs, substitute
-from .loader import Secrets, load_yaml, parse_yaml, secret_yaml
+from .loader import Secrets, clear_parse_cache, load_yaml, parse_yaml, secret_yaml
 from .objects import Input
 
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
     "dump",
     "save_yaml",
     "Secrets",
+    "clear_parse_cache",
     "load_yaml",
     "secret_yaml",
     "parse_yaml",
@@ -3,14 +3,26 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from collections.abc import Iterator
+import copy
+from dataclasses import dataclass
 import fnmatch
+import io
 import logging
 import os
 from pathlib import Path
-from typing import Any, TextIO, TypeVar, Union, overload
+import threading
+from typing import Any, Dict, TextIO, Tuple, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -23,6 +35,43 @@ DICT_T = TypeVar("DICT_T", bound=dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
 
+# What a parsed file depends on, (kind, name) mapped to its stamp. The kind is
+# "path" for files and directories and "env" for environment variables.
+DependenciesType = Dict[Tuple[str, str], Any]  # pylint: disable=invalid-name
+
+
+@dataclass
+class _ParsedFile:
+    """A file parsed earlier and everything its result depends on."""
+
+    stamp: tuple[int, int]
+    dependencies: DependenciesType
+    result: JSON_TYPE
+
+
+# Number of parsed configuration files that are cached
+PARSE_CACHE_SIZE = 2048
+
+# Parsed configuration files keyed by file name and the config dir of the
+# secrets used, least recently used first
+_PARSE_CACHE: OrderedDict[tuple[str, Path], _ParsedFile] = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+class _DependencyCollector(threading.local):
+    """Collect the dependencies of the files that are being parsed.
+
+    There is an entry for each file being parsed in the current thread, it
+    is None when the file cannot be cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the collector."""
+        self.stack: list[DependenciesType | None] = []
+
+
+_COLLECTOR = _DependencyCollector()
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -32,11 +81,9 @@ class Secrets:
         self.config_dir = config_dir
         self._cache: dict[Path, dict[str, str]] = {}
 
-    def get(self, requester_path: str, secret: str) -> str:
-        """Return the value of a secret."""
-        current_path = Path(requester_path)
-
-        secret_dir = current_path
+    def _secret_dirs(self, requester_path: str) -> Iterator[Path]:
+        """Return the directories searched for secrets, nearest first."""
+        secret_dir = Path(requester_path)
         while True:
             secret_dir = secret_dir.parent
 
@@ -44,8 +91,19 @@ class Secrets:
                 secret_dir.relative_to(self.config_dir)
             except ValueError:
                 # We went above the config dir
-                break
+                return
 
+            yield secret_dir
+
+    def secret_paths(self, requester_path: str) -> list[Path]:
+        """Return the secrets files a file can take secrets from."""
+        return [
+            secret_dir / SECRET_YAML for secret_dir in self._secret_dirs(requester_path)
+        ]
+
+    def get(self, requester_path: str, secret: str) -> str:
+        """Return the value of a secret."""
+        for secret_dir in self._secret_dirs(requester_path):
             secrets = self._load_secret_yaml(secret_dir)
 
             if secret in secrets:
@@ -90,8 +148,29 @@ class Secrets:
         return secrets
 
 
+class SafeLoader(FastestAvailableSafeLoader):
+    """The fastest available safe loader, libyaml based if available.
+
+    Line numbers are taken from the start marks of the nodes.
+    """
+
+    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+        """Initialize a safe loader."""
+        super().__init__(stream)
+        # The libyaml parser does not keep the stream and its name
+        if not hasattr(self, "stream"):
+            self.stream = stream
+        if not hasattr(self, "name"):
+            self.name = (
+                "<unicode string>"
+                if isinstance(stream, str)
+                else getattr(stream, "name", "<file>")
+            )
+        self.secrets = secrets
+
+
 class SafeLineLoader(yaml.SafeLoader):
-    """Loader class that keeps track of line numbers."""
+    """Python loader class that keeps track of line numbers."""
 
     def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
         """Initialize a safe line loader."""
@@ -106,15 +185,115 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+LoaderType = Union[SafeLoader, SafeLineLoader]
+
+
+def _path_stamp(path: str) -> tuple[int, int] | None:
+    """Return the modification time and size of a file or directory."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _open_file_stamp(conf_file: TextIO) -> tuple[int, int] | None:
+    """Return the stamp of an open file, None if it is not a regular file."""
+    try:
+        stat = os.fstat(conf_file.fileno())
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _add_dependency(kind: str, name: str, stamp: Any) -> None:
+    """Record a dependency of the file that is being parsed."""
+    stack = _COLLECTOR.stack
+    if stack and stack[-1] is not None:
+        stack[-1][(kind, name)] = stamp
+
+
+def _add_dependencies(dependencies: DependenciesType | None) -> None:
+    """Record the dependencies of an included file."""
+    stack = _COLLECTOR.stack
+    if not stack or stack[-1] is None:
+        return
+    if dependencies is None:
+        # The included file cannot be cached, so neither can the parent
+        stack[-1] = None
+    else:
+        stack[-1].update(dependencies)
+
+
+def _dependencies_unchanged(dependencies: DependenciesType) -> bool:
+    """Return if none of the dependencies of a parsed file changed."""
+    for (kind, name), stamp in dependencies.items():
+        current = os.environ.get(name) if kind == "env" else _path_stamp(name)
+        if current != stamp:
+            return False
+    return True
+
+
+def clear_parse_cache() -> None:
+    """Forget the parsed configuration files."""
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.clear()
+
+
+def _get_parsed_file(key: tuple[str, Path]) -> _ParsedFile | None:
+    """Return a parsed configuration file from the cache."""
+    with _PARSE_CACHE_LOCK:
+        if (cached := _PARSE_CACHE.get(key)) is not None:
+            _PARSE_CACHE.move_to_end(key)
+        return cached
+
+
+def _store_parsed_file(key: tuple[str, Path], parsed: _ParsedFile) -> None:
+    """Cache a parsed configuration file and evict the least recently used."""
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = parsed
+        _PARSE_CACHE.move_to_end(key)
+        while len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+
+
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Configuration files, which are loaded with secrets, are cached until the
+    file, the files it includes or the secrets it uses change.
+    """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            if secrets is None:
+                return parse_yaml(conf_file, secrets)
+
+            stamp = _open_file_stamp(conf_file)
+            key = (fname, secrets.config_dir)
+            cached = _get_parsed_file(key) if stamp else None
+            if (
+                cached is not None
+                and cached.stamp == stamp
+                and _dependencies_unchanged(cached.dependencies)
+            ):
+                _add_dependencies(cached.dependencies)
+                return copy.deepcopy(cached.result)
+
+            stack = _COLLECTOR.stack
+            stack.append({("path", fname): stamp} if stamp else None)
+            try:
+                result = parse_yaml(conf_file, secrets)
+            finally:
+                dependencies = stack.pop()
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
+    _add_dependencies(dependencies)
+    if stamp and dependencies is not None:
+        _store_parsed_file(key, _ParsedFile(stamp, dependencies, copy.deepcopy(result)))
+    return result
+
 
 def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
@@ -122,7 +301,7 @@ def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TY
         # If configuration file is empty YAML returns None
         # We convert that to an empty dict
         return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
+            yaml.load(content, Loader=lambda stream: SafeLoader(stream, secrets))
             or OrderedDict()
         )
     except yaml.YAMLError as exc:
@@ -132,26 +311,24 @@ def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TY
 
 @overload
 def _add_reference(
-    obj: list | NodeListClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeListClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: str | NodeStrClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: str | NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeStrClass:
     ...
 
 
 @overload
-def _add_reference(
-    obj: DICT_T, loader: SafeLineLoader, node: yaml.nodes.Node
-) -> DICT_T:
+def _add_reference(obj: DICT_T, loader: LoaderType, node: yaml.nodes.Node) -> DICT_T:
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore
+def _add_reference(obj, loader: LoaderType, node: yaml.nodes.Node):  # type: ignore
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -162,7 +339,7 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -185,7 +362,11 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    # Adding or removing files changes the stamp of their directory
+    _add_dependency("path", directory, _path_stamp(directory))
     for root, dirs, files in os.walk(directory, topdown=True):
+        if root != directory:
+            _add_dependency("path", root, _path_stamp(root))
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -193,9 +374,7 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
-) -> OrderedDict:
+def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -208,7 +387,7 @@ def _include_dir_named_yaml(
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -223,7 +402,7 @@ def _include_dir_merge_named_yaml(
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -235,7 +414,7 @@ def _include_dir_list_yaml(
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
@@ -249,7 +428,7 @@ def _include_dir_merge_list_yaml(
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: LoaderType, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -281,15 +460,16 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _add_dependency("env", args[0], os.environ.get(args[0]))
 
     # Check for a default value
     if len(args) > 1:
@@ -300,27 +480,28 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     raise HomeAssistantError(node.value)
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
+    for secret_path in loader.secrets.secret_paths(loader.name):
+        _add_dependency("path", str(secret_path), _path_stamp(str(secret_path)))
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+for _loader in (SafeLoader, SafeLineLoader):
+    _loader.add_constructor("!include", _include_yaml)
+    _loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
+    )
+    _loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
+    )
+    _loader.add_constructor("!env_var", _env_var_yaml)
+    _loader.add_constructor("!secret", secret_yaml)
+    _loader.add_constructor("!include_dir_list", _include_dir_list_yaml)
+    _loader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+    _loader.add_constructor("!include_dir_named", _include_dir_named_yaml)
+    _loader.add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+    _loader.add_constructor("!input", Input.from_node)
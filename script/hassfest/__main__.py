@@ -12,6 +12,7 @@ from . import (
     dhcp,
     json,
     manifest,
+    manifest_index,
     mqtt,
     mypy_config,
     requirements,
@@ -29,6 +30,7 @@ INTEGRATION_PLUGINS = [
     config_flow,
     dependencies,
     manifest,
+    manifest_index,
     mqtt,
     services,
     ssdp,
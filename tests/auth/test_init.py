@@ -529,6 +529,52 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validated_access_token_is_cached(mock_hass):
+    """Test that a validated access token skips JWT decoding next time."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    assert len(mock_decode.mock_calls) == 0
+
+
+async def test_cached_access_token_invalidated_on_deactivate(mock_hass):
+    """Test that deactivating a user invalidates cached access tokens."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_cached_access_token_expires(mock_hass):
+    """Test that cached access tokens are not used after they expire."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    expired = (
+        dt_util.utcnow() + auth_const.ACCESS_TOKEN_EXPIRATION + timedelta(seconds=11)
+    ).timestamp()
+    with patch("homeassistant.auth.time.time", return_value=expired), patch(
+        "homeassistant.auth.jwt.decode", side_effect=jwt.ExpiredSignatureError
+    ):
+        assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_create_access_token(mock_hass):
     """Test normal refresh_token's jwt_key keep same after used."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
@@ -374,6 +374,7 @@ def async_fire_time_changed(
     hass: HomeAssistant, datetime_: datetime, fire_all: bool = False
 ) -> None:
     """Fire a time changes event."""
+    hass.ticks.async_tick(date_util.as_utc(datetime_))
     hass.bus.async_fire(EVENT_TIME_CHANGED, {"now": date_util.as_utc(datetime_)})
 
     for task in list(hass.loop._scheduled):
@@ -9,6 +9,7 @@ import voluptuous as vol
 
 from homeassistant import const
 from homeassistant.bootstrap import DATA_LOGGING
+from homeassistant.components import api
 import homeassistant.core as ha
 from homeassistant.setup import async_setup_component
 
@@ -345,7 +346,9 @@ async def test_stream_with_restricted(hass, mock_api_client):
         f"{const.URL_API_STREAM}?restrict=test_event1,test_event3"
     )
     assert resp.status == 200
-    assert listen_count + 1 == _listen_count(hass)
+    # Listeners for the restricted events and for stopping
+    assert listen_count + 3 == _listen_count(hass)
+    assert hass.bus.async_listeners().get(const.MATCH_ALL) is None
 
     hass.bus.async_fire("test_event1")
     data = await _stream_next_event(resp.content)
@@ -357,6 +360,60 @@ async def test_stream_with_restricted(hass, mock_api_client):
     assert data["event_type"] == "test_event3"
 
 
+async def test_stream_shared_serialization(hass, mock_api_client):
+    """Test events are serialized once for all clients."""
+    listen_count = _listen_count(hass)
+    broadcaster = api.async_get_event_stream_broadcaster(hass)
+
+    resp_all = await mock_api_client.get(const.URL_API_STREAM)
+    resp_restricted = await mock_api_client.get(
+        f"{const.URL_API_STREAM}?restrict=test_event"
+    )
+    assert listen_count + 3 == _listen_count(hass)
+
+    hass.bus.async_fire("test_event", {"hello": "world"})
+
+    data = await _stream_next_event(resp_all.content)
+    assert data["data"] == {"hello": "world"}
+    data = await _stream_next_event(resp_restricted.content)
+    assert data["data"] == {"hello": "world"}
+    assert broadcaster.events_serialized == 1
+    assert broadcaster.events_queued == 2
+
+    resp_all.close()
+    resp_restricted.close()
+
+
+async def test_stream_slow_client_disconnected(hass, mock_api_client):
+    """Test a client that falls behind is disconnected."""
+    listen_count = _listen_count(hass)
+    broadcaster = api.async_get_event_stream_broadcaster(hass)
+
+    with patch("homeassistant.components.api.STREAM_QUEUE_SIZE", 2):
+        resp = await mock_api_client.get(const.URL_API_STREAM)
+
+    for _ in range(5):
+        hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    assert broadcaster.clients_disconnected == 1
+    assert listen_count == _listen_count(hass)
+
+    # The stream ends without the events that were dropped
+    assert await resp.content.read() == b"data: ping\n\n"
+
+
+async def test_stream_closed_on_stop(hass, mock_api_client):
+    """Test the stream is closed when Home Assistant stops."""
+    listen_count = _listen_count(hass)
+    resp = await mock_api_client.get(f"{const.URL_API_STREAM}?restrict=test_event")
+
+    hass.bus.async_fire(const.EVENT_HOMEASSISTANT_STOP)
+    assert await resp.content.read() == b"data: ping\n\n"
+    await hass.async_block_till_done()
+    assert listen_count == _listen_count(hass)
+
+
 async def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
     while True:
@@ -557,3 +614,190 @@ async def test_api_call_service_bad_data(hass, mock_api_client):
         "/api/services/test_domain/test_service", json={"hello": 5}
     )
     assert resp.status == 400
+
+
+async def test_api_batch_set_states(hass, mock_api_client, hass_access_token):
+    """Test updating the state of several entities with one request."""
+    hass.states.async_set("test.existing", "off")
+
+    resp = await mock_api_client.post(
+        "/api/batch/states",
+        json=[
+            {"entity_id": "test.existing", "state": "on"},
+            {"entity_id": "test.new", "state": "1", "attributes": {"unit": "W"}},
+            {"entity_id": "test.new_2"},
+            {"entity_id": "invalid", "state": "on"},
+            "not an object",
+            {"entity_id": "test.list", "state": "on", "attributes": ["unit"]},
+            {"entity_id": "test.forced", "state": "on", "force_update": "yes"},
+        ],
+    )
+    assert resp.status == 200
+    assert await resp.json() == [
+        {"entity_id": "test.existing", "status": 200},
+        {"entity_id": "test.new", "status": 201},
+        {"entity_id": "test.new_2", "status": 400, "message": "No state specified."},
+        {
+            "entity_id": "invalid",
+            "status": 400,
+            "message": "Invalid entity ID specified.",
+        },
+        {"status": 400, "message": "Invalid JSON specified."},
+        {
+            "entity_id": "test.list",
+            "status": 400,
+            "message": "Attributes should be a JSON object.",
+        },
+        {
+            "entity_id": "test.forced",
+            "status": 400,
+            "message": "Force update should be a boolean.",
+        },
+    ]
+
+    assert hass.states.get("test.existing").state == "on"
+    new_state = hass.states.get("test.new")
+    assert new_state.attributes == {"unit": "W"}
+    refresh_token = await hass.auth.async_validate_access_token(hass_access_token)
+    assert new_state.context.user_id == refresh_token.user.id
+    assert hass.states.get("test.new_2") is None
+
+
+async def test_api_batch_set_states_ndjson(hass, mock_api_client):
+    """Test updating states with newline delimited JSON."""
+    lines = [
+        json.dumps({"entity_id": f"test.entity_{idx}", "state": str(idx)})
+        for idx in range(100)
+    ]
+    lines.insert(50, "{invalid")
+
+    resp = await mock_api_client.post(
+        "/api/batch/states",
+        data="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status == 200
+    results = await resp.json()
+    assert len(results) == 101
+    assert results[50] == {"status": 400, "message": "Invalid JSON specified."}
+    assert all(
+        result["status"] == 201 for idx, result in enumerate(results) if idx != 50
+    )
+    assert hass.states.get("test.entity_99").state == "99"
+
+
+async def test_api_batch_too_large(hass, mock_api_client):
+    """Test batches are limited in the number of items and size."""
+    items = [{"entity_id": f"test.entity_{idx}", "state": "on"} for idx in range(6)]
+    ndjson = "\n".join(json.dumps(item) for item in items)
+
+    with patch("homeassistant.components.api.MAX_BATCH_ITEMS", 5):
+        resp = await mock_api_client.post("/api/batch/states", json=items)
+        assert resp.status == 413
+
+        resp = await mock_api_client.post(
+            "/api/batch/services",
+            data=ndjson,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert resp.status == 413
+
+        resp = await mock_api_client.post("/api/batch/states", json=items[:5])
+        assert resp.status == 200
+
+    with patch("homeassistant.components.api.MAX_CLIENT_SIZE", 100):
+        resp = await mock_api_client.post(
+            "/api/batch/states",
+            data=ndjson,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert resp.status == 413
+
+    assert hass.states.get("test.entity_5") is None
+
+
+async def test_api_batch_ndjson_line_too_long(hass, mock_api_client):
+    """Test a line too long for the stream reader is rejected."""
+    line = json.dumps({"entity_id": "test.long", "state": "x" * 1000000})
+
+    resp = await mock_api_client.post(
+        "/api/batch/states",
+        data=line + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status == 400
+    assert hass.states.get("test.long") is None
+
+
+async def test_api_batch_invalid(hass, mock_api_client, hass_admin_user):
+    """Test batches should be a JSON array and require admin for states."""
+    resp = await mock_api_client.post("/api/batch/states", json={"state": "on"})
+    assert resp.status == 400
+
+    resp = await mock_api_client.post("/api/batch/services", data="{invalid")
+    assert resp.status == 400
+
+    hass_admin_user.groups = []
+    resp = await mock_api_client.post("/api/batch/states", json=[])
+    assert resp.status == 401
+
+
+async def test_api_batch_call_services(hass, mock_api_client):
+    """Test calling several services with one request."""
+
+    @ha.callback
+    def listener(service_call):
+        """Set a state with the context of the call."""
+        hass.states.async_set(
+            service_call.data["entity_id"], "on", context=service_call.context
+        )
+
+    hass.services.async_register(
+        "test_domain",
+        "test_service",
+        listener,
+        schema=vol.Schema({"entity_id": str}),
+    )
+
+    resp = await mock_api_client.post(
+        "/api/batch/services",
+        json=[
+            {
+                "domain": "test_domain",
+                "service": "test_service",
+                "service_data": {"entity_id": "test.one"},
+            },
+            {
+                "domain": "test_domain",
+                "service": "test_service",
+                "service_data": {"entity_id": "test.two"},
+            },
+            {
+                "domain": "test_domain",
+                "service": "test_service",
+                "service_data": {"entity_id": 5},
+            },
+            {"domain": "test_domain", "service": "missing"},
+            {"domain": "test_domain"},
+        ],
+    )
+    assert resp.status == 200
+    results = await resp.json()
+    assert len(results) == 5
+
+    assert results[0]["status"] == 200
+    assert [state["entity_id"] for state in results[0]["changed_states"]] == [
+        "test.one"
+    ]
+    assert results[1]["status"] == 200
+    assert [state["entity_id"] for state in results[1]["changed_states"]] == [
+        "test.two"
+    ]
+    assert results[2]["status"] == 400
+    assert results[3]["status"] == 400
+    assert results[4] == {
+        "domain": "test_domain",
+        "service": None,
+        "status": 400,
+        "message": "No service specified.",
+    }
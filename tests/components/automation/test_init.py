@@ -1131,6 +1131,45 @@ async def test_extraction_functions(hass):
     }
 
 
+async def test_extraction_functions_reload(hass):
+    """Test the automations referencing something are updated on reload."""
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: {
+                "alias": "test1",
+                "trigger": {"platform": "state", "entity_id": "sensor.trigger_1"},
+                "action": {"service": "test.script", "target": {"area_id": "kitchen"}},
+            }
+        },
+    )
+
+    assert automation.automations_with_entity(hass, "sensor.trigger_1") == [
+        "automation.test1"
+    ]
+    assert automation.automations_with_area(hass, "kitchen") == ["automation.test1"]
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            DOMAIN: {
+                "alias": "test2",
+                "trigger": {"platform": "state", "entity_id": "sensor.trigger_2"},
+                "action": {"service": "test.script", "target": {"area_id": "kitchen"}},
+            }
+        },
+    ):
+        await hass.services.async_call(DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert automation.automations_with_entity(hass, "sensor.trigger_1") == []
+    assert automation.automations_with_entity(hass, "sensor.trigger_2") == [
+        "automation.test2"
+    ]
+    assert automation.automations_with_area(hass, "kitchen") == ["automation.test2"]
+
+
 async def test_logbook_humanify_automation_triggered_event(hass):
     """Test humanifying Automation Trigger event."""
     hass.config.components.add("recorder")
@@ -2,7 +2,7 @@
 import asyncio
 import base64
 import io
-from unittest.mock import Mock, PropertyMock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 
 import pytest
 
@@ -145,6 +145,70 @@ async def test_get_image_from_camera_not_jpeg(hass, image_mock_url):
     assert image.content == b"png"
 
 
+async def test_get_image_from_stream(hass, image_mock_url):
+    """Grab an image from the stream of a camera entity."""
+    demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    demo_camera.stream = Mock(async_get_image=AsyncMock(return_value=b"Stream"))
+
+    with patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Test",
+    ) as mock_camera:
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+
+    # Stills are only taken from the stream when the camera opts in
+    assert mock_camera.called
+    assert image.content == b"Test"
+    mock_camera.reset_mock()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.use_stream_for_stills",
+        new_callable=PropertyMock,
+        return_value=True,
+    ), patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Test",
+    ) as mock_camera:
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+
+        assert not mock_camera.called
+        assert image.content_type == "image/jpeg"
+        assert image.content == b"Stream"
+
+        # Fall back to the camera while the stream has no image
+        demo_camera.stream.async_get_image.return_value = None
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+
+        assert mock_camera.called
+        assert image.content == b"Test"
+
+
+async def test_create_stream_enables_still_images(hass, image_mock_url):
+    """Test still images are only enabled on streams of cameras that use them."""
+    demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+
+    with patch(
+        "homeassistant.components.camera.create_stream"
+    ) as mock_create_stream, patch(
+        "homeassistant.components.demo.camera.DemoCamera.stream_source",
+        return_value="http://example.com",
+    ):
+        stream = await demo_camera.create_stream()
+        assert not stream.enable_still_images.called
+
+        demo_camera.stream = None
+        with patch(
+            "homeassistant.components.demo.camera.DemoCamera.use_stream_for_stills",
+            new_callable=PropertyMock,
+            return_value=True,
+        ):
+            stream = await demo_camera.create_stream()
+        assert stream.enable_still_images.called
+        assert mock_create_stream.call_count == 2
+
+
 async def test_get_stream_source_from_camera(hass, mock_camera):
     """Fetch stream source from camera entity."""
 
@@ -447,7 +447,7 @@ async def test_media_image_proxy(hass, hass_client):
     class MockWebsession:
         """Test websession."""
 
-        async def get(self, url):
+        async def get(self, url, headers=None):
             """Test websession get."""
             return MockResponse()
 
@@ -806,3 +806,26 @@ async def test_aiodiscover_finds_new_hosts_after_interval(hass):
         dhcp.HOSTNAME: "connect",
         dhcp.MAC_ADDRESS: "b8b7f16db533",
     }
+
+
+def test_integration_matchers():
+    """Test the matchers are indexed and matched in manifest order."""
+    matchers = dhcp.IntegrationMatchers(
+        [
+            {"domain": "mock-domain", "hostname": "connect", "macaddress": "B8B7F1*"},
+            {"domain": "other-domain", "hostname": "k[lp]*"},
+            {"domain": "any-mac", "macaddress": "*"},
+            {"domain": "mac-only", "macaddress": "B8B7F16D*"},
+            {"domain": "hostname-only", "hostname": "kl*"},
+        ]
+    )
+
+    assert [
+        entry["domain"] for entry in matchers.async_match("B8B7F16DB533", "connect")
+    ] == ["mock-domain", "any-mac", "mac-only"]
+    assert [
+        entry["domain"] for entry in matchers.async_match("AABBCCDDEEFF", "kl110")
+    ] == ["other-domain", "any-mac", "hostname-only"]
+    assert [
+        entry["domain"] for entry in matchers.async_match("B8B7F1000000", "kp")
+    ] == ["other-domain", "any-mac"]
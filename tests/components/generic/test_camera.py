@@ -7,6 +7,7 @@ import httpx
 import respx
 
 from homeassistant import config as hass_config
+from homeassistant.components import camera
 from homeassistant.components.generic import DOMAIN
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.const import (
@@ -209,6 +210,50 @@ async def test_stream_source(aioclient_mock, hass, hass_client, hass_ws_client):
         assert msg["result"]["url"][-13:] == "playlist.m3u8"
 
 
+@respx.mock
+async def test_use_stream_for_stills(hass, hass_client):
+    """Test stills are taken from the running stream when configured."""
+    respx.get("http://example.com").respond(text="still")
+
+    assert await async_setup_component(
+        hass,
+        "camera",
+        {
+            "camera": {
+                "name": "config_test",
+                "platform": "generic",
+                "still_image_url": "http://example.com",
+                "stream_source": "rtsp://example.com/stream",
+                "use_stream_for_stills": True,
+            },
+        },
+    )
+    assert await async_setup_component(hass, "stream", {})
+    await hass.async_block_till_done()
+
+    # Without a stream the still image url is used
+    image = await camera.async_get_image(hass, "camera.config_test")
+    assert image.content == b"still"
+    assert respx.calls.call_count == 1
+
+    with patch(
+        "homeassistant.components.camera.Stream.endpoint_url",
+        return_value="http://home.assistant/playlist.m3u8",
+    ), patch("homeassistant.components.camera.Stream.start"):
+        await camera.async_request_stream(hass, "camera.config_test", "hls")
+
+    with patch(
+        "homeassistant.components.camera.Stream.async_get_image",
+        return_value=b"keyframe",
+    ) as mock_get_image:
+        image = await camera.async_get_image(hass, "camera.config_test")
+
+    assert image.content == b"keyframe"
+    assert image.content_type == "image/jpeg"
+    assert mock_get_image.call_count == 1
+    assert respx.calls.call_count == 1
+
+
 async def test_stream_source_error(aioclient_mock, hass, hass_client, hass_ws_client):
     """Test that the stream source has an error."""
     assert await async_setup_component(
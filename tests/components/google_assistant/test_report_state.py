@@ -3,6 +3,10 @@ from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.components.google_assistant import error, report_state
+from homeassistant.components.google_assistant.const import (
+    SIGNAL_EXPOSED_ENTITIES_UPDATED,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
@@ -123,3 +127,51 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_caches_entities(hass, legacy_patchable_time):
+    """Test the Google entity is reused until the attributes change."""
+    hass.states.async_set("light.ceiling", "off")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ), patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(
+        report_state, "GoogleEntity", wraps=report_state.GoogleEntity
+    ) as mock_entity:
+        hass.states.async_set("light.ceiling", "on")
+        await hass.async_block_till_done()
+        hass.states.async_set("light.ceiling", "off")
+        await hass.async_block_till_done()
+        assert len(mock_entity.mock_calls) == 1
+
+        # Only the context changed, nothing to serialize
+        hass.states.async_set("light.ceiling", "off", force_update=True)
+        await hass.async_block_till_done()
+
+        hass.states.async_set("light.ceiling", "on", {"brightness": 255})
+        await hass.async_block_till_done()
+        assert len(mock_entity.mock_calls) == 2
+
+        async_dispatcher_send(hass, SIGNAL_EXPOSED_ENTITIES_UPDATED)
+        hass.states.async_set("light.ceiling", "off", {"brightness": 255})
+        await hass.async_block_till_done()
+        assert len(mock_entity.mock_calls) == 3
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+    assert mock_report.mock_calls[-1][1][0] == {
+        "devices": {"states": {"light.ceiling": {"on": False, "online": True}}}
+    }
+
+    unsub()
@@ -1168,6 +1168,49 @@ async def test_group_that_references_a_group_of_lights(hass):
     assert hass.states.get("group.grouped_group").state == "off"
 
 
+async def test_member_changes_coalesced_into_single_write(hass):
+    """Test a burst of member changes results in one write per nested group."""
+    entity_ids = [f"light.bulb_{idx}" for idx in range(50)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+
+    assert await async_setup_component(hass, "group", {})
+    all_lights = await group.Group.async_create_group(hass, "all_lights", entity_ids)
+    outer = await group.Group.async_create_group(hass, "outer", [all_lights.entity_id])
+    await hass.async_block_till_done()
+    assert hass.states.get(outer.entity_id).state == STATE_OFF
+
+    writes = []
+    hass.bus.async_listen(
+        "state_changed",
+        lambda event: writes.append(event.data["entity_id"])
+        if event.data["entity_id"].startswith("group.")
+        else None,
+    )
+
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_ON)
+    await hass.async_block_till_done()
+
+    assert writes == [all_lights.entity_id, outer.entity_id]
+    assert hass.states.get(all_lights.entity_id).state == STATE_ON
+    assert hass.states.get(outer.entity_id).state == STATE_ON
+    assert all_lights._on_count == 50
+
+    for entity_id in entity_ids[1:]:
+        hass.states.async_set(entity_id, STATE_OFF)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(all_lights.entity_id).state == STATE_ON
+    assert all_lights._on_count == 1
+
+    hass.states.async_set(entity_ids[0], STATE_OFF)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(all_lights.entity_id).state == STATE_OFF
+    assert hass.states.get(outer.entity_id).state == STATE_OFF
+
+
 async def test_group_that_references_a_group_of_covers(hass):
     """Group that references a group of covers."""
 
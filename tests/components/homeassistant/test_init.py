@@ -186,10 +186,13 @@ class TestComponentsCore(unittest.TestCase):
                 }
             )
         }
-        with patch_yaml_files(files, True):
+        with patch_yaml_files(files, True), patch(
+            "homeassistant.components.homeassistant.clear_parse_cache"
+        ) as mock_clear_cache:
             reload_core_config(self.hass)
             self.hass.block_till_done()
 
+        assert len(mock_clear_cache.mock_calls) == 1
         assert self.hass.config.latitude == 10
         assert self.hass.config.longitude == 20
 
@@ -115,6 +115,41 @@ def test_service_call_create_logbook_entry(hass_):
     assert last_call.data.get(logbook.ATTR_DOMAIN) == "logbook"
 
 
+def test_context_from_compact_call_service(hass_recorder):
+    """Test the context of call_service events recorded without their data."""
+    hass = hass_recorder({"call_service": {"compact": True}})
+    entity_id = "switch.test_switch"
+    context = ha.Context()
+
+    hass.states.set(entity_id, STATE_OFF)
+    hass.bus.fire(
+        EVENT_CALL_SERVICE,
+        {
+            ATTR_DOMAIN: "switch",
+            ATTR_SERVICE: "turn_on",
+            "service_data": {ATTR_ENTITY_ID: entity_id},
+        },
+        context=context,
+    )
+    hass.states.set(entity_id, STATE_ON, context=context)
+    trigger_db_commit(hass)
+    hass.block_till_done()
+    hass.data[recorder.DATA_INSTANCE].block_till_done()
+
+    events = list(
+        logbook._get_events(
+            hass,
+            dt_util.utcnow() - timedelta(hours=1),
+            dt_util.utcnow() + timedelta(hours=1),
+        )
+    )
+    entry = events[-1]
+    assert entry["entity_id"] == entity_id
+    assert entry["context_event_type"] == EVENT_CALL_SERVICE
+    assert entry["context_domain"] == "switch"
+    assert entry["context_service"] == "turn_on"
+
+
 def test_service_call_create_log_book_entry_no_message(hass_):
     """Test if service call create log book entry without message."""
     calls = []
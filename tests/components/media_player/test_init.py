@@ -1,7 +1,12 @@
 """Test the base functions of the media player."""
 import base64
+from collections import OrderedDict
 from unittest.mock import patch
 
+from aiohttp import hdrs
+from multidict import CIMultiDict
+import pytest
+
 from homeassistant.components import media_player
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.setup import async_setup_component
@@ -91,6 +96,122 @@ async def test_get_image_http_remote(hass, aiohttp_client):
         assert content == b"image"
 
 
+@pytest.fixture
+def image_cache():
+    """Start with an empty image cache."""
+    with patch.dict(
+        media_player.ENTITY_IMAGE_CACHE,
+        {media_player.CACHE_IMAGES: OrderedDict(), media_player.CACHE_SIZE: 0},
+    ):
+        yield media_player.ENTITY_IMAGE_CACHE
+
+
+async def test_image_cache_revalidates(hass, aioclient_mock, image_cache):
+    """Test cached images are revalidated with their source."""
+    url = "http://example.com/cover.jpg"
+    aioclient_mock.get(
+        url,
+        content=b"image",
+        headers=CIMultiDict({hdrs.CONTENT_TYPE: "image/jpeg", hdrs.ETAG: '"v1"'}),
+    )
+    player = media_player.MediaPlayerEntity()
+    player.hass = hass
+
+    assert await player._async_fetch_image_from_cache(url) == (
+        b"image",
+        "image/jpeg",
+    )
+    assert await player._async_fetch_image_from_cache(url) == (
+        b"image",
+        "image/jpeg",
+    )
+    assert aioclient_mock.call_count == 1
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, status=304)
+    with patch.object(media_player, "IMAGE_CACHE_REVALIDATE", 0):
+        assert await player._async_fetch_image_from_cache(url) == (
+            b"image",
+            "image/jpeg",
+        )
+    assert aioclient_mock.call_count == 1
+    assert aioclient_mock.mock_calls[0][3] == {hdrs.IF_NONE_MATCH: '"v1"'}
+
+    # The cached image is served while the source is unavailable
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, status=500)
+    with patch.object(media_player, "IMAGE_CACHE_REVALIDATE", 0):
+        assert await player._async_fetch_image_from_cache(url) == (
+            b"image",
+            "image/jpeg",
+        )
+
+
+async def test_image_cache_size(hass, aioclient_mock, image_cache):
+    """Test the image cache is bounded by the size of the images."""
+    image_cache[media_player.CACHE_MAXSIZE] = 10
+    player = media_player.MediaPlayerEntity()
+    player.hass = hass
+
+    for idx in range(3):
+        url = f"http://example.com/cover{idx}.jpg"
+        aioclient_mock.get(
+            url, content=b"image", headers={"Content-Type": "image/jpeg"}
+        )
+        await player._async_fetch_image_from_cache(url)
+
+    assert list(image_cache[media_player.CACHE_IMAGES]) == [
+        "http://example.com/cover1.jpg",
+        "http://example.com/cover2.jpg",
+    ]
+    assert image_cache[media_player.CACHE_SIZE] == 10
+
+
+async def test_get_image_http_caching(hass, aiohttp_client, image_cache):
+    """Test images are served with an ETag and scaled variants are cached."""
+    await async_setup_component(
+        hass, "media_player", {"media_player": {"platform": "demo"}}
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("media_player.bedroom")
+    client = await aiohttp_client(hass.http.app)
+
+    with patch(
+        "homeassistant.components.media_player.MediaPlayerEntity."
+        "async_get_media_image",
+        return_value=(b"image", "image/jpeg"),
+    ):
+        resp = await client.get(state.attributes["entity_picture"])
+        assert resp.status == 200
+        etag = resp.headers["ETag"]
+
+        resp = await client.get(
+            state.attributes["entity_picture"], headers={"If-None-Match": etag}
+        )
+        assert resp.status == 304
+
+        with patch(
+            "homeassistant.components.media_player.scale_jpeg_image",
+            return_value=b"small",
+        ) as mock_scale:
+            for _ in range(2):
+                resp = await client.get(
+                    state.attributes["entity_picture"],
+                    params={"width": 100, "height": 100},
+                )
+                assert resp.status == 200
+                assert await resp.read() == b"small"
+                assert resp.headers["ETag"] != etag
+
+        assert len(mock_scale.mock_calls) == 1
+
+        resp = await client.get(
+            state.attributes["entity_picture"], params={"width": "big"}
+        )
+        assert resp.status == 400
+
+
 async def test_get_async_get_browse_image(hass, aiohttp_client, hass_ws_client):
     """Test get browse image."""
     await async_setup_component(
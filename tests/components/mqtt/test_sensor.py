@@ -79,6 +79,35 @@ async def test_setting_sensor_value_via_mqtt_message(hass, mqtt_mock):
     assert state.attributes.get("unit_of_measurement") == "fav unit"
 
 
+async def test_unchanged_sensor_value_skips_write(hass, mqtt_mock):
+    """Test an unchanged value is not written and discovery updates the unit."""
+    config = {"name": "test", "state_topic": "test-topic", "unit_of_measurement": "W"}
+    async_fire_mqtt_message(hass, "homeassistant/sensor/bla/config", json.dumps(config))
+    await hass.async_block_till_done()
+
+    async_fire_mqtt_message(hass, "test-topic", "100")
+    state = hass.states.get("sensor.test")
+    assert state.state == "100"
+
+    with patch.object(
+        hass.states, "async_set", wraps=hass.states.async_set
+    ) as async_set:
+        async_fire_mqtt_message(hass, "test-topic", "100")
+        assert not async_set.called
+
+        async_fire_mqtt_message(hass, "test-topic", "101")
+        assert async_set.call_count == 1
+    assert hass.states.get("sensor.test").state == "101"
+
+    config["unit_of_measurement"] = "kW"
+    async_fire_mqtt_message(hass, "homeassistant/sensor/bla/config", json.dumps(config))
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test")
+    assert state.state == "101"
+    assert state.attributes["unit_of_measurement"] == "kW"
+
+
 async def test_setting_sensor_value_expires_availability_topic(hass, mqtt_mock, caplog):
     """Test the expiration of the value."""
     assert await async_setup_component(
@@ -34,6 +34,7 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
+    EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
@@ -73,6 +74,8 @@ def _default_recorder(hass):
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_t=[],
+        call_service_compact=False,
+        call_service_sample={},
     )
 
 
@@ -446,6 +449,63 @@ def test_saving_event_exclude_event_type(hass_recorder):
     assert events[0].event_type == "test2"
 
 
+def _add_call_service_events(hass, calls):
+    with session_scope(hass=hass) as session:
+        session.query(Events).delete(synchronize_session=False)
+    for domain, service in calls:
+        hass.bus.fire(
+            EVENT_CALL_SERVICE,
+            {"domain": domain, "service": service, "service_data": {"brightness": 5}},
+        )
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        return [
+            (ev.event_data, ev.service_domain, ev.to_native())
+            for ev in session.query(Events).filter_by(event_type=EVENT_CALL_SERVICE)
+        ]
+
+
+def test_saving_call_service_event(hass_recorder):
+    """Test call_service events are saved with their data by default."""
+    hass = hass_recorder()
+    events = _add_call_service_events(hass, [("light", "turn_on")])
+    assert len(events) == 1
+    _, service_domain, event = events[0]
+    assert service_domain is None
+    assert event.data == {
+        "domain": "light",
+        "service": "turn_on",
+        "service_data": {"brightness": 5},
+    }
+
+
+def test_saving_call_service_event_compact(hass_recorder):
+    """Test saving call_service events without their service data."""
+    hass = hass_recorder({"call_service": {"compact": True}})
+    events = _add_call_service_events(hass, [("light", "turn_on")])
+    assert len(events) == 1
+    event_data, service_domain, event = events[0]
+    assert event_data is None
+    assert service_domain == "light"
+    assert event.data == {"domain": "light", "service": "turn_on"}
+
+
+def test_saving_call_service_event_sample(hass_recorder):
+    """Test only saving some or none of the call_service events of a domain."""
+    hass = hass_recorder({"call_service": {"sample": {"light": 3, "climate": 0}}})
+    events = _add_call_service_events(
+        hass,
+        [
+            *[("light", "turn_on")] * 7,
+            *[("climate", "set_temperature")] * 2,
+            *[("switch", "turn_on")] * 2,
+        ],
+    )
+    domains = [event.data["domain"] for _, _, event in events]
+    assert domains == ["light", "light", "light", "switch", "switch"]
+
+
 def test_saving_state_exclude_domains(hass_recorder):
     """Test saving and restoring a state."""
     hass = hass_recorder({"exclude": {"domains": "test"}})
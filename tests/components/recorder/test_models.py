@@ -13,7 +13,7 @@ from homeassistant.components.recorder.models import (
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_CALL_SERVICE, EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.util import dt
@@ -26,6 +26,20 @@ def test_from_event_to_db_event():
     assert event == Events.from_event(event).to_native()
 
 
+def test_from_call_service_event_to_db_event():
+    """Test converting a call_service event without its service data."""
+    event = ha.Event(
+        EVENT_CALL_SERVICE,
+        {"domain": "light", "service": "turn_on", "service_data": {"brightness": 1}},
+    )
+    db_event = Events.from_call_service_event(event)
+    assert db_event.event_data is None
+
+    native = db_event.to_native()
+    assert native.event_type == EVENT_CALL_SERVICE
+    assert native.data == {"domain": "light", "service": "turn_on"}
+
+
 def test_from_event_to_db_state():
     """Test converting event to db state."""
     state = ha.State("sensor.temperature", "18")
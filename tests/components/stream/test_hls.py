@@ -12,7 +12,7 @@ from homeassistant.components.stream.const import (
     MAX_SEGMENTS,
     NUM_PLAYLIST_SEGMENTS,
 )
-from homeassistant.components.stream.core import Part, Segment
+from homeassistant.components.stream.core import Part, Segment, SegmentStore
 from homeassistant.const import HTTP_NOT_FOUND
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -342,6 +342,56 @@ async def test_hls_max_segments(hass, hls_stream, stream_worker_sync):
     stream.stop()
 
 
+async def test_hls_segment_from_store(hass, hls_stream, stream_worker_sync):
+    """Test segments in the segment store are not served once overwritten."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    stream = create_stream(hass, STREAM_SOURCE, {})
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    store = SegmentStore(size=2 * len(FAKE_PAYLOAD))
+
+    for sequence in range(2):
+        position, data = store.write(FAKE_PAYLOAD)
+        segment = Segment(
+            sequence=sequence,
+            init=INIT_BYTES,
+            duration=SEGMENT_DURATION,
+            start_time=FAKE_TIME,
+            store=store,
+        )
+        segment.parts = [
+            Part(
+                duration=SEGMENT_DURATION,
+                has_keyframe=True,
+                data=data,
+                position=position,
+            )
+        ]
+        hls.put(segment)
+        await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    segment_response = await hls_client.get("/segment/1.m4s")
+    assert segment_response.status == 200
+    assert await segment_response.read() == FAKE_PAYLOAD
+
+    # The worker overwrites the segment while its data is copied
+    def overwrite_while_copying(segment):
+        data = b"".join(part.data for part in segment.parts)
+        store.write(FAKE_PAYLOAD)
+        store.write(FAKE_PAYLOAD)
+        return data
+
+    with patch.object(Segment, "get_bytes_without_init", overwrite_while_copying):
+        segment_response = await hls_client.get("/segment/1.m4s")
+    assert segment_response.status == 404
+
+    stream_worker_sync.resume()
+    stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(hass, hls_stream, stream_worker_sync):
     """Test a discontinuity across segments in the stream with 3 segments."""
     await async_setup_component(hass, "stream", {"stream": {}})
@@ -29,6 +29,7 @@ from homeassistant.components.stream.const import (
     PACKETS_TO_WAIT_FOR_AUDIO,
     TARGET_SEGMENT_DURATION,
 )
+from homeassistant.components.stream.core import KeyFrameConverter, SegmentStore
 from homeassistant.components.stream.worker import SegmentBuffer, stream_worker
 from homeassistant.setup import async_setup_component
 
@@ -67,6 +68,12 @@ class FakeAvInputStream:
 
         self.codec = FakeCodec()
 
+        class FakeCodecContext:
+            name = "h264"
+            extradata = None
+
+        self.codec_context = FakeCodecContext()
+
     def __str__(self) -> str:
         """Return a stream name for debugging."""
         return f"FakePyAvStream<{self.name}, {self.time_base}>"
@@ -716,3 +723,85 @@ async def test_has_keyframe(hass, record_worker_sync):
     await record_worker_sync.join()
 
     stream.stop()
+
+
+async def test_keyframe_converter(hass):
+    """Test the most recent keyframe is converted to a JPEG on demand."""
+    converter = KeyFrameConverter(hass)
+    assert await converter.async_get_image() is None
+
+    container = av.open(generate_h264_video())
+    video_stream = container.streams.video[0]
+    converter.create_decoder(video_stream)
+    keyframes = [
+        av.Packet(bytes(packet))
+        for packet in container.demux(video_stream)
+        if packet.is_keyframe and packet.size
+    ]
+    container.close()
+    assert len(keyframes) > 1
+
+    converter.packet = keyframes[0]
+    image = await converter.async_get_image()
+    assert image.startswith(b"\xff\xd8")
+    assert converter.packet is None
+
+    # The image is cached until the next keyframe
+    assert await converter.async_get_image() is image
+
+    converter.packet = keyframes[-1]
+    next_image = await converter.async_get_image()
+    assert next_image is not image
+    assert next_image.startswith(b"\xff\xd8")
+
+
+def test_segment_store():
+    """Test part data is written to a ring file."""
+    store = SegmentStore(size=10)
+
+    position, data = store.write(b"abcd")
+    assert position == 0
+    assert data == b"abcd"
+    assert isinstance(data, memoryview)
+    assert data.readonly
+
+    next_position, next_data = store.write(b"efgh")
+    assert next_position == 4
+    assert not store.expired(position)
+
+    # Parts are not split at the end of the file
+    last_position, last_data = store.write(b"ijkl")
+    assert last_position == 10
+    assert last_data == b"ijkl"
+    assert data == b"ijkl"
+    assert store.expired(position)
+    assert not store.expired(next_position)
+    assert next_data == b"efgh"
+
+    # Parts larger than the store are kept in memory
+    position, data = store.write(b"x" * 11)
+    assert position is None
+    assert data == b"x" * 11
+
+    store.close()
+
+
+async def test_keyframe_converter_decoder_fails(hass, caplog):
+    """Test the stream keeps going when the keyframe decoder can't be created."""
+    stream = Stream(hass, STREAM_SOURCE, {})
+    stream.add_provider(HLS_PROVIDER)
+    py_av = MockPyAv()
+    py_av.container.packets = iter(PacketSequence(TEST_SEQUENCE_LENGTH))
+    converter = KeyFrameConverter(hass)
+
+    with patch("av.open", new=py_av.open), patch(
+        "homeassistant.components.stream.core.StreamOutput.put",
+        side_effect=py_av.capture_buffer.capture_output_segment,
+    ), patch("av.CodecContext.create", side_effect=ValueError("No decoder")):
+        segment_buffer = SegmentBuffer(stream.outputs)
+        stream_worker(STREAM_SOURCE, {}, segment_buffer, threading.Event(), converter)
+        await hass.async_block_till_done()
+
+    assert "Unable to create still images of the stream" in caplog.text
+    assert converter.packet is None
+    assert len(py_av.capture_buffer.complete_segments) > 0
@@ -1,4 +1,5 @@
 """The tests for the TTS component."""
+import asyncio
 from unittest.mock import PropertyMock, patch
 
 import pytest
@@ -740,3 +741,95 @@ async def test_tags_with_wave(hass, demo_provider):
     )
 
     assert tagged_data != demo_data
+
+
+async def test_identical_messages_coalesced(hass, empty_cache_dir):
+    """Test identical messages requested at once call the provider once."""
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+    config = {tts.DOMAIN: {"platform": "demo"}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    with patch(
+        "homeassistant.components.demo.tts.DemoProvider.get_tts_audio",
+        side_effect=DemoProvider("en").get_tts_audio,
+    ) as mock_get_tts_audio:
+        await asyncio.gather(
+            *(
+                hass.services.async_call(
+                    tts.DOMAIN,
+                    "demo_say",
+                    {
+                        "entity_id": f"media_player.speaker_{idx}",
+                        tts.ATTR_MESSAGE: "There is someone at the door.",
+                    },
+                    blocking=True,
+                )
+                for idx in range(5)
+            )
+        )
+
+    assert len(calls) == 5
+    assert len(mock_get_tts_audio.mock_calls) == 1
+    assert len({call.data[ATTR_MEDIA_CONTENT_ID] for call in calls}) == 1
+
+
+async def test_memory_cache_size(hass, demo_provider, mutagen_mock):
+    """Test the least recently used voices are removed from memory."""
+    manager = tts.SpeechManager(hass)
+    manager.async_register_engine("demo", demo_provider, {})
+    _, demo_data = demo_provider.get_tts_audio("bla", "en")
+    manager.memory_size = len(demo_data) * 2
+
+    first = await manager.async_get_url_path("demo", "first", cache=False)
+    await manager.async_get_url_path("demo", "second", cache=False)
+    # Using the first voice makes the second one the least recently used
+    await manager.async_read_tts(first.split("/")[-1])
+    third = await manager.async_get_url_path("demo", "third", cache=False)
+
+    assert [
+        f"/api/tts_proxy/{entry[tts.MEM_CACHE_FILENAME]}"
+        for entry in manager.mem_cache.values()
+    ] == [first, third]
+
+
+async def test_file_cache_size(hass, demo_provider, empty_cache_dir, mutagen_mock):
+    """Test the least recently used files are removed from the cache dir."""
+    _, demo_data = demo_provider.get_tts_audio("bla", "en")
+    old_file = (
+        empty_cache_dir / "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+    )
+    old_file.write_bytes(demo_data)
+
+    manager = tts.SpeechManager(hass)
+    manager.async_register_engine("demo", demo_provider, {})
+    await manager.async_init_cache(
+        True, str(empty_cache_dir), 300, None, cache_size=len(demo_data) * 2
+    )
+    assert len(manager.file_cache) == 1
+
+    await manager.async_get_url_path("demo", "first")
+    await hass.async_block_till_done()
+    assert old_file.is_file()
+
+    await manager.async_get_url_path("demo", "second")
+    await hass.async_block_till_done()
+    assert not old_file.is_file()
+    assert len(list(empty_cache_dir.iterdir())) == 2
+    assert len(manager.file_cache) == 2
+
+
+async def test_preload_messages(hass, empty_cache_dir):
+    """Test configured messages are generated when started."""
+    config = {
+        tts.DOMAIN: {"platform": "demo", "preload": ["There is someone at the door."]}
+    }
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+    await hass.async_block_till_done()
+
+    assert (
+        empty_cache_dir / "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+    ).is_file()
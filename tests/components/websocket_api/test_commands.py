@@ -16,7 +16,7 @@ from homeassistant.components.websocket_api.auth import (
 from homeassistant.components.websocket_api.const import URL
 from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity
+from homeassistant.helpers import entity, startup_trace
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
@@ -459,6 +459,54 @@ async def test_ping(websocket_client):
     assert msg["type"] == "pong"
 
 
+async def test_supported_features(websocket_client):
+    """Test setting the features the client supports."""
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_COALESCE_WINDOW: const.MAX_COALESCE_WINDOW + 1,
+            },
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+    await websocket_client.send_json(
+        {
+            "id": 6,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: "yes"},
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_COALESCE_WINDOW: 10,
+                "unknown_feature": 1,
+            },
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+
+
 async def test_call_service_context_with_user(hass, aiohttp_client, hass_access_token):
     """Test that the user is set in the service call context."""
     assert await async_setup_component(hass, "websocket_api", {})
@@ -1189,3 +1237,56 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         {"domain": "august", "seconds": 12.5},
         {"domain": "isy994", "seconds": 12.8},
     ]
+
+
+async def test_integration_startup_trace(hass, websocket_client):
+    """Test fetching the startup trace."""
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_trace"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    tracer = startup_trace.StartupTracer()
+    hass.data[startup_trace.DATA_STARTUP_TRACE] = tracer
+    with tracer.trace(startup_trace.PHASE_SETUP, "august"):
+        pass
+
+    await websocket_client.send_json({"id": 8, "type": "integration/startup_trace"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+    assert msg["result"]["traceEvents"] == [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 1,
+            "args": {"name": "august"},
+        },
+        {
+            "name": "setup",
+            "cat": "august",
+            "ph": "X",
+            "ts": ANY,
+            "dur": ANY,
+            "pid": 1,
+            "tid": 1,
+        },
+    ]
+
+
+async def test_integration_startup_trace_requires_admin(
+    hass, websocket_client, hass_admin_user
+):
+    """Test fetching the startup trace requires an admin."""
+    hass_admin_user.groups = []
+    hass.data[startup_trace.DATA_STARTUP_TRACE] = startup_trace.StartupTracer()
+
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_trace"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
@@ -66,6 +66,81 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+@pytest.fixture
+def mock_handler():
+    """Capture the websocket handler of the connection."""
+    orig_handler = http.WebSocketHandler
+    handlers = []
+
+    def instantiate_handler(*args):
+        handlers.append(orig_handler(*args))
+        return handlers[-1]
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        yield handlers
+
+
+async def test_coalesce_messages(hass, mock_handler, websocket_client):
+    """Test queued messages are sent as one frame when the client supports it."""
+    instance = mock_handler[0]
+
+    for idx in range(2):
+        instance._send_message({"id": idx})
+    assert await websocket_client.receive_json() == {"id": 0}
+    assert await websocket_client.receive_json() == {"id": 1}
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+
+    for idx in range(3):
+        instance._send_message({"id": idx})
+    assert await websocket_client.receive_json() == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    # A single message is not wrapped
+    instance._send_message({"id": 3})
+    assert await websocket_client.receive_json() == {"id": 3}
+
+
+async def test_coalesce_window(hass, mock_handler, websocket_client):
+    """Test waiting for more messages to coalesce."""
+    instance = mock_handler[0]
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_COALESCE_WINDOW: 20,
+            },
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    with patch("homeassistant.components.websocket_api.http.asyncio.sleep") as sleep:
+
+        async def send_another(seconds):
+            instance._send_message({"id": 1})
+
+        sleep.side_effect = send_another
+        instance._send_message({"id": 0})
+        assert await websocket_client.receive_json() == [{"id": 0}, {"id": 1}]
+
+    sleep.assert_called_once_with(0.02)
+
+
 async def test_non_json_message(hass, websocket_client, caplog):
     """Test trying to serialize non JSON objects."""
     bad_data = object()
@@ -885,3 +885,18 @@ async def test_no_name(hass, mock_async_zeroconf):
     register_call = mock_async_zeroconf.async_register_service.mock_calls[-1]
     info = register_call.args[0]
     assert info.name == "Home._home-assistant._tcp.local."
+
+
+def test_homekit_models_first_match():
+    """Test the first matching HomeKit model wins."""
+    homekit_models = zeroconf.HomeKitModels(
+        {"LIFX": "lifx", "LIFX Mini*": "other", "Smart Bridge": "lutron_caseta"}
+    )
+
+    assert homekit_models.async_match("LIFX") == "lifx"
+    assert homekit_models.async_match("LIFX Mini Color") == "lifx"
+    assert homekit_models.async_match("Smart Bridge-2") == "lutron_caseta"
+    assert homekit_models.async_match("Smart") is None
+
+    homekit_models = zeroconf.HomeKitModels({"LIFX Mini*": "other", "LIFX": "lifx"})
+    assert homekit_models.async_match("LIFX Mini Color") == "other"
@@ -503,3 +503,68 @@ async def test_unavailable_zone(hass):
     assert zone.async_active_zone(hass, 0.0, 0.01) is None
 
     assert zone.in_zone(hass.states.get("zone.bla"), 0, 0) is False
+
+
+async def test_active_zone_index(hass):
+    """Test the zone index only returns nearby zones and follows changes."""
+    assert await setup.async_setup_component(hass, DOMAIN, {"zone": {}})
+    for name, latitude, longitude, radius in (
+        ("near", 32.8806, -117.2375, 250),
+        ("far", 40.7128, -74.006, 250),
+        ("huge", 0, 0, 20000000),
+        ("east", 0, 179.9999, 1000),
+    ):
+        hass.states.async_set(
+            f"zone.{name}",
+            "zoning",
+            {"latitude": latitude, "longitude": longitude, "radius": radius},
+        )
+
+    index = zone._async_get_zone_index(hass)
+    candidates = [
+        state.entity_id for state in index.async_candidates(32.8806, -117.2375, 0)
+    ]
+    assert candidates == sorted(candidates)
+    assert "zone.near" in candidates
+    assert "zone.huge" in candidates
+    assert "zone.far" not in candidates
+    assert "zone.east" not in candidates
+    assert zone.async_active_zone(hass, 32.8806, -117.2375).entity_id == "zone.near"
+    assert zone.async_active_zone(hass, 40.7128, -74.006).entity_id == "zone.far"
+    # Zones are found across the antimeridian
+    assert zone.async_active_zone(hass, 0, -179.9999).entity_id == "zone.east"
+
+    hass.states.async_set(
+        "zone.near",
+        "zoning",
+        {"latitude": 32.8806, "longitude": -117.2375, "radius": 250, "passive": True},
+    )
+    # Direct state writes are picked up before the state changed event is handled
+    assert zone.async_active_zone(hass, 32.8806, -117.2375).entity_id == "zone.huge"
+
+    hass.states.async_remove("zone.huge")
+    assert zone.async_active_zone(hass, 32.8806, -117.2375) is None
+
+
+async def test_active_zone_index_zone_entity(hass):
+    """Test zone entities invalidate the zone index when writing their state."""
+    assert await setup.async_setup_component(hass, DOMAIN, {"zone": {}})
+    config = {
+        "name": "Moving",
+        "latitude": 32.8806,
+        "longitude": -117.2375,
+        "radius": 250,
+        "passive": False,
+    }
+    entity = zone.Zone(config)
+    entity.hass = hass
+    entity.entity_id = "zone.moving"
+    entity.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 32.8806, -117.2375).entity_id == "zone.moving"
+
+    await entity.async_update_config(
+        {**config, "latitude": 40.7128, "longitude": -74.006}
+    )
+    assert zone.async_active_zone(hass, 32.8806, -117.2375) is None
+    assert zone.async_active_zone(hass, 40.7128, -74.006).entity_id == "zone.moving"
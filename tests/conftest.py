@@ -27,7 +27,7 @@ from homeassistant.const import ATTR_NOW, EVENT_TIME_CHANGED
 from homeassistant.exceptions import ServiceNotFound
 from homeassistant.helpers import config_entry_oauth2_flow, event
 from homeassistant.setup import async_setup_component
-from homeassistant.util import location
+from homeassistant.util import location, yaml
 
 from tests.ignore_uncaught_exceptions import IGNORE_UNCAUGHT_EXCEPTIONS
 
@@ -100,6 +100,13 @@ def verify_cleanup():
     assert not threads
 
 
+@pytest.fixture(autouse=True)
+def clear_yaml_parse_cache():
+    """Do not share parsed configuration files between tests."""
+    yield
+    yaml.clear_parse_cache()
+
+
 @pytest.fixture(autouse=True)
 def bcrypt_cost():
     """Run with reduced rounds during tests, to speed up uses."""
@@ -788,3 +788,69 @@ async def test_float_conversion(hass):
     state = hass.states.get("hello.world")
     assert state is not None
     assert state.state == "3.6"
+
+
+async def test_cached_static_attributes(hass):
+    """Test static attributes are cached and unchanged writes return early."""
+
+    class StaticEntity(entity.Entity):
+        """Entity with static attributes."""
+
+        _cache_static_attributes = True
+        _attr_name = "Power"
+        _attr_unit_of_measurement = "W"
+
+    ent = StaticEntity()
+    ent.hass = hass
+    ent.entity_id = "sensor.power"
+    ent._attr_state = 10
+    ent.async_write_ha_state()
+
+    state = hass.states.get("sensor.power")
+    assert state.state == "10"
+    assert state.attributes == {"friendly_name": "Power", "unit_of_measurement": "W"}
+
+    # Static attributes are not recalculated
+    ent._attr_name = "Not used"
+    ent._attr_state = 11
+    ent.async_write_ha_state()
+
+    state = hass.states.get("sensor.power")
+    assert state.state == "11"
+    assert state.attributes["friendly_name"] == "Power"
+
+    # Unchanged writes do not touch the state machine
+    with patch.object(hass.states, "async_set") as mock_set:
+        ent.async_write_ha_state()
+    assert len(mock_set.mock_calls) == 0
+
+    # State changed by someone else is overwritten again
+    hass.states.async_set("sensor.power", "12")
+    ent.async_write_ha_state()
+    assert hass.states.get("sensor.power").state == "11"
+
+    ent.async_invalidate_static_attributes()
+    ent.async_write_ha_state()
+    assert hass.states.get("sensor.power").attributes["friendly_name"] == "Not used"
+
+
+async def test_cached_static_attributes_registry_update(hass):
+    """Test cached static attributes are recalculated on registry changes."""
+    registry = mock_registry(hass)
+
+    class StaticEntity(entity.Entity):
+        """Entity with static attributes."""
+
+        _cache_static_attributes = True
+        _attr_name = "Power"
+        _attr_unique_id = "power"
+
+    platform = MockEntityPlatform(hass, domain="sensor")
+    ent = StaticEntity()
+    await platform.async_add_entities([ent])
+    assert hass.states.get("sensor.power").attributes["friendly_name"] == "Power"
+
+    registry.async_update_entity("sensor.power", name="Renamed")
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.power").attributes["friendly_name"] == "Renamed"
@@ -1,4 +1,7 @@
 """The tests for the EntityFilter component."""
+from unittest.mock import patch
+
+from homeassistant.helpers import entityfilter
 from homeassistant.helpers.entityfilter import (
     FILTER_SCHEMA,
     INCLUDE_EXCLUDE_FILTER_SCHEMA,
@@ -248,3 +251,39 @@ def test_filter_schema_include_exclude():
     }
     filt = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt.config == conf
+
+
+def test_filter_globs_combined():
+    """Test several globs are matched with a single pattern."""
+    testfilter = generate_filter(
+        [], [], [], [], ["sensor.*_temperature", "light.kitchen_?", "switch.[ab]*"]
+    )
+
+    assert testfilter("sensor.bedroom_temperature")
+    assert testfilter("light.kitchen_1")
+    assert testfilter("switch.attic")
+    assert testfilter("sensor.bedroom_temperature_2") is False
+    assert testfilter("light.kitchen_12") is False
+    assert testfilter("switch.cellar") is False
+
+
+def test_filter_caches_decisions():
+    """Test the decision for an entity id is cached until the filter is replaced."""
+    conf = {"include_domains": ["light"], "include_entity_globs": ["sensor.*_power"]}
+
+    with patch.object(
+        entityfilter, "split_entity_id", wraps=entityfilter.split_entity_id
+    ) as mock_split:
+        filt = FILTER_SCHEMA(conf)
+        for _ in range(3):
+            assert filt("light.kitchen")
+            assert filt("sensor.oven_power")
+            assert filt("sensor.oven_temperature") is False
+        assert len(mock_split.mock_calls) == 3
+
+        # A new configuration gets a new filter with its own cache
+        conf["include_domains"] = ["sensor"]
+        filt = FILTER_SCHEMA(conf)
+        assert filt("light.kitchen") is False
+        assert filt("sensor.oven_temperature")
+        assert len(mock_split.mock_calls) == 5
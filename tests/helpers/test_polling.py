@@ -0,0 +1,177 @@
+"""Test the polling scheduler helper."""
+# pylint: disable=protected-access
+import asyncio
+from datetime import timedelta
+import logging
+
+from homeassistant.helpers import polling
+from homeassistant.helpers.entity_component import EntityComponent
+import homeassistant.util.dt as dt_util
+
+from tests.common import (
+    MockEntity,
+    MockEntityPlatform,
+    MockPlatform,
+    async_fire_time_changed,
+)
+
+_LOGGER = logging.getLogger(__name__)
+DOMAIN = "test_domain"
+
+
+async def test_polls_spread_over_interval(hass):
+    """Test entities are polled in their own slot of the interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    entities = [MockEntity(name=f"poll {idx}", should_poll=True) for idx in range(30)]
+    updated = []
+    for entity in entities:
+        entity.async_update = lambda entity=entity: updated.append(entity.entity_id)
+
+    await component.async_add_entities(entities)
+    now = dt_util.utcnow()
+    slots = {
+        entity.entity_id: polling.polling_slot(entity.entity_id) for entity in entities
+    }
+    assert len(set(slots.values())) > 1
+
+    # Slot 0 polls at the full interval, later slots earlier in the interval
+    async_fire_time_changed(hass, now + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert sorted(updated) == sorted(
+        entity_id
+        for entity_id, slot in slots.items()
+        if slot == polling.POLLING_SLOTS - 1
+    )
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert sorted(updated) == sorted(slots)
+
+    updated.clear()
+    async_fire_time_changed(hass, now + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert sorted(updated) == sorted(slots)
+
+
+async def test_polling_stats_and_overruns(hass, caplog):
+    """Test statistics are kept and overlapping polls are skipped."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    entity = MockEntity(name="slow", should_poll=True)
+    release = asyncio.Event()
+
+    async def slow_update():
+        await release.wait()
+
+    entity.async_update = slow_update
+
+    await component.async_add_entities([entity])
+    now = dt_util.utcnow()
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await asyncio.sleep(0)
+    async_fire_time_changed(hass, now + timedelta(seconds=40))
+    await asyncio.sleep(0)
+
+    stats = polling.async_get(hass).stats[entity.entity_id]
+    assert stats.overruns == 1
+    assert stats.updates == 0
+    assert "Updating test_domain.slow took longer than the scheduled" in caplog.text
+
+    release.set()
+    await hass.async_block_till_done()
+
+    assert stats.updates == 1
+    assert stats.last_duration is not None
+    assert stats.max_duration >= stats.last_duration
+
+
+async def _async_max_concurrent_polls(hass, component, platform=None):
+    """Poll 30 entities at once and return how many updates ran concurrently."""
+    entities = [MockEntity(name=f"poll {idx}", should_poll=True) for idx in range(30)]
+    running = 0
+    max_running = 0
+    release = asyncio.Event()
+
+    async def update():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+
+    for entity in entities:
+        entity.async_update = update
+
+    if platform is None:
+        await component.async_add_entities(entities)
+    else:
+        await platform.async_add_entities(entities)
+    now = dt_util.utcnow()
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    release.set()
+    await hass.async_block_till_done()
+    assert running == 0
+    return max_running
+
+
+async def test_polling_concurrency_unlimited_by_default(hass):
+    """Test polls of a platform are only limited by PARALLEL_UPDATES by default."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    assert await _async_max_concurrent_polls(hass, component) == 30
+
+
+async def test_polling_concurrency_budget(hass):
+    """Test a platform can limit the number of concurrent polls."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    platform = MockPlatform()
+    platform.POLLING_CONCURRENCY = 5
+    entity_platform = MockEntityPlatform(
+        hass, platform=platform, scan_interval=timedelta(seconds=20)
+    )
+
+    assert await _async_max_concurrent_polls(hass, component, entity_platform) == 5
+
+
+async def test_polling_stats_pruned(hass):
+    """Test statistics are dropped for removed entities and platforms."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    entities = [MockEntity(name=f"poll {idx}", should_poll=True) for idx in range(2)]
+
+    await component.async_add_entities(entities)
+    now = dt_util.utcnow()
+    scheduler = polling.async_get(hass)
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert set(scheduler.stats) == {entity.entity_id for entity in entities}
+
+    await entities[0].async_remove()
+    async_fire_time_changed(hass, now + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert set(scheduler.stats) == {entities[1].entity_id}
+
+    await component.async_remove_entity(entities[1].entity_id)
+    assert scheduler.stats == {}
+
+
+async def test_untracked_platform_stops_polling(hass):
+    """Test entities are no longer polled when the platform is reset."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    entity = MockEntity(name="poll", should_poll=True)
+    updated = []
+    entity.async_update = lambda: updated.append(True)
+
+    await component.async_add_entities([entity])
+    now = dt_util.utcnow()
+    await component.async_remove_entity(entity.entity_id)
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert not updated
+    assert polling.async_get(hass)._queue == []
@@ -0,0 +1,50 @@
+"""Test the reference index helper."""
+# pylint: disable=protected-access
+from homeassistant.helpers.reference_index import (
+    REFERENCE_AREA,
+    REFERENCE_DEVICE,
+    REFERENCE_ENTITY,
+    ReferenceIndex,
+)
+
+
+def test_reference_index():
+    """Test looking up what references entities, devices and areas."""
+    resolved = []
+
+    def get_references(item):
+        resolved.append(item)
+        return item
+
+    index = ReferenceIndex(get_references)
+    first = {REFERENCE_ENTITY: {"light.both", "light.first"}, REFERENCE_AREA: set()}
+    second = {REFERENCE_ENTITY: {"light.both"}, REFERENCE_DEVICE: {"device"}}
+    index.async_add("script.first", first)
+    index.async_add("script.second", second)
+
+    # References are resolved when the index is used
+    assert resolved == []
+    assert index.async_referencing(REFERENCE_ENTITY, "light.both") == [
+        "script.first",
+        "script.second",
+    ]
+    assert index.async_referencing(REFERENCE_ENTITY, "light.first") == ["script.first"]
+    assert index.async_referencing(REFERENCE_DEVICE, "device") == ["script.second"]
+    assert index.async_referencing(REFERENCE_DEVICE, "light.both") == []
+    assert resolved == [first, second]
+
+    # Adding an entity again replaces what it references
+    index.async_add("script.first", {REFERENCE_AREA: {"kitchen"}})
+    assert index.async_referencing(REFERENCE_ENTITY, "light.both") == ["script.second"]
+    assert index.async_referencing(REFERENCE_AREA, "kitchen") == ["script.first"]
+
+    index.async_remove("script.second")
+    index.async_remove("script.unknown")
+    assert index.async_referencing(REFERENCE_ENTITY, "light.both") == []
+    assert index.async_referencing(REFERENCE_DEVICE, "device") == []
+    assert index._index == {(REFERENCE_AREA, "kitchen"): {"script.first": None}}
+
+    # Removing an entity that was not resolved yet
+    index.async_add("script.third", {REFERENCE_AREA: {"kitchen"}})
+    index.async_remove("script.third")
+    assert index.async_referencing(REFERENCE_AREA, "kitchen") == ["script.first"]
@@ -9,6 +9,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
     STORAGE_KEY,
+    STORAGE_KEY_CHANGES,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -68,11 +69,13 @@ async def test_periodic_write(hass):
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
+        await entity.async_internal_added_to_hass()
         await entity.async_get_last_state()
         await hass.async_block_till_done()
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "on")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -81,6 +84,7 @@ async def test_periodic_write(hass):
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -114,6 +118,7 @@ async def test_save_persistent_states(hass):
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
+        await entity.async_internal_added_to_hass()
         await entity.async_get_last_state()
         await hass.async_block_till_done()
 
@@ -137,6 +142,7 @@ async def test_save_persistent_states(hass):
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "on")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -145,6 +151,7 @@ async def test_save_persistent_states(hass):
     # Verify still saving
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -375,3 +382,66 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_periodic_write_only_changed_states(hass, hass_storage):
+    """Test periodic dumps only write the states that changed."""
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+
+    for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity_id, "off")
+
+    await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 2
+    assert STORAGE_KEY_CHANGES not in hass_storage
+
+    # Nothing changed, nothing is written
+    await data.async_dump_changed_states()
+    assert STORAGE_KEY_CHANGES not in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "on")
+    await data.async_dump_changed_states()
+    changes = hass_storage[STORAGE_KEY_CHANGES]["data"]
+    assert [item["state"]["entity_id"] for item in changes] == ["input_boolean.b1"]
+    assert hass_storage[STORAGE_KEY]["data"][1]["state"]["state"] == "off"
+
+    # A fresh load merges the changes into the last states
+    hass.data[DATA_RESTORE_STATE_TASK] = None
+    reloaded = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    assert reloaded.last_states["input_boolean.b0"].state.state == "off"
+    assert reloaded.last_states["input_boolean.b1"].state.state == "on"
+
+    # A full dump folds the changes back into the states
+    await data.async_dump_states()
+    assert hass_storage[STORAGE_KEY_CHANGES]["data"] == []
+    assert hass_storage[STORAGE_KEY]["data"][1]["state"]["state"] == "on"
+
+
+async def test_outdated_changes_ignored(hass, hass_storage):
+    """Test changes older than the full dump are not restored."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [StoredState(State("input_boolean.b0", "on"), now).as_dict()],
+    }
+    hass_storage[STORAGE_KEY_CHANGES] = {
+        "version": 1,
+        "key": STORAGE_KEY_CHANGES,
+        "data": [
+            StoredState(
+                State("input_boolean.b0", "off"), now - timedelta(minutes=15)
+            ).as_dict(),
+            StoredState(State("input_boolean.b1", "off"), now).as_dict(),
+        ],
+    }
+
+    data = await RestoreStateData.async_get_instance(hass)
+    assert data.last_states["input_boolean.b0"].state.state == "on"
+    assert data.last_states["input_boolean.b1"].state.state == "off"
@@ -0,0 +1,96 @@
+"""Test the startup trace helper."""
+import time
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.helpers import startup_trace
+from homeassistant.setup import async_setup_component
+
+from tests.common import (
+    MockEntity,
+    MockModule,
+    MockPlatform,
+    mock_entity_platform,
+    mock_integration,
+)
+
+
+def _events(tracer, component):
+    """Return the names of the events of a component."""
+    return [event["name"] for event in tracer.events if event["cat"] == component]
+
+
+async def test_trace_setup_phases(hass):
+    """Test the phases of setting up integrations and platforms are traced."""
+    tracer = startup_trace.async_enable(hass)
+
+    async def async_setup(hass, config):
+        await hass.async_add_executor_job(time.sleep, 0)
+        return True
+
+    async def async_setup_platform(hass, config, async_add_entities, discovery=None):
+        async_add_entities([MockEntity(name="one"), MockEntity(name="two")])
+
+    mock_integration(hass, MockModule("comp", async_setup=async_setup))
+    mock_entity_platform(
+        hass, "switch.comp", MockPlatform(async_setup_platform=async_setup_platform)
+    )
+
+    assert await async_setup_component(hass, "comp", {})
+    assert await async_setup_component(hass, "switch", {"switch": {"platform": "comp"}})
+    await hass.async_block_till_done()
+
+    comp_events = _events(tracer, "comp")
+    for phase in (
+        startup_trace.PHASE_IMPORT,
+        startup_trace.PHASE_CONFIG_VALIDATION,
+        startup_trace.PHASE_SETUP,
+        startup_trace.PHASE_EXECUTOR_WAIT,
+        startup_trace.PHASE_EXECUTOR_JOB,
+    ):
+        assert phase in comp_events
+
+    executor_job = next(
+        event
+        for event in tracer.events
+        if event["name"] == startup_trace.PHASE_EXECUTOR_JOB and event["cat"] == "comp"
+    )
+    assert executor_job["args"] == {"job": "sleep"}
+    assert executor_job["ph"] == "X"
+    assert executor_job["dur"] >= 0
+
+    platform_events = _events(tracer, "switch.comp")
+    assert startup_trace.PHASE_PLATFORM_SETUP in platform_events
+    assert platform_events.count(startup_trace.PHASE_FIRST_STATE_WRITE) == 1
+
+    trace = tracer.as_chrome_trace()
+    thread_names = {
+        event["args"]["name"]: event["tid"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    assert thread_names["comp"] == executor_job["tid"]
+    assert "switch.comp" in thread_names
+
+
+async def test_trace_stops_when_started(hass):
+    """Test tracing stops once Home Assistant has started."""
+    run_in_executor = hass.loop.run_in_executor
+    tracer = startup_trace.async_enable(hass)
+    assert hass.loop.run_in_executor != run_in_executor
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    assert not tracer.active
+    assert hass.loop.run_in_executor == run_in_executor
+
+    mock_integration(hass, MockModule("comp"))
+    assert await async_setup_component(hass, "comp", {})
+    assert not tracer.events
+
+
+async def test_trace_not_enabled(hass):
+    """Test nothing is traced when tracing is not enabled."""
+    mock_integration(hass, MockModule("comp"))
+    assert await async_setup_component(hass, "comp", {})
+    assert startup_trace.DATA_STARTUP_TRACE not in hass.data
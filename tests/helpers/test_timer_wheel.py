@@ -0,0 +1,109 @@
+"""Test the timer wheel helper."""
+# pylint: disable=protected-access
+from datetime import timedelta
+
+from homeassistant.helpers import event
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+
+def _armed_handles(hass):
+    """Return the loop timers armed by the timer wheel."""
+    wheel = event.async_get_timer_wheel(hass)
+    return [
+        handle
+        for handle in hass.loop._scheduled
+        if not handle.cancelled() and handle._callback == wheel._async_fire
+    ]
+
+
+async def test_timers_share_loop_timer(hass):
+    """Test timers are run in order from a single loop timer."""
+    wheel = event.async_get_timer_wheel(hass)
+    now = dt_util.utcnow()
+    calls = []
+
+    for delay in (5, 1, 3, 1.5, 60):
+        event.async_call_later(hass, delay, lambda _, delay=delay: calls.append(delay))
+
+    assert wheel.pending == 5
+    assert len(_armed_handles(hass)) == 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=10))
+    await hass.async_block_till_done()
+
+    assert calls == [1, 1.5, 3, 5]
+    assert wheel.pending == 1
+    assert len(_armed_handles(hass)) == 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=61))
+    await hass.async_block_till_done()
+
+    assert calls == [1, 1.5, 3, 5, 60]
+    assert wheel.pending == 0
+    assert not _armed_handles(hass)
+
+
+async def test_rearming_timers(hass):
+    """Test re-armed timers do not pile up on the event loop."""
+    wheel = event.async_get_timer_wheel(hass)
+    now = dt_util.utcnow()
+    calls = []
+
+    unsub = event.async_call_later(hass, 30, calls.append)
+    for _ in range(100):
+        unsub()
+        unsub = event.async_call_later(hass, 30, calls.append)
+
+    assert wheel.pending == 1
+    assert len(_armed_handles(hass)) == 1
+    assert sum(1 for handle in hass.loop._scheduled if handle.cancelled()) <= 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=31))
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert wheel.pending == 0
+
+
+async def test_timer_cancelled_by_due_timer(hass):
+    """Test a due timer that is cancelled by a timer that ran before it."""
+    now = dt_util.utcnow()
+    calls = []
+
+    unsub_second = None
+
+    def first(_):
+        calls.append("first")
+        unsub_second()
+
+    event.async_call_later(hass, 1, first)
+    unsub_second = event.async_call_later(hass, 2, lambda _: calls.append("second"))
+
+    async_fire_time_changed(hass, now + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    assert calls == ["first"]
+    assert event.async_get_timer_wheel(hass).pending == 0
+
+
+async def test_timer_fired_early(hass):
+    """Test timers that are not due yet when the loop timer fires are kept."""
+    wheel = event.async_get_timer_wheel(hass)
+    now = dt_util.utcnow()
+    calls = []
+
+    event.async_call_later(hass, 10.5, calls.append)
+
+    async_fire_time_changed(hass, now + timedelta(seconds=10.4), fire_all=True)
+    await hass.async_block_till_done()
+
+    assert not calls
+    assert wheel.pending == 1
+    assert len(_armed_handles(hass)) == 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
@@ -1,15 +1,20 @@
 """Test the translation helper."""
 import asyncio
+from datetime import timedelta
 from os import path
 import pathlib
 from unittest.mock import Mock, patch
 
 import pytest
 
+from homeassistant.const import __version__
 from homeassistant.generated import config_flows
 from homeassistant.helpers import translation
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component, setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture
@@ -307,10 +312,10 @@ async def test_caching(hass):
         side_effect=translation._merge_resources,
     ) as mock_merge:
         load1 = await translation.async_get_translations(hass, "en", "state")
-        assert len(mock_merge.mock_calls) == 1
+        assert len(mock_merge.mock_calls) == 2
 
         load2 = await translation.async_get_translations(hass, "en", "state")
-        assert len(mock_merge.mock_calls) == 1
+        assert len(mock_merge.mock_calls) == 2
 
         assert load1 == load2
 
@@ -367,3 +372,54 @@ async def test_custom_component_translations(hass, enable_custom_integrations):
     hass.config.components.add("test_embedded")
     hass.config.components.add("test_package")
     assert await translation.async_get_translations(hass, "en", "state") == {}
+
+
+async def test_translation_bundle_persisted(hass, hass_storage):
+    """Test flattened translations are stored and reused after a restart."""
+    hass.config.components.add("light")
+
+    load1 = await translation.async_get_translations(hass, "en", "state")
+    assert "component.light.state._.on" in load1
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=translation.STORAGE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    stored = hass_storage[f"{translation.STORAGE_KEY}.en"]["data"]
+    assert stored["ha_version"] == __version__
+    assert stored["components"]["light"]["resources"]["light"][
+        "state"
+    ] == translation.recursive_flatten(
+        "component.light.state.", {"_": {"off": "Off", "on": "On"}}
+    )
+
+    # A new run loads the unchanged translations from the bundle
+    hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+    with patch(
+        "homeassistant.helpers.translation.async_get_component_strings",
+    ) as mock_strings:
+        load2 = await translation.async_get_translations(hass, "en", "state")
+    assert not mock_strings.mock_calls
+    assert load1 == load2
+
+    # Translations are loaded again when the translation file changed
+    stored["components"]["light"]["stamp"][2] = 0
+    hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+    with patch(
+        "homeassistant.helpers.translation.async_get_component_strings",
+        side_effect=translation.async_get_component_strings,
+    ) as mock_strings:
+        load3 = await translation.async_get_translations(hass, "en", "state")
+    assert len(mock_strings.mock_calls) == 1
+    assert load1 == load3
+
+    # The bundle of another Home Assistant version is discarded
+    stored["ha_version"] = "0.1"
+    hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+    with patch(
+        "homeassistant.helpers.translation.async_get_component_strings",
+        side_effect=translation.async_get_component_strings,
+    ) as mock_strings:
+        await translation.async_get_translations(hass, "en", "state")
+    assert len(mock_strings.mock_calls) == 1
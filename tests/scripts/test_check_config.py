@@ -27,6 +27,11 @@ async def apply_stop_hass(stop_hass):
     """Make sure all hass are stopped."""
 
 
+@pytest.fixture(autouse=True)
+def mock_storage(hass_storage):
+    """Do not write the resolved custom integrations to the test config dir."""
+
+
 def normalize_yaml_files(check_dict):
     """Remove configuration path from ['yaml_files']."""
     root = get_test_config_dir()
@@ -0,0 +1,44 @@
+"""Test the startup trace script."""
+# pylint: disable=protected-access
+from homeassistant.helpers import startup_trace
+from homeassistant.scripts import startup_trace as script_startup_trace
+
+
+def test_print_report(capsys):
+    """Test the report of the slowest integrations."""
+    tracer = startup_trace.StartupTracer()
+    # Events are added with timestamps relative to the start of tracing
+    tracer._start = 0
+    tracer._add_event(startup_trace.PHASE_IMPORT, "fast", 0, 0.1)
+    tracer._add_event(startup_trace.PHASE_SETUP, "slow", 0, 2)
+    tracer._add_event(startup_trace.PHASE_EXECUTOR_JOB, "slow", 0.5, 1.5)
+    tracer._add_event(startup_trace.PHASE_SETUP_ENTRY, "slow", 2, 3)
+    tracer._add_event(startup_trace.PHASE_FIRST_STATE_WRITE, "slow", 3)
+    trace = tracer.as_chrome_trace()
+
+    assert script_startup_trace.summarize(trace) == {
+        "fast": {"import": 0.1},
+        "slow": {
+            "setup": 2,
+            "executor_job": 1,
+            "setup_entry": 1,
+            "first_state_write": 3,
+        },
+    }
+
+    script_startup_trace.print_report(trace, 1)
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        "slow: 3.00s",
+        "  executor_job: 1.00s",
+        "  first_state_write: at 3.00s",
+        "  setup: 2.00s",
+        "  setup_entry: 1.00s",
+    ]
+
+
+def test_run_requires_token(capsys, monkeypatch):
+    """Test the script requires an access token."""
+    monkeypatch.delenv("HASS_TOKEN", raising=False)
+    assert script_startup_trace.run([]) == 1
+    assert "An access token is required" in capsys.readouterr().out
@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
@@ -111,6 +111,29 @@ async def test_setting_up_config(hass):
     assert "group" in hass.config.components
 
 
+async def test_prewarm_imports_from_config(hass):
+    """Test the integrations and platforms configured are imported ahead."""
+    integrations = {
+        "sensor": await loader.async_get_integration(hass, "sensor"),
+        "group": await loader.async_get_integration(hass, "group"),
+    }
+    config = {
+        "sensor": [{"platform": "template"}, {"platform": "non_existing"}],
+        "sensor 2": {"platform": "demo"},
+        "group": {"kitchen": {"entities": []}},
+    }
+
+    with patch("homeassistant.loader.async_prewarm_imports") as mock_prewarm:
+        await bootstrap._async_prewarm_imports(hass, config, integrations)
+
+    assert mock_prewarm.mock_calls[0][1][1] == {
+        "homeassistant.components.sensor",
+        "homeassistant.components.group",
+        "homeassistant.components.template.sensor",
+        "homeassistant.components.demo.sensor",
+    }
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_all_present(hass):
     """Test after_dependencies when all present."""
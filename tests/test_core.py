@@ -547,6 +547,44 @@ async def test_eventbus_coroutine_event_listener(hass):
     assert len(coroutine_calls) == 1
 
 
+async def test_eventbus_time_changed_not_sent_to_match_all(hass):
+    """Test time changed events only go to their own listeners."""
+    match_all_calls = async_capture_events(hass, MATCH_ALL)
+    time_changed_calls = async_capture_events(hass, EVENT_TIME_CHANGED)
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    assert [event.event_type for event in match_all_calls] == ["test_event"]
+    assert len(time_changed_calls) == 1
+
+
+async def test_tick_scheduler(hass, caplog):
+    """Test running callbacks on timer ticks."""
+    calls = []
+
+    @ha.callback
+    def failing_listener(now):
+        raise ValueError("tick failed")
+
+    @ha.callback
+    def tick_listener(now):
+        calls.append(now)
+
+    hass.ticks.async_listen(failing_listener)
+    remove = hass.ticks.async_listen(tick_listener)
+
+    now = dt_util.utcnow()
+    hass.ticks.async_tick(now)
+    assert calls == [now]
+    assert "Error running tick callback" in caplog.text
+
+    remove()
+    hass.ticks.async_tick(now)
+    assert calls == [now]
+
+
 async def test_eventbus_max_length_exceeded(hass):
     """Test that an exception is raised when the max character length is exceeded."""
 
@@ -1097,6 +1135,10 @@ def test_create_timer(mock_monotonic, loop):
     assert event_type == EVENT_TIME_CHANGED
     assert event_data[ATTR_NOW] == datetime(2018, 12, 31, 3, 4, 6, 100000)
 
+    assert hass.ticks.async_tick.mock_calls[0][1] == (
+        datetime(2018, 12, 31, 3, 4, 6, 100000),
+    )
+
 
 @patch("homeassistant.core.monotonic")
 def test_timer_out_of_sync(mock_monotonic, loop):
@@ -1,13 +1,26 @@
 """Test to verify that we can load components."""
-from unittest.mock import patch
+from datetime import timedelta
+import json
+import logging
+import os
+import pathlib
+import time
+from unittest.mock import Mock, patch
 
 import pytest
 
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+import homeassistant.util.dt as dt_util
 
-from tests.common import MockModule, async_mock_service, mock_integration
+from tests.common import (
+    MockModule,
+    async_fire_time_changed,
+    async_mock_service,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass):
@@ -53,6 +66,32 @@ async def test_component_dependencies(hass):
         )
 
 
+async def test_component_dependencies_reuse_resolved(hass):
+    """Test the dependencies of resolved integrations are reused."""
+    mock_integration(hass, MockModule("mod1"))
+    mod_2 = mock_integration(hass, MockModule("mod2", ["mod1"]))
+    mod_3 = mock_integration(hass, MockModule("mod3", ["mod2"]))
+
+    assert await mod_2.resolve_dependencies()
+
+    with patch(
+        "homeassistant.loader._async_component_dependencies",
+        wraps=loader._async_component_dependencies,
+    ) as mock_deps:
+        assert await mod_3.resolve_dependencies()
+
+    assert mock_deps.call_count == 1
+    assert mod_3.all_dependencies == {"mod1", "mod2"}
+
+    # An after dependency of a dependency of a resolved integration
+    mock_integration(
+        hass, MockModule("mod1", partial_manifest={"after_dependencies": ["mod4"]})
+    )
+    mod_4 = mock_integration(hass, MockModule("mod4", ["mod2"]))
+
+    assert not await mod_4.resolve_dependencies()
+
+
 def test_component_loader(hass):
     """Test loading components."""
     components = loader.Components(hass)
@@ -404,6 +443,165 @@ async def test_get_custom_components(hass, enable_custom_integrations):
         mock_get.assert_called_once_with(hass)
 
 
+async def test_builtin_integration_from_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    with patch.object(loader.Integration, "resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_resolve.called
+    assert integration.pkg_path == "homeassistant.components.hue"
+    assert integration.file_path == pathlib.Path(hue.__file__).parent
+    assert integration.manifest == {
+        **json.loads((integration.file_path / "manifest.json").read_text()),
+        "is_built_in": True,
+    }
+    assert "is_built_in" not in loader._BUILTIN_MANIFESTS["hue"]
+
+
+def test_builtin_manifest_index_stale(tmp_path, caplog):
+    """Test manifests changed after the index was generated are not used."""
+    index_path = tmp_path / "manifests.json"
+    index_path.write_text(
+        json.dumps(
+            {
+                "hue": {"domain": "hue", "name": "Stale"},
+                "not_an_integration": {"domain": "not_an_integration"},
+            }
+        )
+    )
+    future = time.time() + 3600
+
+    with patch.object(loader, "BUILTIN_MANIFESTS_PATH", index_path):
+        os.utime(index_path, (future, future))
+        assert loader._load_builtin_manifests() == {
+            "hue": {"domain": "hue", "name": "Stale"}
+        }
+        assert "out of date for not_an_integration" in caplog.text
+
+        os.utime(index_path, (0, 0))
+        assert loader._load_builtin_manifests() == {}
+        assert "out of date for hue, not_an_integration" in caplog.text
+
+
+async def test_custom_manifests_cached(hass, hass_storage, enable_custom_integrations):
+    """Test the manifests of custom integrations are cached."""
+    integrations = await loader._async_get_custom_components(hass)
+    assert "test_package" in integrations
+    assert "test_no_version" not in integrations
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.CUSTOM_MANIFESTS_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    cached = hass_storage[loader.CUSTOM_MANIFESTS_STORAGE_KEY]["data"]["manifests"]
+    assert len(cached) == 5
+
+    with patch("pathlib.Path.read_text", side_effect=OSError) as mock_read:
+        cached_integrations = await loader._async_get_custom_components(hass)
+
+    assert not mock_read.called
+    assert cached_integrations.keys() == integrations.keys()
+    assert (
+        cached_integrations["test_package"].manifest
+        == integrations["test_package"].manifest
+    )
+
+    # A changed manifest is read again
+    for entry in cached.values():
+        entry["stamp"][0] -= 1
+
+    with patch("pathlib.Path.read_text", side_effect=OSError) as mock_read:
+        assert await loader._async_get_custom_components(hass) == {}
+
+    assert mock_read.call_count == 5
+
+
+async def test_prewarm_imports(hass, hass_storage):
+    """Test modules are imported ahead of time, the slowest of last run first."""
+    hass_storage[loader.IMPORTS_STORAGE_KEY] = {
+        "version": loader.IMPORTS_STORAGE_VERSION,
+        "key": loader.IMPORTS_STORAGE_KEY,
+        "data": {
+            "modules": {
+                "homeassistant.components.prewarm_fast.sensor": 0.1,
+                "homeassistant.components.prewarm_slow.sensor": 2.0,
+                # Already imported
+                "homeassistant.components.hue": 1.0,
+            }
+        },
+    }
+    imported = []
+
+    def mock_import_module(name):
+        imported.append(name)
+        if name == "homeassistant.components.prewarm_broken":
+            raise ImportError
+        return Mock()
+
+    with patch(
+        "homeassistant.loader.importlib.import_module", side_effect=mock_import_module
+    ):
+        await loader.async_prewarm_imports(
+            hass,
+            {
+                "homeassistant.components.prewarm_new",
+                "homeassistant.components.prewarm_broken",
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert imported[:2] == [
+        "homeassistant.components.prewarm_slow.sensor",
+        "homeassistant.components.prewarm_fast.sensor",
+    ]
+    assert set(imported[2:]) == {
+        "homeassistant.components.prewarm_new",
+        "homeassistant.components.prewarm_broken",
+    }
+    assert set(hass.data[loader.DATA_IMPORTS].prewarmed) == {
+        "homeassistant.components.prewarm_slow.sensor",
+        "homeassistant.components.prewarm_fast.sensor",
+        "homeassistant.components.prewarm_new",
+    }
+
+
+async def test_used_imports_saved(hass, hass_storage):
+    """Test the modules used are stored once Home Assistant has started."""
+    await loader.async_prewarm_imports(hass, set())
+    await hass.async_block_till_done()
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.get_component() is hue
+    assert integration.get_platform("light") is hue_light
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.IMPORTS_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    modules = hass_storage[loader.IMPORTS_STORAGE_KEY]["data"]["modules"]
+    assert set(modules) == {
+        "homeassistant.components.hue",
+        "homeassistant.components.hue.light",
+    }
+
+
+async def test_import_in_event_loop_logged(hass, caplog):
+    """Test imports done in the event loop are logged."""
+    caplog.set_level(logging.DEBUG, logger="homeassistant.loader")
+
+    with patch("homeassistant.loader.importlib.import_module", return_value=Mock()):
+        await hass.async_add_executor_job(
+            loader._import_module, hass, "homeassistant.components.in_executor"
+        )
+        loader._import_module(hass, "homeassistant.components.in_loop")
+
+    assert "Imported homeassistant.components.in_loop in the event loop" in caplog.text
+    assert "homeassistant.components.in_executor in the event loop" not in caplog.text
+
+
 async def test_get_config_flows(hass):
     """Verify that custom components with config_flow are available."""
     test_1_integration = _get_test_integration(hass, "test_1", False)
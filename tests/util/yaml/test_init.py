@@ -14,19 +14,25 @@ from homeassistant.util.yaml import loader as yaml_loader
 from tests.common import get_test_config_dir, patch_yaml_files
 
 
-def test_simple_list():
+@pytest.fixture(params=["SafeLoader", "SafeLineLoader"])
+def try_both_loaders(request):
+    """Run the test with the libyaml based loader and the Python loader."""
+    return getattr(yaml_loader, request.param)
+
+
+def test_simple_list(try_both_loaders):
     """Test simple list."""
     conf = "config:\n  - simple\n  - list"
     with io.StringIO(conf) as file:
-        doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+        doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
     assert doc["config"] == ["simple", "list"]
 
 
-def test_simple_dict():
+def test_simple_dict(try_both_loaders):
     """Test simple dict."""
     conf = "key: value"
     with io.StringIO(conf) as file:
-        doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+        doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
     assert doc["key"] == "value"
 
 
@@ -44,60 +50,60 @@ def test_no_key():
         yaml.load_yaml(YAML_CONFIG_FILE)
 
 
-def test_environment_variable():
+def test_environment_variable(try_both_loaders):
     """Test config file with environment variable."""
     os.environ["PASSWORD"] = "secret_password"
     conf = "password: !env_var PASSWORD"
     with io.StringIO(conf) as file:
-        doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+        doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
     assert doc["password"] == "secret_password"
     del os.environ["PASSWORD"]
 
 
-def test_environment_variable_default():
+def test_environment_variable_default(try_both_loaders):
     """Test config file with default value for environment variable."""
     conf = "password: !env_var PASSWORD secret_password"
     with io.StringIO(conf) as file:
-        doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+        doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
     assert doc["password"] == "secret_password"
 
 
-def test_invalid_environment_variable():
+def test_invalid_environment_variable(try_both_loaders):
     """Test config file with no environment variable sat."""
     conf = "password: !env_var PASSWORD"
     with pytest.raises(HomeAssistantError), io.StringIO(conf) as file:
-        yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+        yaml_loader.yaml.load(file, Loader=try_both_loaders)
 
 
-def test_include_yaml():
+def test_include_yaml(try_both_loaders):
     """Test include yaml."""
     with patch_yaml_files({"test.yaml": "value"}):
         conf = "key: !include test.yaml"
         with io.StringIO(conf) as file:
-            doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+            doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
             assert doc["key"] == "value"
 
     with patch_yaml_files({"test.yaml": None}):
         conf = "key: !include test.yaml"
         with io.StringIO(conf) as file:
-            doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+            doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
             assert doc["key"] == {}
 
 
 @patch("homeassistant.util.yaml.loader.os.walk")
-def test_include_dir_list(mock_walk):
+def test_include_dir_list(mock_walk, try_both_loaders):
     """Test include dir list yaml."""
     mock_walk.return_value = [["/test", [], ["two.yaml", "one.yaml"]]]
 
     with patch_yaml_files({"/test/one.yaml": "one", "/test/two.yaml": "two"}):
         conf = "key: !include_dir_list /test"
         with io.StringIO(conf) as file:
-            doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+            doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
             assert doc["key"] == sorted(["one", "two"])
 
 
 @patch("homeassistant.util.yaml.loader.os.walk")
-def test_include_dir_list_recursive(mock_walk):
+def test_include_dir_list_recursive(mock_walk, try_both_loaders):
     """Test include dir recursive list yaml."""
     mock_walk.return_value = [
         ["/test", ["tmp2", ".ignore", "ignore"], ["zero.yaml"]],
@@ -117,14 +123,14 @@ def test_include_dir_list_recursive(mock_walk):
             assert (
                 ".ignore" in mock_walk.return_value[0][1]
             ), "Expecting .ignore in here"
-            doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+            doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
             assert "tmp2" in mock_walk.return_value[0][1]
             assert ".ignore" not in mock_walk.return_value[0][1]
             assert sorted(doc["key"]) == sorted(["zero", "one", "two"])
 
 
 @patch("homeassistant.util.yaml.loader.os.walk")
-def test_include_dir_named(mock_walk):
+def test_include_dir_named(mock_walk, try_both_loaders):
     """Test include dir named yaml."""
     mock_walk.return_value = [
         ["/test", [], ["first.yaml", "second.yaml", "secrets.yaml"]]
@@ -134,12 +140,12 @@ def test_include_dir_named(mock_walk):
         conf = "key: !include_dir_named /test"
         correct = {"first": "one", "second": "two"}
         with io.StringIO(conf) as file:
-            doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+            doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
             assert doc["key"] == correct
 
 
 @patch("homeassistant.util.yaml.loader.os.walk")
-def test_include_dir_named_recursive(mock_walk):
+def test_include_dir_named_recursive(mock_walk, try_both_loaders):
     """Test include dir named yaml."""
     mock_walk.return_value = [
         ["/test", ["tmp2", ".ignore", "ignore"], ["first.yaml"]],
@@ -160,14 +166,14 @@ def test_include_dir_named_recursive(mock_walk):
             assert (
                 ".ignore" in mock_walk.return_value[0][1]
             ), "Expecting .ignore in here"
-            doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+            doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
             assert "tmp2" in mock_walk.return_value[0][1]
             assert ".ignore" not in mock_walk.return_value[0][1]
             assert doc["key"] == correct
 
 
 @patch("homeassistant.util.yaml.loader.os.walk")
-def test_include_dir_merge_list(mock_walk):
+def test_include_dir_merge_list(mock_walk, try_both_loaders):
     """Test include dir merge list yaml."""
     mock_walk.return_value = [["/test", [], ["first.yaml", "second.yaml"]]]
 
@@ -176,12 +182,12 @@ def test_include_dir_merge_list(mock_walk):
     ):
         conf = "key: !include_dir_merge_list /test"
         with io.StringIO(conf) as file:
-            doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+            doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
             assert sorted(doc["key"]) == sorted(["one", "two", "three"])
 
 
 @patch("homeassistant.util.yaml.loader.os.walk")
-def test_include_dir_merge_list_recursive(mock_walk):
+def test_include_dir_merge_list_recursive(mock_walk, try_both_loaders):
     """Test include dir merge list yaml."""
     mock_walk.return_value = [
         ["/test", ["tmp2", ".ignore", "ignore"], ["first.yaml"]],
@@ -201,14 +207,14 @@ def test_include_dir_merge_list_recursive(mock_walk):
             assert (
                 ".ignore" in mock_walk.return_value[0][1]
             ), "Expecting .ignore in here"
-            doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+            doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
             assert "tmp2" in mock_walk.return_value[0][1]
             assert ".ignore" not in mock_walk.return_value[0][1]
             assert sorted(doc["key"]) == sorted(["one", "two", "three", "four"])
 
 
 @patch("homeassistant.util.yaml.loader.os.walk")
-def test_include_dir_merge_named(mock_walk):
+def test_include_dir_merge_named(mock_walk, try_both_loaders):
     """Test include dir merge named yaml."""
     mock_walk.return_value = [["/test", [], ["first.yaml", "second.yaml"]]]
 
@@ -220,12 +226,12 @@ def test_include_dir_merge_named(mock_walk):
     with patch_yaml_files(files):
         conf = "key: !include_dir_merge_named /test"
         with io.StringIO(conf) as file:
-            doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+            doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
             assert doc["key"] == {"key1": "one", "key2": "two", "key3": "three"}
 
 
 @patch("homeassistant.util.yaml.loader.os.walk")
-def test_include_dir_merge_named_recursive(mock_walk):
+def test_include_dir_merge_named_recursive(mock_walk, try_both_loaders):
     """Test include dir merge named yaml."""
     mock_walk.return_value = [
         ["/test", ["tmp2", ".ignore", "ignore"], ["first.yaml"]],
@@ -245,7 +251,7 @@ def test_include_dir_merge_named_recursive(mock_walk):
             assert (
                 ".ignore" in mock_walk.return_value[0][1]
             ), "Expecting .ignore in here"
-            doc = yaml_loader.yaml.load(file, Loader=yaml_loader.SafeLineLoader)
+            doc = yaml_loader.yaml.load(file, Loader=try_both_loaders)
             assert "tmp2" in mock_walk.return_value[0][1]
             assert ".ignore" not in mock_walk.return_value[0][1]
             assert doc["key"] == {
@@ -445,3 +451,95 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def test_load_yaml_cached(tmp_path):
+    """Test parsed files are cached until they or their includes change."""
+    config_file = tmp_path / "configuration.yaml"
+    included_dir = tmp_path / "included"
+    included_dir.mkdir()
+    included_file = included_dir / "first.yaml"
+    config_file.write_text("key: !include_dir_merge_named included\nsecret: !secret a")
+    included_file.write_text("first: 1")
+    (tmp_path / yaml.SECRET_YAML).write_text("a: one")
+    secrets = yaml.Secrets(tmp_path)
+
+    with patch.object(
+        yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+    ) as mock_parse:
+        doc = yaml.load_yaml(str(config_file), secrets)
+        assert doc == {"key": {"first": 1}, "secret": "one"}
+        # The configuration, the included file and the secrets
+        assert mock_parse.call_count == 3
+
+        # The result is a copy that can be changed
+        doc["key"]["first"] = 2
+        doc = yaml.load_yaml(str(config_file), secrets)
+        assert doc == {"key": {"first": 1}, "secret": "one"}
+        assert doc["key"].__line__ == 0
+        assert mock_parse.call_count == 3
+
+        # Changing an included file parses it and the file including it
+        included_file.write_text("first: 11")
+        os.utime(included_file, ns=(0, 0))
+        assert yaml.load_yaml(str(config_file), secrets)["key"] == {"first": 11}
+        assert mock_parse.call_count == 5
+
+        # Adding a file to an included directory
+        (included_dir / "second.yaml").write_text("second: 2")
+        os.utime(included_dir, ns=(0, 0))
+        assert yaml.load_yaml(str(config_file), secrets)["key"] == {
+            "first": 11,
+            "second": 2,
+        }
+        assert mock_parse.call_count == 7
+
+        # Changing the secrets
+        (tmp_path / yaml.SECRET_YAML).write_text("a: two")
+        os.utime(tmp_path / yaml.SECRET_YAML, ns=(0, 0))
+        assert yaml.load_yaml(str(config_file), yaml.Secrets(tmp_path))["secret"] == (
+            "two"
+        )
+        assert mock_parse.call_count == 9
+
+
+def test_load_yaml_env_var_not_cached(tmp_path):
+    """Test files using environment variables are parsed again when they change."""
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text("key: !env_var YAML_CACHE_TEST_VAR default")
+    secrets = yaml.Secrets(tmp_path)
+
+    assert yaml.load_yaml(str(config_file), secrets) == {"key": "default"}
+    with patch.dict(os.environ, {"YAML_CACHE_TEST_VAR": "value"}):
+        assert yaml.load_yaml(str(config_file), secrets) == {"key": "value"}
+    assert yaml.load_yaml(str(config_file), secrets) == {"key": "default"}
+
+
+def test_load_yaml_cache_limited(tmp_path):
+    """Test only configuration files are cached, up to the cache size."""
+    first_file = tmp_path / "first.yaml"
+    first_file.write_text("first: 1")
+    second_file = tmp_path / "second.yaml"
+    second_file.write_text("second: 2")
+    secrets = yaml.Secrets(tmp_path)
+
+    with patch.object(
+        yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+    ) as mock_parse, patch.object(yaml_loader, "PARSE_CACHE_SIZE", 1):
+        # Files loaded without secrets are not configuration
+        yaml.load_yaml(str(first_file))
+        yaml.load_yaml(str(first_file))
+        assert mock_parse.call_count == 2
+
+        yaml.load_yaml(str(first_file), secrets)
+        yaml.load_yaml(str(first_file), secrets)
+        assert mock_parse.call_count == 3
+
+        # The least recently used file is evicted
+        yaml.load_yaml(str(second_file), secrets)
+        yaml.load_yaml(str(first_file), secrets)
+        assert mock_parse.call_count == 5
+
+        yaml.clear_parse_cache()
+        yaml.load_yaml(str(first_file), secrets)
+        assert mock_parse.call_count == 6